@@ -0,0 +1,116 @@
+# benchmarks/bench_json_decode.py
+"""
+Micro-benchmark du décodage d'une grosse liste de dépenses.
+
+Génère une charge synthétique de 100 000 dépenses (même forme que /api/depenses/),
+puis mesure pour chaque décodeur installé (json, ujson, orjson) :
+- le temps de décodage du JSON brut ;
+- le temps de décompression + décodage pour gzip, deflate et brotli (si installé).
+
+Utilisation (depuis la racine du projet) :
+    python benchmarks/bench_json_decode.py [nombre_de_depenses] [repetitions]
+"""
+import gzip
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import zlib
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from services import json_codec  # noqa: E402
+
+STATUTS = ["en_attente", "validee", "rejettee"]
+TYPES = ["Fournitures", "Transport", "Maintenance", "Formation", "Mission", "Équipement"]
+
+
+def make_payload(count):
+    rng = random.Random(42)
+    depenses = []
+    for i in range(1, count + 1):
+        depenses.append({
+            "id": i,
+            "date": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "type_depense": rng.choice(TYPES),
+            "montant": round(rng.uniform(1000, 5000000), 2),
+            "statut_validation": rng.choice(STATUTS),
+            "ligne_budgetaire": rng.randint(1, 40),
+            "ligne_budgetaire_nom": f"Ligne {rng.randint(1, 40)}",
+            "description": "Dépense synthétique générée pour le benchmark",
+            "piece_justificative": None,
+            "cree_par": rng.randint(1, 10),
+        })
+    return json.dumps(depenses, ensure_ascii=False).encode("utf-8")
+
+
+def available_decoders():
+    decoders = {"json": json.loads}
+    try:
+        import ujson
+        decoders["ujson"] = ujson.loads
+    except ImportError:
+        pass
+    try:
+        import orjson
+        decoders["orjson"] = orjson.loads
+    except ImportError:
+        pass
+    return decoders
+
+
+def available_encodings(raw):
+    encodings = {
+        "identity": (raw, lambda data: data),
+        "gzip": (gzip.compress(raw), gzip.decompress),
+        "deflate": (zlib.compress(raw), zlib.decompress),
+    }
+    try:
+        import brotli
+        encodings["br"] = (brotli.compress(raw), brotli.decompress)
+    except ImportError:
+        pass
+    return encodings
+
+
+def timeit(fn, repeat):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    raw = make_payload(count)
+    print(f"Charge : {count} dépenses, {len(raw) / 1e6:.1f} Mo de JSON")
+    print(f"Décodeur utilisé par l'application : {json_codec.DECODER}")
+    print(f"Accept-Encoding envoyé : {json_codec.ACCEPT_ENCODING}")
+    print()
+
+    encodings = available_encodings(raw)
+    print("Taille transférée :")
+    for name, (payload, _) in encodings.items():
+        print(f"  {name:<9} {len(payload) / 1e6:8.2f} Mo")
+    print()
+
+    decoders = available_decoders()
+    header = "  " + "décodeur".ljust(10) + "".join(name.rjust(12) for name in encodings)
+    print("Temps médian décompression + décodage (ms) :")
+    print(header)
+    for decoder_name, loads in decoders.items():
+        cells = []
+        for payload, decompress in encodings.values():
+            duration = timeit(lambda: loads(decompress(payload)), repeat)
+            cells.append(f"{duration * 1000:12.1f}")
+        print("  " + decoder_name.ljust(10) + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# benchmarks/bench_startup_imports.py
+"""
+Benchmark du démarrage à froid : coût des imports jusqu'au formulaire de connexion.
+
+Lance un interpréteur neuf avec `python -X importtime` sur le module de
+démarrage (main par défaut, qui doit n'importer que LoginWidget et
+Code2FAWidget) et affiche :
+- le temps total d'import (médiane sur les répétitions) ;
+- la répartition par paquet de premier niveau (PyQt5, requests, matplotlib...) ;
+- les modules les plus coûteux (temps propre, hors sous-imports) ;
+- les paquets lourds chargés alors qu'ils ne devraient l'être qu'après la
+  connexion (matplotlib, openpyxl, écrans de modules/).
+
+Puis mesure le temps d'affichage de la fenêtre de connexion (QApplication +
+MainApp + show), plate-forme Qt « offscreen » si aucun affichage n'est défini.
+
+Utilisation (depuis la racine du projet) :
+    python benchmarks/bench_startup_imports.py [module] [repetitions]
+"""
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Chargés seulement après la connexion (premier affichage d'un écran)
+DEFERRED = ("matplotlib", "openpyxl", "modules", "ui.main_layout", "ui.dashboard_widget")
+
+SHOW_LOGIN = """
+import sys, time
+start = time.perf_counter()
+from PyQt5.QtWidgets import QApplication
+app = QApplication(sys.argv)
+import main
+window = main.MainApp()
+window.show()
+app.processEvents()
+print(time.perf_counter() - start)
+"""
+
+
+def run_python(args):
+    env = dict(os.environ)
+    if not env.get("DISPLAY") and sys.platform.startswith("linux"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return subprocess.run([sys.executable] + args, cwd=ROOT, env=env,
+                          capture_output=True, text=True, check=False)
+
+
+def parse_importtime(stderr):
+    """
+    Lignes « import time: self [us] | cumulative | imported package »
+    -> liste de (module, profondeur, self_us, cumulatif_us), dans l'ordre d'affichage.
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), depth, int(own), int(cumulative)))
+    return entries
+
+
+def import_profile(module):
+    result = run_python(["-X", "importtime", "-c", f"import {module}"])
+    if result.returncode != 0:
+        sys.exit(f"Échec de l'import de {module} :\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def main():
+    module = sys.argv[1] if len(sys.argv) > 1 else "main"
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    import_profile(module)  # Premier lancement : compilation des .pyc, non mesuré
+    profiles = [import_profile(module) for _ in range(repeat)]
+    totals = [sum(entry[2] for entry in entries) for entries in profiles]
+    entries = profiles[totals.index(sorted(totals)[len(totals) // 2])]  # Lancement médian
+
+    print(f"Import de « {module} » : {statistics.median(totals) / 1000:.1f} ms "
+          f"(médiane sur {repeat}, {len(entries)} modules)")
+    print()
+
+    by_package = defaultdict(int)
+    for name, _, own, _ in entries:
+        by_package[name.split(".")[0]] += own
+    print("Répartition par paquet (ms) :")
+    for package, own in sorted(by_package.items(), key=lambda item: -item[1])[:15]:
+        print(f"  {package:<28} {own / 1000:8.1f}")
+    print()
+
+    print("Modules les plus coûteux, temps propre (ms) :")
+    for name, _, own, cumulative in sorted(entries, key=lambda entry: -entry[2])[:15]:
+        print(f"  {name:<48} {own / 1000:8.1f}   (cumulé {cumulative / 1000:.1f})")
+    print()
+
+    loaded = sorted({name for name, _, _, _ in entries
+                     if any(name == prefix or name.startswith(prefix + ".") for prefix in DEFERRED)})
+    if loaded:
+        print("⚠️  Chargés avant la connexion alors qu'ils devraient être différés :")
+        for name in loaded:
+            print(f"  {name}")
+    else:
+        print("✅ Aucun écran ni matplotlib/openpyxl importé avant la connexion.")
+
+    if module == "main":
+        durations = []
+        for _ in range(repeat):
+            result = run_python(["-c", SHOW_LOGIN])
+            if result.returncode != 0:
+                print(f"\nAffichage de la connexion impossible :\n{result.stderr[-1000:]}")
+                return
+            durations.append(float(result.stdout.strip().splitlines()[-1]))
+        print()
+        print(f"Fenêtre de connexion affichée en {statistics.median(durations) * 1000:.1f} ms "
+              f"(médiane sur {repeat}, imports compris)")
+
+
+if __name__ == "__main__":
+    main()
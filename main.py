@@ -1,9 +1,9 @@
 # main.py
+from services import startup_timeline  # En premier : origine des temps du démarrage (si activé)
 import sys
-from PyQt5.QtWidgets import QApplication, QMainWindow, QStackedWidget
+from PyQt5.QtWidgets import QApplication, QMainWindow, QStackedWidget, QWidget
 from ui.login_widget import LoginWidget
 from ui.code2fa_widget import Code2FAWidget
-from ui.dashboard_widget import DashboardWidget
 
 class MainApp(QMainWindow):
     """
@@ -27,7 +27,9 @@ class MainApp(QMainWindow):
         # Initialisation des widgets (vues)
         self.login_widget = LoginWidget(self)
         self.code2fa_widget = Code2FAWidget(self)
-        self.dashboard_widget = DashboardWidget(self)
+        # Le tableau de bord (et tous les écrans) n'est importé et construit
+        # qu'après la connexion, par Code2FAWidget : emplacement vide d'ici là
+        self.dashboard_widget = QWidget()
 
         # Ajout des widgets dans la pile
         self.stack.addWidget(self.login_widget)        # index 0
@@ -36,6 +38,8 @@ class MainApp(QMainWindow):
 
         # Lancement sur la page de connexion
         self.stack.setCurrentIndex(0)
+        startup_timeline.mark("mainapp_constructed")
+        startup_timeline.mark_first_paint(self.login_widget, "login_shown")
 
     def navigate_to(self, index):
         """
@@ -45,6 +49,7 @@ class MainApp(QMainWindow):
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
+    startup_timeline.mark("qapplication_created")
     window = MainApp()
     window.show()
     sys.exit(app.exec_())
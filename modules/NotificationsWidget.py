@@ -6,6 +6,7 @@ from PyQt5.QtWidgets import (
     QSizePolicy, QStyle, QWidget, QSpacerItem
 )
 
+from services.async_service import run_async
 from services.notification_service import mark_as_read, get_notifications
 
 
@@ -116,6 +117,7 @@ class NotificationsWidget(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Centre de Notifications")
         self.setMinimumSize(450, 600)
+        self._load_task = None
         self.setup_ui()
         self.setup_styles()
 
@@ -214,6 +216,9 @@ class NotificationsWidget(QDialog):
         self.refresh_btn.setIcon(QIcon.fromTheme("view-refresh"))
         footer_layout.addWidget(self.refresh_btn)
 
+        self.mark_all_read_btn.clicked.connect(self.mark_all_as_read)
+        self.refresh_btn.clicked.connect(self.load_notifications)
+
         main_layout.addWidget(footer)
 
     def setup_styles(self):
@@ -250,14 +255,18 @@ class NotificationsWidget(QDialog):
 
     def load_notifications(self):
         """Charger et afficher les notifications"""
-        self.list_widget.clear()
+        if self._load_task is not None:
+            self._load_task.cancel()
         self.status_label.setText("Chargement des notifications...")
+        self.refresh_btn.setEnabled(False)
 
-        # Remplacer le timer simulé par un appel direct
-        self._finish_loading()
+        # Appel en arrière-plan, le résultat arrive dans _finish_loading
+        self._load_task = run_async(get_notifications, on_result=self._finish_loading, owner=self)
 
-    def _finish_loading(self):
-        result = get_notifications()
+    def _finish_loading(self, result):
+        self._load_task = None
+        self.refresh_btn.setEnabled(True)
+        self.list_widget.clear()
         if result["success"]:
             notifications = result["data"]
 
@@ -285,12 +294,6 @@ class NotificationsWidget(QDialog):
                         lambda checked, n=notif: self._handle_mark_as_read(n)
                     )
 
-            # Connecter le bouton "Tout marquer comme lu" une seule fois
-            if not hasattr(self, '_mark_all_connected'):
-                self.mark_all_read_btn.clicked.connect(self.mark_all_as_read)
-                self.refresh_btn.clicked.connect(self.load_notifications)
-                self._mark_all_connected = True
-
         else:
             self.status_label.setText("Erreur de chargement")
             QMessageBox.critical(self, "Erreur", result["message"])
@@ -1,9 +1,21 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
                              QTableWidgetItem, QHeaderView, QMessageBox, QLineEdit, QComboBox,
                              QGraphicsDropShadowEffect)
-from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QDate
+from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QDate, QTimer
 from PyQt5.QtGui import QColor, QFont, QBrush
-from services.commande_service import get_commandes, delete_commande, valider_commande
+from services.async_service import run_async
+from services.commande_service import (get_commandes, delete_commande, valider_commande, delete_commandes,
+                                       valider_commandes)
+from services.local_store import local_store
+from services.metrics import timed
+from services.sorting import Sorter, TEXT, NUMBER
+from services.filter_engine import FilterEngine, DEBOUNCE_MS
+from services.search_index import SearchIndex
+from ui.remote_page_list import RemotePageList
+from ui.action_buttons_delegate import ActionButtonsDelegate
+from ui.bulk_actions import BulkActionBar
+from ui.sort_header import SortHeader
+from ui.optimistic import OptimisticActions
 from ui.modules.commande_form_dialog import CommandeFormDialog
 from ui.modules.fournisseurs_widget import FournisseursWidget
 from services.auth_service import AuthService
@@ -11,15 +23,64 @@ import datetime
 import math
 
 
+def commande_search_fields(commande):
+    """Valeurs trouvables par la barre de recherche."""
+    # Gestion du fournisseur (peut être un ID ou un objet)
+    fournisseur_nom = ""
+    if isinstance(commande.get("fournisseur"), dict):
+        fournisseur_nom = commande["fournisseur"].get("nom", "")
+    elif isinstance(commande.get("fournisseur"), int):
+        fournisseur_nom = str(commande["fournisseur"])  # Version simple
+
+    # Gestion de la dépense
+    depense_text = ""
+    if isinstance(commande.get("depense"), dict):
+        depense = commande["depense"]
+        depense_text = f"{depense.get('type_depense', '')} {depense.get('montant', '')} {depense.get('date', '')}"
+    elif commande.get("depense"):
+        depense_text = str(commande["depense"])
+
+    return (commande["reference"], commande["designation"], commande.get("ligne_budgetaire", ""),
+            commande.get("total", ""), commande["statut"], fournisseur_nom, depense_text)
+
+
+def commande_ligne(commande):
+    ligne = commande.get("ligne_budgetaire")
+    return ligne.get("article", "") if isinstance(ligne, dict) else ligne
+
+
+def commande_fournisseur(commande):
+    fournisseur = commande.get("fournisseur")
+    return fournisseur.get("nom", "") if isinstance(fournisseur, dict) else fournisseur
+
+
 class CommandesWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.user_role = AuthService.get_user_role()
         self.commandes = []
+        self.search_index = SearchIndex(commande_search_fields)
+        self.filter_engine = FilterEngine(self.search_index, {"statut": lambda c: c["statut"]})
+        self.sorter = Sorter({
+            "reference": (lambda c: c["reference"], TEXT),
+            "designation": (lambda c: c["designation"], TEXT),
+            "ligne": (commande_ligne, TEXT),
+            "montant": (lambda c: c.get("total"), NUMBER),
+            "statut": (lambda c: c["statut"], TEXT),
+            "fournisseur": (commande_fournisseur, TEXT),
+        })
         self.filtered_commandes = []
         self.current_page = 1
         self.items_per_page = 10
+        self._load_task = None
+        self._full_loaded = False
+        self.remote_commandes = RemotePageList(get_commandes, self.items_per_page, parent=self)
+        self.remote_commandes.page_loaded.connect(self.on_commandes_page_loaded)
+        self.remote_commandes.load_failed.connect(self.on_commandes_page_failed)
+        # Validations et suppressions appliquées sans attendre le serveur
+        self.optimistic = OptimisticActions(self, self.load_commandes)
         self.setup_ui()
+        self.show_cached_commandes()
         self.load_commandes()
         self.setup_animations()
 
@@ -144,7 +205,12 @@ class CommandesWidget(QWidget):
                 background-color: white;
             }
         """)
-        self.search_input.textChanged.connect(self.apply_filters)
+        # Frappes rapides regroupées : le filtre n'est appliqué qu'après une pause
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.apply_filters)
+        self.search_input.textChanged.connect(lambda _: self.search_timer.start())
         filter_bar.addWidget(QLabel("Recherche:"))
         filter_bar.addWidget(self.search_input)
 
@@ -211,6 +277,15 @@ class CommandesWidget(QWidget):
         self.table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         self.table.setShowGrid(False)
+        self.table.setItemDelegateForColumn(7, ActionButtonsDelegate(
+            self.get_actions, self.table, 7, min_width=50, spacing=4, alignment=Qt.AlignCenter))
+
+        # Tri sur toute la collection filtrée (clic sur l'en-tête)
+        self.sort_header = SortHeader(
+            self.table,
+            {0: "reference", 1: "designation", 2: "ligne", 3: "montant", 4: "statut", 5: "fournisseur"},
+            self)
+        self.sort_header.changed.connect(self.apply_filters)
 
         # Ajouter un effet d'ombre
         shadow = QGraphicsDropShadowEffect()
@@ -219,6 +294,15 @@ class CommandesWidget(QWidget):
         shadow.setOffset(0, 3)
         self.table.setGraphicsEffect(shadow)
 
+        # Actions groupées sur les lignes sélectionnées (comptable)
+        self.bulk_bar = BulkActionBar(self.table, 7, self.load_commandes, self)
+        if self.user_role == "comptable":
+            self.bulk_bar.add_action("✓ Valider la sélection", "#27ae60", self.valider_selection,
+                                     "Valider les commandes sélectionnées en attente")
+            self.bulk_bar.add_action("✕ Supprimer la sélection", "#e74c3c", self.supprimer_selection,
+                                     "Supprimer les commandes sélectionnées en attente")
+        layout.addWidget(self.bulk_bar)
+
         layout.addWidget(self.table)
 
         # Pagination
@@ -298,8 +382,8 @@ class CommandesWidget(QWidget):
         status_bar.addStretch()
 
         # Bouton de rafraîchissement
-        refresh_btn = QPushButton("🔄 Rafraîchir")
-        refresh_btn.setStyleSheet("""
+        self.refresh_btn = QPushButton("🔄 Rafraîchir")
+        self.refresh_btn.setStyleSheet("""
             QPushButton {
                 background-color: #ecf0f1;
                 color: #2c3e50;
@@ -311,66 +395,111 @@ class CommandesWidget(QWidget):
                 background-color: #d5dbdb;
             }
         """)
-        refresh_btn.setCursor(Qt.PointingHandCursor)
-        refresh_btn.clicked.connect(self.refresh_data)
-        status_bar.addWidget(refresh_btn)
+        self.refresh_btn.setCursor(Qt.PointingHandCursor)
+        self.refresh_btn.clicked.connect(self.refresh_data)
+        status_bar.addWidget(self.refresh_btn)
 
         layout.addLayout(status_bar)
 
+    def show_cached_commandes(self):
+        # Affichage immédiat de la dernière version connue, revalidée ensuite par load_commandes
+        cached = local_store.load("commandes")
+        if cached:
+            self.commandes = cached
+            self.search_index.set_records(cached)
+            self.apply_filters()
+            self.update_label.setText("Données en cache - actualisation en cours...")
+
     def load_commandes(self):
-        result = get_commandes()
+        # Sans filtre actif, seule la page affichée (et la suivante) est demandée au
+        # serveur ; la collection complète n'est chargée que pour filtrer localement.
+        if self._load_task is not None:
+            self._load_task.cancel()
+            self._load_task = None
+        self.set_loading(True)
+        if self.filters_active():
+            self.load_all_commandes()
+        else:
+            self._full_loaded = False
+            self.remote_commandes.reset()
+            self.remote_commandes.ensure_page(self.current_page)
+
+    def load_all_commandes(self):
+        self._load_task = run_async(get_commandes, on_result=self.on_commandes_loaded, owner=self)
+
+    def on_commandes_page_loaded(self, page):
+        # Une page du serveur est arrivée : redessiner si c'est celle affichée
+        if self.filters_active() or page != self.current_page:
+            return
+        self.filtered_commandes = self.remote_commandes
+        self.set_loading(False)
+        self.update_table()
+        self.update_pagination()
+        self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
+
+    def on_commandes_page_failed(self, message):
+        self.set_loading(False)
+        self.show_error_message("Erreur", message)
+
+    def on_commandes_loaded(self, result):
+        self._load_task = None
+        self.set_loading(False)
         if result["success"]:
-            self.commandes = result["data"]
-            self.filtered_commandes = self.commandes
-            self.apply_filters()
+            self._full_loaded = True
+            if result["data"] != self.commandes:
+                self.patch_commandes(result["data"])
+            self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
         else:
             self.show_error_message("Erreur", result["message"])
 
+    def patch_commandes(self, commandes):
+        """Remplace les données affichées en conservant la page courante."""
+        self.commandes = commandes
+        self.search_index.set_records(commandes)
+        self.show_filtered()
+
+    def show_filtered(self):
+        """Réapplique les filtres en conservant la page courante."""
+        page = self.current_page
+        self.apply_filters()
+        total_pages = math.ceil(len(self.filtered_commandes) / self.items_per_page) or 1
+        if min(page, total_pages) != self.current_page:
+            self.go_to_page(min(page, total_pages))
+
+    def set_loading(self, loading):
+        self.refresh_btn.setEnabled(not loading)
+        if loading:
+            self.results_label.setText("⏳ Chargement des commandes...")
+        else:
+            self.results_label.setText(f"{len(self.filtered_commandes)} commande(s) trouvée(s)")
+
+    def filters_active(self):
+        # Filtre ou tri : traitement local sur toute la collection
+        return (self.status_filter.currentData() != "tous" or bool(self.search_input.text())
+                or self.sort_header.is_active())
+
     def apply_filters(self):
+        if not self.filters_active() and self.remote_commandes.is_ready():
+            # Aucun filtre : pagination côté serveur
+            self.filtered_commandes = self.remote_commandes
+            self.current_page = 1
+            self.update_table()
+            self.update_pagination()
+            self.results_label.setText(f"{len(self.filtered_commandes)} commande(s) trouvée(s)")
+            return
+        if self.filters_active() and not self._full_loaded and self._load_task is None:
+            # Le filtrage local porte sur toute la collection
+            self.set_loading(True)
+            self.load_all_commandes()
+
         # Récupérer les valeurs des filtres
         status_filter = self.status_filter.currentData()
-        search_text = self.search_input.text().lower()
 
-        # Filtrer les commandes
-        self.filtered_commandes = []
-        for commande in self.commandes:
-            # Filtre par statut
-            if status_filter != "tous" and commande["statut"] != status_filter:
-                continue
-
-            # Gestion du fournisseur (peut être un ID ou un objet)
-            fournisseur_nom = ""
-            if isinstance(commande.get("fournisseur"), dict):
-                fournisseur_nom = commande["fournisseur"].get("nom", "")
-            elif isinstance(commande.get("fournisseur"), int):
-                # Si c'est un ID, on peut soit :
-                # 1. Faire un appel API pour récupérer le nom
-                # 2. Utiliser un mapping préchargé
-                fournisseur_nom = str(commande["fournisseur"])  # Version simple
-
-            # Gestion de la dépense
-            depense_text = ""
-            if isinstance(commande.get("depense"), dict):
-                depense = commande["depense"]
-                depense_text = f"{depense.get('type_depense', '')} {depense.get('montant', '')} {depense.get('date', '')}"
-            elif commande.get("depense"):
-                depense_text = str(commande["depense"])
-
-            # Texte concaténé pour la recherche
-            searchable_text = (
-                    commande["reference"].lower() +
-                    commande["designation"].lower() +
-                    str(commande.get("ligne_budgetaire", "")).lower() +
-                    str(commande.get("total", "")).lower() +
-                    commande["statut"].lower() +
-                    fournisseur_nom.lower() +
-                    depense_text.lower()
-            )
-
-            if search_text and search_text not in searchable_text:
-                continue
-
-            self.filtered_commandes.append(commande)
+        # Filtrer les commandes (affinage du résultat précédent si possible)
+        self.filtered_commandes = self.filter_engine.filter(
+            self.search_input.text(),
+            statut=None if status_filter == "tous" else status_filter)
+        self.filtered_commandes = self.sorter.sort(self.filtered_commandes, self.sort_header.order)
 
         self.current_page = 1
         self.update_table()
@@ -378,10 +507,12 @@ class CommandesWidget(QWidget):
         self.results_label.setText(f"{len(self.filtered_commandes)} commande(s) trouvée(s)")
     def change_items_per_page(self, text):
         self.items_per_page = int(text)
+        self.remote_commandes.reset(self.items_per_page)
         self.current_page = 1  # Reset to first page when items per page changes
         self.update_table()
         self.update_pagination()
 
+    @timed("commandes.update_table")
     def update_table(self):
         start_index = (self.current_page - 1) * self.items_per_page
         end_index = start_index + self.items_per_page
@@ -433,8 +564,10 @@ class CommandesWidget(QWidget):
 
 
 
-            # ✅ Actions
-            self.table.setCellWidget(i, 7, self.create_action_widget(cmd))
+            # ✅ Actions (boutons dessinés par le délégué)
+            action_item = QTableWidgetItem()
+            action_item.setData(Qt.UserRole, cmd)
+            self.table.setItem(i, 7, action_item)
 
             # Alternance couleur
             for j in range(self.table.columnCount()):
@@ -516,6 +649,7 @@ class CommandesWidget(QWidget):
 
     def go_to_page(self, page):
         self.current_page = page
+        self.table.clearSelection()  # Les lignes de la nouvelle page sont d'autres commandes
         self.update_table()
         self.update_pagination()
 
@@ -528,101 +662,22 @@ class CommandesWidget(QWidget):
         if self.current_page < total_pages:
             self.go_to_page(self.current_page + 1)
 
-    def create_action_widget(self, cmd):
-        action_widget = QWidget()
-        action_layout = QHBoxLayout(action_widget)
-        action_layout.setContentsMargins(3, 3, 3, 3)  # Marges légèrement augmentées
-        action_layout.setSpacing(4)  # Espacement un peu plus large
-        action_layout.setAlignment(Qt.AlignCenter)
-
-        # Style commun avec taille équilibrée
-        button_style = """
-            QPushButton {
-                padding: 3px 5px;
-                border-radius: 3px;
-                font-size: 11px;
-                min-width: 50px;
-                max-width: 50px;
-                min-height: 22px;
-                border: none;
-                margin: 0;
-            }
+    def get_actions(self, cmd):
         """
-
-        if self.user_role == "comptable":
-            if cmd["statut"] == "en_attente":
-                # Bouton Modifier (taille équilibrée)
-                modifier_btn = QPushButton("✏")
-                modifier_btn.setStyleSheet(button_style + """
-                    QPushButton {
-                        background-color: #f39c12;
-                        color: white;
-                    }
-                    QPushButton:hover {
-                        background-color: #f1c40f;
-                    }
-                """)
-                modifier_btn.setToolTip("Modifier cette commande")
-                modifier_btn.clicked.connect(lambda _, id=cmd["id"]: self.modifier_commande(id))
-                action_layout.addWidget(modifier_btn)
-
-                # Bouton Valider (taille équilibrée)
-                valider_btn = QPushButton("✓")
-                valider_btn.setStyleSheet(button_style + """
-                    QPushButton {
-                        background-color: #27ae60;
-                        color: white;
-                    }
-                    QPushButton:hover {
-                        background-color: #2ecc71;
-                    }
-                """)
-                valider_btn.setToolTip("Valider cette commande")
-                valider_btn.clicked.connect(lambda _, id=cmd["id"]: self.valider_commande(id))
-                action_layout.addWidget(valider_btn)
-
-                # Bouton Supprimer (taille équilibrée)
-                supprimer_btn = QPushButton("✕")
-                supprimer_btn.setStyleSheet(button_style + """
-                    QPushButton {
-                        background-color: #e74c3c;
-                        color: white;
-                    }
-                    QPushButton:hover {
-                        background-color: #c0392b;
-                    }
-                """)
-                supprimer_btn.setToolTip("Supprimer cette commande")
-                supprimer_btn.clicked.connect(lambda _, id=cmd["id"]: self.supprimer_commande(id))
-                action_layout.addWidget(supprimer_btn)
-
-            elif cmd["statut"] == "validee":
-                status_label = QLabel("✓")
-                status_label.setStyleSheet("""
-                    QLabel {
-                        color: #27ae60;
-                        font-weight: bold;
-                        font-size: 12px;
-                        padding: 0 5px;
-                        qproperty-alignment: AlignCenter;
-                    }
-                """)
-                action_layout.addWidget(status_label)
-        else:
-            status_label = QLabel("🔒")
-            status_label.setStyleSheet("""
-                QLabel {
-                    color: #7f8c8d;
-                    font-size: 12px;
-                    padding: 0 5px;
-                    qproperty-alignment: AlignCenter;
-                }
-            """)
-            action_layout.addWidget(status_label)
-
-        # Ajustement de la taille avec espacement modéré
-        action_widget.setFixedWidth(170)  # 3 boutons x 50px + 2 espacements x 4px + marges
-        return action_widget
+        Boutons compacts de la colonne « Actions » (dessinés par ActionButtonsDelegate) :
+        (liste de (libellé, couleur, callback, infobulle), texte, couleur du texte).
+        """
+        if self.user_role != "comptable":
+            return [], "🔒", "#7f8c8d"
+        if cmd["statut"] == "en_attente":
+            return [
+                ("✏", "#f39c12", lambda: self.modifier_commande(cmd["id"]), "Modifier cette commande"),
+                ("✓", "#27ae60", lambda: self.valider_commande(cmd), "Valider cette commande"),
+                ("✕", "#e74c3c", lambda: self.supprimer_commande(cmd), "Supprimer cette commande"),
+            ], "", None
+        if cmd["statut"] == "validee":
+            return [], "✓", "#27ae60"
+        return [], "", None
 
     def open_form(self):
         dialog = CommandeFormDialog(self)
@@ -646,33 +701,91 @@ class CommandesWidget(QWidget):
         # Rafraîchir au cas où des modifications de fournisseurs affecteraient les commandes
         self.refresh_data()
 
-    def valider_commande(self, commande_id):
+    def run_optimistic(self, commande, updated, fn, *args, done_message=None):
+        """
+        Applique `updated` (None : suppression) à l'écran sans attendre le
+        serveur ; l'état est rétabli, avec un toast d'erreur, si fn(*args) échoue.
+        """
+        positions = []  # Positions de la commande retirée, pour la rétablir à sa place
+        if updated is None:
+            rollback = lambda: self.restore_commande(commande, *positions)
+        else:
+            rollback = lambda: self.replace_commande(updated, commande)
+        self.optimistic.run(fn, *args, done_message=done_message, rollback=rollback,
+                            apply=lambda: positions.extend(self.replace_commande(commande, updated)))
+
+    def replace_commande(self, old, new):
+        """
+        Remplace (new=None : retire) une commande dans toutes les données affichées.
+        Renvoie ses positions (collection complète, pages du serveur), ou None.
+        """
+        remote_rank = self.remote_commandes.replace(old, new)
+        rank = self.search_index.rank_of(old["id"])
+        if rank is not None and rank < len(self.commandes) and self.commandes[rank] is old:
+            # Index mis à jour pour ce seul élément (les listes reçues sont partagées : copie)
+            if new is None:
+                self.commandes = self.commandes[:rank] + self.commandes[rank + 1:]
+                self.search_index.remove(old["id"])
+            else:
+                self.commandes = self.commandes[:rank] + [new] + self.commandes[rank + 1:]
+                self.search_index.upsert(new)
+        else:
+            rank = None
+        self.show_replaced()
+        return rank, remote_rank
+
+    def restore_commande(self, commande, rank, remote_rank):
+        """Annulation d'une suppression : la commande revient à ses positions d'origine."""
+        if remote_rank is not None:
+            self.remote_commandes.insert(remote_rank, commande)
+        if rank is not None and commande["id"] not in self.search_index:
+            self.commandes = self.commandes[:rank] + [commande] + self.commandes[rank:]
+            self.search_index.upsert(commande, rank)
+        self.show_replaced()
+
+    def show_replaced(self):
+        # Page affichée redessinée après une modification locale
+        if self.filtered_commandes is self.remote_commandes:
+            self.update_table()
+            self.update_pagination()
+            self.results_label.setText(f"{len(self.filtered_commandes)} commande(s) trouvée(s)")
+        else:
+            self.show_filtered()
+
+    def valider_commande(self, commande):
         confirm = self.show_confirmation_dialog(
             "Validation de commande",
             "Voulez-vous valider cette commande ?",
             "Une fois validée, la commande ne pourra plus être modifiée."
         )
         if confirm == QMessageBox.Yes:
-            result = valider_commande(commande_id, "validee")
-            if result["success"]:
-                self.show_success_message("Succès", "La commande a été validée avec succès!")
-                self.refresh_data()
-            else:
-                self.show_error_message("Erreur", result["message"])
+            # Validée immédiatement à l'écran, rétablie si le serveur refuse
+            self.run_optimistic(commande, dict(commande, statut="validee"),
+                                valider_commande, commande["id"], "validee",
+                                done_message="Commande validée.")
 
-    def supprimer_commande(self, commande_id):
+    def supprimer_commande(self, commande):
         confirm = self.show_confirmation_dialog(
             "Confirmation de suppression",
             "Voulez-vous vraiment supprimer cette commande ?",
             "Cette action est irréversible."
         )
         if confirm == QMessageBox.Yes:
-            result = delete_commande(commande_id)
-            if result["success"]:
-                self.show_success_message("Succès", "La commande a été supprimée avec succès!")
-                self.refresh_data()
-            else:
-                self.show_error_message("Erreur", result["message"])
+            self.run_optimistic(commande, None, delete_commande, commande["id"],
+                                done_message="Commande supprimée.")
+
+    def valider_selection(self):
+        commandes = [commande for commande in self.bulk_bar.selected_records() if commande["statut"] == "en_attente"]
+        self.bulk_bar.run("Validation groupée",
+                          "Voulez-vous valider les commandes sélectionnées ?\n"
+                          "Une fois validées, elles ne pourront plus être modifiées.",
+                          valider_commandes, commandes, "validee")
+
+    def supprimer_selection(self):
+        commandes = [commande for commande in self.bulk_bar.selected_records() if commande["statut"] == "en_attente"]
+        self.bulk_bar.run("Suppression groupée",
+                          "Voulez-vous vraiment supprimer les commandes sélectionnées ?\nCette action est irréversible.",
+                          delete_commandes, commandes)
 
     def setup_animations(self):
         # Animation d'apparition du tableau
@@ -685,7 +798,6 @@ class CommandesWidget(QWidget):
 
     def refresh_data(self):
         self.load_commandes()
-        self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
 
         # Animation de rafraîchissement
         anim = QPropertyAnimation(self.table, b"windowOpacity")
@@ -5,14 +5,13 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtGui import QPixmap, QFont, QColor, QPainter, QLinearGradient, QBrush, QPen
 from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QTimer, QSize, QRect, QPoint, pyqtProperty, \
     QParallelAnimationGroup
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.cm as cm
+from services.async_service import run_async
 from services.auth_service import AuthService
+from services import startup_timeline
 from services.budget_service import get_budgets
 from services.depense_service import get_depenses
 from services.recette_service import get_recettes
+from ui.modules.dashboard_charts import ResponsiveBarChart, ResponsiveDonutChart
 import datetime
 import random
 
@@ -166,160 +165,6 @@ class PulsatingIconLabel(QLabel):
         self.animation.start()
 
 
-class ResponsiveBarChart(FigureCanvas):
-    def __init__(self, data, labels, colors, title="", parent=None):
-        self.fig = Figure(figsize=(5, 3), dpi=100)
-        self.fig.patch.set_facecolor('none')
-        self.axes = self.fig.add_subplot(111)
-        super().__init__(self.fig)
-
-        self.setStyleSheet("background-color: transparent;")
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-
-        self.data = data
-        self.labels = labels
-        self.colors = colors
-        self.title = title
-
-        # Animation timer
-        self.timer = QTimer(self)
-        self.current_heights = [0] * len(data)
-        self.animation_steps = 20
-        self.current_step = 0
-        self.timer.timeout.connect(self.updateChart)
-
-        self.plot()
-
-    def plot(self):
-        self.axes.clear()
-        bars = self.axes.bar(self.labels, self.current_heights, color=self.colors)
-
-        self.axes.set_title(self.title, fontsize=11, pad=10, fontweight='bold')
-        self.axes.tick_params(axis='x', rotation=45, labelsize=9)
-        self.axes.tick_params(axis='y', labelsize=9)
-        self.axes.spines['top'].set_visible(False)
-        self.axes.spines['right'].set_visible(False)
-        self.axes.spines['left'].set_alpha(0.3)
-        self.axes.spines['bottom'].set_alpha(0.3)
-
-        self.axes.set_ylim(0, max(self.data) * 1.2)
-
-        # Format y-axis as money
-        self.axes.yaxis.set_major_formatter(
-            plt.FuncFormatter(lambda x, _: f'{x:,.0f}'.replace(',', ' ')))
-
-        self.fig.tight_layout()
-        self.draw()
-
-    def startAnimation(self):
-        self.current_step = 0
-        self.timer.start(50)  # 50ms par frame
-
-    def updateChart(self):
-        self.current_step += 1
-        progress = min(1.0, self.current_step / self.animation_steps)
-
-        # Fonction d'assouplissement
-        progress = self.easeOutCubic(progress)
-
-        for i in range(len(self.data)):
-            self.current_heights[i] = self.data[i] * progress
-
-        self.plot()
-
-        if self.current_step >= self.animation_steps:
-            self.timer.stop()
-
-    @staticmethod
-    def easeOutCubic(x):
-        return 1 - pow(1 - x, 3)
-
-
-class ResponsiveDonutChart(FigureCanvas):
-    def __init__(self, values, labels, colors, title="", parent=None):
-        self.fig = Figure(figsize=(4, 3), dpi=100)
-        self.fig.patch.set_facecolor('none')
-        self.axes = self.fig.add_subplot(111)
-        super().__init__(self.fig)
-
-        self.setStyleSheet("background-color: transparent;")
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-
-        self.values = values
-        self.labels = labels
-        self.colors = colors
-        self.title = title
-
-        # Animation
-        self.timer = QTimer(self)
-        self.current_values = [0] * len(values)
-        self.animation_steps = 20
-        self.current_step = 0
-        self.timer.timeout.connect(self.updateChart)
-
-        self.plot()
-
-    def plot(self):
-        self.axes.clear()
-
-        if sum(self.current_values) > 0:
-            wedges, texts, autotexts = self.axes.pie(
-                self.current_values,
-                labels=self.labels,
-                colors=self.colors,
-                autopct=lambda pct: f'{pct:.1f}%' if pct > 5 else '',
-                shadow=False,
-                startangle=90,
-                wedgeprops={'linewidth': 1, 'edgecolor': 'white'},
-                textprops={'fontsize': 9},
-            )
-
-            # Donut hole
-            circle = plt.Circle((0, 0), 0.7, fc='white')
-            self.axes.add_artist(circle)
-
-            # Format autotexts
-            for autotext in autotexts:
-                autotext.set_fontsize(8)
-                autotext.set_fontweight('bold')
-
-            # Titre central
-            self.axes.text(0, 0, self.title,
-                           ha='center', va='center',
-                           fontsize=10, fontweight='bold')
-        else:
-            self.axes.text(0, 0, "Aucune donnée\ndisponible",
-                           ha='center', va='center',
-                           fontsize=10, color='gray')
-            self.axes.axis('off')
-
-        self.fig.tight_layout()
-        self.draw()
-
-    def startAnimation(self):
-        self.current_step = 0
-        self.timer.start(50)
-
-    def updateChart(self):
-        self.current_step += 1
-        progress = min(1.0, self.current_step / self.animation_steps)
-
-        # Fonction d'assouplissement
-        progress = self.easeOutCubic(progress)
-
-        for i in range(len(self.values)):
-            self.current_values[i] = self.values[i] * progress
-
-        self.plot()
-
-        if self.current_step >= self.animation_steps:
-            self.timer.stop()
-
-    @staticmethod
-    def easeOutCubic(x):
-        return 1 - pow(1 - x, 3)
-
-
 class InfoBadge(QFrame):
     def __init__(self, text, color="#1E88E5", parent=None):
         super().__init__(parent)
@@ -370,13 +215,14 @@ class DashboardGlobalWidget(QWidget):
 
         # Widgets pour les animations
         self.animated_widgets = []
+        self.started_animations = set()
+        self.budgets_displayed = False
+        self.pending_depenses = None  # Dépenses reçues avant les budgets
 
         self.init_ui()
+        startup_timeline.mark_first_paint(self, "dashboard_painted")
         self.load_data()
 
-        # Démarrer les animations avec un léger décalage
-        QTimer.singleShot(100, self.start_animations)
-
     def init_ui(self):
         # Conteneur principal avec défilement
         scroll_area = QScrollArea()
@@ -579,8 +425,26 @@ class DashboardGlobalWidget(QWidget):
         main_layout.addStretch()
 
     def load_data(self):
-        # Appeler uniquement la route des budgets (car le backend retourne déjà les bons calculs)
-        result = get_budgets()
+        # Indicateur de chargement le temps que l'API réponde
+        self.loading_label = QLabel("⏳ Chargement des données...")
+        self.loading_label.setAlignment(Qt.AlignCenter)
+        self.loading_label.setStyleSheet("color: #777; font-style: italic;")
+        self.graph_layout.addWidget(self.loading_label)
+
+        # Budgets (le backend retourne déjà les bons calculs) et dépenses sont demandés
+        # en parallèle : l'attente est celle de la requête la plus lente
+        run_async(get_budgets, on_result=self.on_budgets_loaded, owner=self)
+        run_async(get_depenses, on_result=self.on_depenses_loaded, owner=self)
+
+    def clear_loading_label(self):
+        if self.loading_label is not None:
+            self.graph_layout.removeWidget(self.loading_label)
+            self.loading_label.deleteLater()
+            self.loading_label = None
+
+    def on_budgets_loaded(self, result):
+        startup_timeline.mark("dashboard_data_loaded")
+        self.clear_loading_label()
         if not result["success"]:
             # Gérer l'erreur si besoin
             placeholder = QLabel("Erreur lors du chargement des données")
@@ -622,11 +486,22 @@ class DashboardGlobalWidget(QWidget):
 
         # === Graphique donut : Dépenses VS Solde
         self.create_budget_chart(montant_total_depenses, montant_disponible)
+        QTimer.singleShot(100, self.start_animations)
 
-        # === Graphique de répartition des dépenses (nécessite quand même un appel à get_depenses)
-        depenses_result = get_depenses()
+        # === Graphique de répartition des dépenses, affiché sous le donut
+        self.budgets_displayed = True
+        if self.pending_depenses is not None:
+            self.on_depenses_loaded(self.pending_depenses)
+            self.pending_depenses = None
+
+    def on_depenses_loaded(self, depenses_result):
+        if not self.budgets_displayed:
+            # Les budgets ne sont pas encore affichés : conserver le résultat
+            self.pending_depenses = depenses_result
+            return
         if depenses_result["success"]:
             self.create_expense_distribution(depenses_result["data"])
+            QTimer.singleShot(100, self.start_animations)
         else:
             placeholder = QLabel("Impossible de charger les dépenses")
             placeholder.setAlignment(Qt.AlignCenter)
@@ -701,6 +576,9 @@ class DashboardGlobalWidget(QWidget):
         """Démarre les animations avec un léger décalage entre elles"""
         delay = 0
         for widget in self.animated_widgets:
-            if isinstance(widget, ResponsiveBarChart) or isinstance(widget, ResponsiveDonutChart):
+            if widget in self.started_animations:
+                continue  # Graphique déjà animé lors d'un chargement précédent
+            if isinstance(widget, (ResponsiveBarChart, ResponsiveDonutChart)):
+                self.started_animations.add(widget)
                 QTimer.singleShot(delay, widget.startAnimation)
                 delay += 300  # 300ms entre chaque animation
\ No newline at end of file
@@ -1,29 +1,126 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QPushButton, QTableWidget,
-                             QTableWidgetItem, QHeaderView, QMessageBox, QHBoxLayout,
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QPushButton, QTableView,
+                             QHeaderView, QMessageBox, QHBoxLayout,
                              QLineEdit, QComboBox, QGraphicsDropShadowEffect, QToolTip, QDialog, QTextEdit,
                              QDialogButtonBox)
-from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QSortFilterProxyModel, QDate, pyqtSlot
+from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QSortFilterProxyModel, QDate, pyqtSlot, QTimer
 from PyQt5.QtGui import QColor, QBrush, QFont, QIcon, QPalette
 
+from services.async_service import run_async
 from services.auth_service import AuthService
-from services.depense_service import (get_depenses, create_depense, superviser_depense,
-                                      valider_depense, update_depense, delete_depense)
-
+from services.depense_service import (get_depenses, forget_depenses_page, create_depense, superviser_depense,
+                                      valider_depense, update_depense, delete_depense, superviser_depenses,
+                                      valider_depenses, delete_depenses)
+from services.local_store import local_store
+from services.metrics import timed
+from services.date_index import DateIndex
+from services.filter_engine import FilterEngine, DEBOUNCE_MS
+from services.search_index import SearchIndex
+from services.sorting import Sorter, TEXT, NUMBER, DATE
+
+from ui.remote_page_list import RemotePageList
+from ui.action_buttons_delegate import ActionButtonsDelegate
+from ui.bulk_actions import BulkActionBar
+from ui.chunked_table_model import ChunkedTableModel, CHUNK_SIZE, CONTINUOUS
+from ui.date_range_filter import DateRangeFilter
+from ui.optimistic import OptimisticActions
+from ui.sort_header import SortHeader
 from ui.modules.depense_form_dialog import DepenseFormDialog
 from ui.modules.demandes_depense_widget import DemandesDepenseWidget
 import datetime
 import math
 
 
+STATUS_LABELS = {
+    "validee": "✅ Validée",
+    "rejettee": "❌ Rejetée",
+    "en_attente": "⏳ En attente"
+}
+
+STATUS_COLORS = {
+    "validee": QColor("#27ae60"),
+    "rejettee": QColor("#e74c3c"),
+    "en_attente": QColor("#f39c12")
+}
+
+ROW_HEIGHT = 44
+
+
+def depense_search_fields(depense):
+    """Valeurs trouvables par la barre de recherche."""
+    return (depense["date"], depense["type_depense"], depense["montant"],
+            depense.get("ligne_budgetaire_nom", ""))
+
+
+class DepensesTableModel(ChunkedTableModel):
+    """
+    Modèle des dépenses affichées dans le QTableView.
+    Les cellules sont formatées à la demande dans data() : seules les lignes
+    visibles à l'écran sont calculées, quel que soit le nombre de dépenses.
+    """
+    HEADERS = ["Date", "Type", "Montant", "Ligne Budgétaire", "Statut", "Actions"]
+    ACTIONS_COLUMN = 5
+
+    EVEN_ROW_BRUSH = QBrush(QColor("#f8f9fa"))
+    STATUS_BRUSHES = {status: QBrush(color) for status, color in STATUS_COLORS.items()}
+    DEFAULT_STATUS_BRUSH = QBrush(QColor("#2c3e50"))
+
+    def record_data(self, depense, index, role):
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return depense["date"]
+            if column == 1:
+                return depense["type_depense"]
+            if column == 2:
+                return f"{depense['montant']:,.2f} F"
+            if column == 3:
+                return depense.get("ligne_budgetaire_nom", "N/A")
+            if column == 4:
+                statut = depense["statut_validation"]
+                return STATUS_LABELS.get(statut, statut.capitalize())
+            return None
+        if role == Qt.UserRole:
+            return depense
+        if role == Qt.TextAlignmentRole and column == 2:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        if role == Qt.ForegroundRole and column == 4:
+            return self.STATUS_BRUSHES.get(depense["statut_validation"], self.DEFAULT_STATUS_BRUSH)
+        if role == Qt.BackgroundRole and index.row() % 2 == 0:
+            return self.EVEN_ROW_BRUSH
+        return None
+
+
 class DepensesWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.user_role = AuthService.get_user_role()
         self.all_depenses = []
+        self.search_index = SearchIndex(depense_search_fields)
+        self.date_index = DateIndex(lambda d: d["date"])
+        self.filter_engine = FilterEngine(self.search_index, {"statut": lambda d: d["statut_validation"]},
+                                          ranges={"periode": self.date_index})
+        self.sorter = Sorter({
+            "date": (lambda d: d["date"], DATE),
+            "type": (lambda d: d["type_depense"], TEXT),
+            "montant": (lambda d: d["montant"], NUMBER),
+            "ligne": (lambda d: d.get("ligne_budgetaire_nom"), TEXT),
+            "statut": (lambda d: STATUS_LABELS.get(d["statut_validation"], d["statut_validation"]), TEXT),
+        })
         self.filtered_depenses = []
         self.current_page = 1
         self.items_per_page = 10
+        self.continuous = False  # Défilement continu : lignes ajoutées par tranches, sans pages
+        self._load_task = None
+        self._full_loaded = False
+        self.remote_depenses = RemotePageList(get_depenses, self.items_per_page, parent=self,
+                                              forget_page=forget_depenses_page)
+        self.remote_depenses.page_loaded.connect(self.on_depenses_page_loaded)
+        self.remote_depenses.load_failed.connect(self.on_depenses_page_failed)
+        # Validations et suppressions appliquées sans attendre le serveur
+        self.optimistic = OptimisticActions(self, self.load_depenses)
         self.setup_ui()
+        self.show_cached_depenses()
         self.load_depenses()
         self.setup_animations()
 
@@ -160,15 +257,25 @@ class DepensesWidget(QWidget):
                 background-color: white;
             }
         """)
-        self.search_input.textChanged.connect(self.apply_filters)
+        # Frappes rapides regroupées : le filtre n'est appliqué qu'après une pause
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.apply_filters)
+        self.search_input.textChanged.connect(lambda _: self.search_timer.start())
         filter_bar.addWidget(QLabel("Recherche:"))
         filter_bar.addWidget(self.search_input)
 
+        # Filtre par période (index trié des dates)
+        self.period_filter = DateRangeFilter()
+        self.period_filter.changed.connect(self.apply_filters)
+        filter_bar.addWidget(self.period_filter)
+
         filter_bar.addStretch()
 
         # Sélecteur d'éléments par page
         self.items_per_page_combo = QComboBox()
-        self.items_per_page_combo.addItems(["5", "10", "20", "50", "100"])
+        self.items_per_page_combo.addItems(["5", "10", "20", "50", "100", CONTINUOUS])
         self.items_per_page_combo.setCurrentText("10")
         self.items_per_page_combo.setStyleSheet("""
             QComboBox {
@@ -190,12 +297,13 @@ class DepensesWidget(QWidget):
 
         layout.addLayout(filter_bar)
 
-        # Tableau
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["Date", "Type", "Montant", "Ligne Budgétaire", "Statut", "Actions"])
+        # Tableau (modèle/vue : les cellules sont formatées à la demande)
+        self.model = DepensesTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.model.watch(self.table)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: white;
                 border-radius: 8px;
                 gridline-color: #ecf0f1;
@@ -210,10 +318,10 @@ class DepensesWidget(QWidget):
                 border: none;
                 font-weight: bold;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 10px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #e0f2fe;
                 color: #2c3e50;
             }
@@ -221,10 +329,21 @@ class DepensesWidget(QWidget):
 
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        # Hauteur de ligne fixe : la vue n'a pas à mesurer chaque ligne
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         self.table.setShowGrid(False)
+        self.table.setItemDelegateForColumn(
+            DepensesTableModel.ACTIONS_COLUMN,
+            ActionButtonsDelegate(self.get_actions, self.table, DepensesTableModel.ACTIONS_COLUMN))
+
+        # Tri sur toute la collection filtrée (clic sur l'en-tête)
+        self.sort_header = SortHeader(
+            self.table, {0: "date", 1: "type", 2: "montant", 3: "ligne", 4: "statut"}, self)
+        self.sort_header.changed.connect(self.apply_filters)
 
         # Ajouter un effet d'ombre
         shadow = QGraphicsDropShadowEffect()
@@ -233,6 +352,23 @@ class DepensesWidget(QWidget):
         shadow.setOffset(0, 3)
         self.table.setGraphicsEffect(shadow)
 
+        # Actions groupées sur les lignes sélectionnées (selon le rôle)
+        self.bulk_bar = BulkActionBar(self.table, DepensesTableModel.ACTIONS_COLUMN, self.load_depenses, self)
+        if self.user_role == "comptable":
+            self.bulk_bar.add_action("🗑 Supprimer la sélection", "#e74c3c", self.supprimer_selection,
+                                     "Supprimer les dépenses sélectionnées en attente")
+        elif self.user_role == "csa":
+            self.bulk_bar.add_action("🕵️ Superviser la sélection", "#9b59b6", self.superviser_selection,
+                                     "Superviser les dépenses sélectionnées en attente")
+        elif self.user_role == "directeur":
+            self.bulk_bar.add_action("✅ Valider la sélection", "#27ae60",
+                                     lambda: self.valider_selection("validee"),
+                                     "Valider les dépenses sélectionnées déjà supervisées")
+            self.bulk_bar.add_action("❌ Rejeter la sélection", "#e74c3c",
+                                     lambda: self.valider_selection("rejettee"),
+                                     "Rejeter les dépenses sélectionnées déjà supervisées")
+        layout.addWidget(self.bulk_bar)
+
         layout.addWidget(self.table)
 
         # Pagination
@@ -312,8 +448,8 @@ class DepensesWidget(QWidget):
         status_bar.addStretch()
 
         # Bouton de rafraîchissement
-        refresh_btn = QPushButton("🔄 Rafraîchir")
-        refresh_btn.setStyleSheet("""
+        self.refresh_btn = QPushButton("🔄 Rafraîchir")
+        self.refresh_btn.setStyleSheet("""
             QPushButton {
                 background-color: #ecf0f1;
                 color: #2c3e50;
@@ -325,100 +461,168 @@ class DepensesWidget(QWidget):
                 background-color: #d5dbdb;
             }
         """)
-        refresh_btn.setCursor(Qt.PointingHandCursor)
-        refresh_btn.clicked.connect(self.refresh_data)
-        status_bar.addWidget(refresh_btn)
+        self.refresh_btn.setCursor(Qt.PointingHandCursor)
+        self.refresh_btn.clicked.connect(self.refresh_data)
+        status_bar.addWidget(self.refresh_btn)
 
         layout.addLayout(status_bar)
 
+    def show_cached_depenses(self):
+        # Affichage immédiat de la dernière version connue, revalidée ensuite par load_depenses
+        cached = local_store.load("depenses")
+        if cached:
+            self.all_depenses = cached
+            self.search_index.set_records(cached)
+            self.date_index.set_records(cached)
+            self.apply_filters()
+            self.update_label.setText("Données en cache - actualisation en cours...")
+
     def load_depenses(self):
-        result = get_depenses()
+        # Sans filtre actif, seule la page affichée (et la suivante) est demandée au
+        # serveur ; la collection complète n'est chargée que pour filtrer localement.
+        if self._load_task is not None:
+            self._load_task.cancel()
+            self._load_task = None
+        self.set_loading(True)
+        if self.needs_full_collection():
+            self.load_all_depenses()
+        else:
+            self._full_loaded = False
+            # Pages affichées redemandées ; leurs lignes restent à l'écran jusqu'à
+            # la réponse, puis seules les différences sont redessinées
+            if self.continuous:
+                self.remote_depenses.refresh()
+                self.remote_depenses.ensure_page(1)
+            else:
+                self.remote_depenses.refresh([self.current_page])
+
+    def load_all_depenses(self):
+        self._load_task = run_async(get_depenses, on_result=self.on_depenses_loaded, owner=self)
+
+    def on_depenses_page_loaded(self, page):
+        # Une page du serveur est arrivée : redessiner si c'est celle affichée
+        if self.needs_full_collection():
+            return
+        if self.continuous:
+            # Les tranches sont ajoutées au tableau par le modèle lui-même
+            if self.filtered_depenses is not self.remote_depenses:
+                self.filtered_depenses = self.remote_depenses
+                self.update_table()
+            self.set_loading(False)
+            self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
+            return
+        if page != self.current_page:
+            return
+        self.filtered_depenses = self.remote_depenses
+        self.set_loading(False)
+        self.update_table()
+        self.update_pagination()
+        self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
+
+    def on_depenses_page_failed(self, message):
+        self.set_loading(False)
+        self.show_error_message("Erreur", message)
+
+    def on_depenses_loaded(self, result):
+        self._load_task = None
+        self.set_loading(False)
         if result["success"]:
-            self.all_depenses = result["data"]
-            self.filtered_depenses = self.all_depenses
-            self.apply_filters()
+            self._full_loaded = True
+            if result["data"] != self.all_depenses:
+                self.patch_depenses(result["data"])
+            self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
         else:
             self.show_error_message("Erreur", result["message"])
 
-    def apply_filters(self):
-        # Récupérer les valeurs des filtres
-        status_filter = self.status_filter.currentData()
-        search_text = self.search_input.text().lower()
+    def patch_depenses(self, depenses):
+        """Remplace les données affichées en conservant la page courante."""
+        self.all_depenses = depenses
+        self.search_index.set_records(depenses)
+        self.date_index.set_records(depenses)
+        self.show_filtered()
+
+    def set_loading(self, loading):
+        self.refresh_btn.setEnabled(not loading)
+        if loading:
+            self.results_label.setText("⏳ Chargement des dépenses...")
+        else:
+            self.results_label.setText(f"{len(self.filtered_depenses)} dépense(s) trouvée(s)")
 
-        # Filtrer les dépenses
-        self.filtered_depenses = []
-        for depense in self.all_depenses:
-            # Filtre par statut
-            if status_filter != "tous" and depense["statut_validation"] != status_filter:
-                continue
+    def filters_active(self):
+        return (self.status_filter.currentData() != "tous" or bool(self.search_input.text())
+                or self.period_filter.is_active())
 
-            # Filtre par texte de recherche
-            searchable_text = (
-                    depense["date"].lower() +
-                    depense["type_depense"].lower() +
-                    str(depense["montant"]) +
-                    depense.get("ligne_budgetaire_nom", "").lower()
-            )
+    def needs_full_collection(self):
+        # Filtrage ou tri local
+        return self.filters_active() or self.sort_header.is_active()
 
-            if search_text and search_text not in searchable_text:
-                continue
+    def apply_filters(self):
+        self.current_page = 1  # Reset to first page when filters change
+        self.show_filtered()
+
+    def show_filtered(self):
+        """Recalcule le résultat filtré et l'affiche à la page courante."""
+        if not self.needs_full_collection() and self.remote_depenses.is_ready():
+            # Aucun filtre : pagination côté serveur
+            self.filtered_depenses = self.remote_depenses
+            self.update_table()
+            self.update_pagination()
+            self.results_label.setText(f"{len(self.filtered_depenses)} dépense(s) trouvée(s)")
+            return
+        if self.needs_full_collection() and not self._full_loaded and self._load_task is None:
+            # Le filtrage local porte sur toute la collection
+            self.set_loading(True)
+            self.load_all_depenses()
 
-            self.filtered_depenses.append(depense)
+        # Récupérer les valeurs des filtres
+        status_filter = self.status_filter.currentData()
 
-        self.current_page = 1  # Reset to first page when filters change
+        # Filtrer les dépenses (affinage du résultat précédent si possible)
+        self.filtered_depenses = self.filter_engine.filter(
+            self.search_input.text(),
+            statut=None if status_filter == "tous" else status_filter,
+            periode=self.period_filter.period())
+        self.filtered_depenses = self.sorter.sort(self.filtered_depenses, self.sort_header.order)
+
+        total_pages = math.ceil(len(self.filtered_depenses) / self.items_per_page) or 1
+        self.current_page = min(self.current_page, total_pages)
         self.update_table()
         self.update_pagination()
         self.results_label.setText(f"{len(self.filtered_depenses)} dépense(s) trouvée(s)")
 
     def change_items_per_page(self, text):
+        continuous = text == CONTINUOUS
+        if continuous != self.continuous:
+            # Passage de/vers le défilement continu : tranches de CHUNK_SIZE lignes
+            self.continuous = continuous
+            if not continuous:
+                self.items_per_page = int(text)
+            self.remote_depenses.reset(CHUNK_SIZE if continuous else self.items_per_page)
+            self.apply_filters()
+            return
+        if continuous:
+            return
         self.items_per_page = int(text)
+        self.remote_depenses.reset(self.items_per_page)
         self.current_page = 1  # Reset to first page when items per page changes
         self.update_table()
         self.update_pagination()
 
+    @timed("depenses.update_table")
     def update_table(self):
-        start_index = (self.current_page - 1) * self.items_per_page
-        end_index = start_index + self.items_per_page
-        paginated_depenses = self.filtered_depenses[start_index:end_index]
-
-        self.table.setRowCount(len(paginated_depenses))
-
-        for i, depense in enumerate(paginated_depenses):
-            # Date
-            date_item = QTableWidgetItem(depense["date"])
-            self.table.setItem(i, 0, date_item)
-
-            # Type
-            type_item = QTableWidgetItem(depense["type_depense"])
-            self.table.setItem(i, 1, type_item)
-
-            # Montant (aligné à droite)
-            montant_item = QTableWidgetItem(f"{depense['montant']:,.2f} F")
-            montant_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.table.setItem(i, 2, montant_item)
-
-            # Ligne Budgétaire
-            ligne_nom = depense.get("ligne_budgetaire_nom", "N/A")
-            ligne_item = QTableWidgetItem(ligne_nom)
-            self.table.setItem(i, 3, ligne_item)
-
-            # Statut avec couleur et icône
-            statut = self.format_status(depense["statut_validation"])
-            statut_item = QTableWidgetItem(statut)
-            statut_item.setForeground(self.get_status_color(depense["statut_validation"]))
-            self.table.setItem(i, 4, statut_item)
-
-            # Actions
-            action_widget = self.create_action_widget(depense)
-            self.table.setCellWidget(i, 5, action_widget)
-
-            # Alternance des couleurs de ligne
-            if i % 2 == 0:
-                for j in range(self.table.columnCount()):
-                    if self.table.item(i, j):
-                        self.table.item(i, j).setBackground(QColor("#f8f9fa"))
+        if self.continuous:
+            # Sans pagination : la vue ne dessine que les lignes visibles et, côté
+            # serveur, le modèle demande les tranches au fil du défilement
+            self.model.set_rows(self.filtered_depenses)
+        else:
+            start_index = (self.current_page - 1) * self.items_per_page
+            end_index = start_index + self.items_per_page
+            self.model.set_rows(self.filtered_depenses[start_index:end_index])
+        self.pagination_widget.setVisible(not self.continuous)
 
     def update_pagination(self):
+        if self.continuous:
+            return  # Pagination masquée : inutile de recréer les boutons de page
         # Clear existing page buttons
         for i in reversed(range(self.page_buttons_layout.count())):
             widget = self.page_buttons_layout.itemAt(i).widget()
@@ -505,93 +709,45 @@ class DepensesWidget(QWidget):
             self.go_to_page(self.current_page + 1)
 
     def format_status(self, status):
-        status_map = {
-            "validee": "✅ Validée",
-            "rejettee": "❌ Rejetée",
-            "en_attente": "⏳ En attente"
-        }
-        return status_map.get(status, status.capitalize())
-
-    def create_action_widget(self, depense):
-        action_widget = QWidget()
-        action_layout = QHBoxLayout(action_widget)
-        action_layout.setContentsMargins(5, 0, 5, 0)
-        action_layout.setSpacing(8)
-
-        # Variable pour suivre si des boutons ont été ajoutés
-        buttons_added = False
+        return STATUS_LABELS.get(status, status.capitalize())
+
+    def get_actions(self, depense):
+        """
+        Actions disponibles pour une dépense selon le rôle de l'utilisateur :
+        (liste de (libellé, couleur, callback, infobulle), texte si aucune action).
+        """
+        actions = []
 
         # Afficher les actions seulement pour les dépenses en attente
         if depense["statut_validation"] == "en_attente":
             # Boutons pour Comptable
             if self.user_role == "comptable":
-                self.add_action_button(action_layout, "✏️ Modifier", "#3498db",
-                                       lambda: self.modifier_depense(depense), "Modifier cette dépense")
-                self.add_action_button(action_layout, "🗑 Supprimer", "#e74c3c",
-                                       lambda: self.supprimer_depense(depense["id"]), "Supprimer cette dépense")
-                buttons_added = True
+                actions.append(("✏️ Modifier", "#3498db",
+                                lambda: self.modifier_depense(depense), "Modifier cette dépense"))
+                actions.append(("🗑 Supprimer", "#e74c3c",
+                                lambda: self.supprimer_depense(depense), "Supprimer cette dépense"))
 
             # Bouton pour csa
             elif self.user_role == "csa":
-                self.add_action_button(action_layout, "🕵️ Superviser", "#9b59b6",
-                                       lambda: self.superviser_depense(depense["id"]), "Superviser cette dépense")
-                buttons_added = True
+                actions.append(("🕵️ Superviser", "#9b59b6",
+                                lambda: self.superviser_depense(depense), "Superviser cette dépense"))
 
             # Boutons pour directeur (seulement si déjà supervisé)
             elif self.user_role == "directeur" and depense.get("supervise_par"):
-                self.add_action_button(action_layout, "✅ Valider", "#27ae60",
-                                       lambda: self.valider_depense(depense["id"], "validee"), "Valider cette dépense")
-                self.add_action_button(action_layout, "❌ Rejeter", "#e74c3c",
-                                       lambda: self.valider_depense(depense["id"], "rejettee"), "Rejeter cette dépense")
-                buttons_added = True
+                actions.append(("✅ Valider", "#27ae60",
+                                lambda: self.valider_depense(depense, "validee"), "Valider cette dépense"))
+                actions.append(("❌ Rejeter", "#e74c3c",
+                                lambda: self.valider_depense(depense, "rejettee"), "Rejeter cette dépense"))
 
         # Si aucune action disponible
-        if not buttons_added:
-            if depense["statut_validation"] != "en_attente":
-                status_text = "Traitement terminé"
-            else:
-                status_text = "Action indisponible"
-
-            label = QLabel(status_text)
-            label.setStyleSheet("color: #95a5a6; font-style: italic;")
-            action_layout.addWidget(label)
-
-        action_layout.addStretch()
-        return action_widget
-
-    def add_action_button(self, layout, text, color, callback, tooltip=""):
-        btn = QPushButton(text)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                padding: 5px 10px;
-                border-radius: 3px;
-                font-size: 12px;
-                min-width: 80px;
-                border: none;
-            }}
-            QPushButton:hover {{
-                background-color: {self.darken_color(color)};
-                box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-            }}
-            QPushButton:pressed {{
-                background-color: {self.darken_color(color, 40)};
-            }}
-        """)
-        if tooltip:
-            btn.setToolTip(tooltip)
-        btn.setCursor(Qt.PointingHandCursor)
-        btn.clicked.connect(callback)
-        layout.addWidget(btn)
-        return btn
+        if depense["statut_validation"] != "en_attente":
+            status_text = "Traitement terminé"
+        else:
+            status_text = "Action indisponible"
+        return actions, status_text
 
     def get_status_color(self, status):
-        return {
-            "validee": QColor("#27ae60"),
-            "rejettee": QColor("#e74c3c"),
-            "en_attente": QColor("#f39c12")
-        }.get(status, QColor("#2c3e50"))
+        return STATUS_COLORS.get(status, QColor("#2c3e50"))
 
     def darken_color(self, hex_color, amount=20):
         color = QColor(hex_color)
@@ -609,7 +765,6 @@ class DepensesWidget(QWidget):
 
     def refresh_data(self):
         self.load_depenses()
-        self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
 
         # Animation de rafraîchissement
         anim = QPropertyAnimation(self.table, b"windowOpacity")
@@ -748,21 +903,104 @@ class DepensesWidget(QWidget):
             self.refresh_data()
             self.show_success_message("Succès", "La dépense a été modifiée avec succès!")
 
-    def supprimer_depense(self, depense_id):
+    def run_optimistic(self, depense, updated, fn, *args, done_message=None):
+        """
+        Applique `updated` (None : suppression) à l'écran sans attendre le
+        serveur ; l'état est rétabli, avec un toast d'erreur, si fn(*args) échoue.
+        """
+        positions = []  # Positions de la dépense retirée, pour la rétablir à sa place
+        if updated is None:
+            rollback = lambda: self.restore_depense(depense, *positions)
+        else:
+            rollback = lambda: self.replace_depense(updated, depense)
+        self.optimistic.run(fn, *args, done_message=done_message, rollback=rollback,
+                            apply=lambda: positions.extend(self.replace_depense(depense, updated)))
+
+    def replace_depense(self, old, new):
+        """
+        Remplace (new=None : retire) une dépense dans toutes les données affichées.
+        Renvoie ses positions (collection complète, pages du serveur), ou None.
+        """
+        rank = self.search_index.rank_of(old["id"])
+        if rank is not None and rank < len(self.all_depenses) and self.all_depenses[rank] is old:
+            # Index mis à jour pour ce seul élément (les listes reçues sont partagées : copie)
+            if new is None:
+                self.all_depenses = self.all_depenses[:rank] + self.all_depenses[rank + 1:]
+                self.search_index.remove(old["id"])
+                self.date_index.remove(old)
+            else:
+                self.all_depenses = self.all_depenses[:rank] + [new] + self.all_depenses[rank + 1:]
+                self.search_index.upsert(new)
+                self.date_index.upsert(new, old)
+        else:
+            rank = None
+        if self.filtered_depenses is self.remote_depenses and self.continuous:
+            remote_rank = self.remote_depenses.index_of(old)
+            self.model.replace_record(old, new)  # Tranches du serveur modifiées par le modèle
+        else:
+            remote_rank = self.remote_depenses.replace(old, new)
+            self.show_replaced()
+        self.results_label.setText(f"{len(self.filtered_depenses)} dépense(s) trouvée(s)")
+        return rank, remote_rank
+
+    def restore_depense(self, depense, rank, remote_rank):
+        """Annulation d'une suppression : la dépense revient à ses positions d'origine."""
+        if rank is not None and depense["id"] not in self.search_index:
+            self.all_depenses = self.all_depenses[:rank] + [depense] + self.all_depenses[rank:]
+            self.search_index.upsert(depense, rank)
+            self.date_index.upsert(depense)
+        if self.filtered_depenses is self.remote_depenses and self.continuous:
+            if remote_rank is not None:
+                self.model.insert_record(remote_rank, depense)
+        else:
+            if remote_rank is not None:
+                self.remote_depenses.insert(remote_rank, depense)
+            self.show_replaced()
+        self.results_label.setText(f"{len(self.filtered_depenses)} dépense(s) trouvée(s)")
+
+    def show_replaced(self):
+        # Page affichée redessinée après une modification locale (diff du modèle)
+        if self.filtered_depenses is self.remote_depenses:
+            self.update_table()
+            self.update_pagination()
+        else:
+            self.show_filtered()
+
+    def supprimer_depense(self, depense):
         confirm = self.show_confirmation_dialog(
             "Confirmation de suppression",
             "Voulez-vous vraiment supprimer cette dépense ?",
             "Cette action est irréversible."
         )
         if confirm == QMessageBox.Yes:
-            result = delete_depense(depense_id)
-            if result["success"]:
-                self.show_success_message("Succès", result["message"])
-                self.refresh_data()
-            else:
-                self.show_error_message("Erreur", result["message"])
+            # Retirée immédiatement, rétablie si le serveur refuse
+            self.run_optimistic(depense, None, delete_depense, depense["id"],
+                                done_message="Dépense supprimée.")
+
+    def supprimer_selection(self):
+        depenses = [depense for depense in self.bulk_bar.selected_records()
+                    if depense["statut_validation"] == "en_attente"]
+        self.bulk_bar.run("Suppression groupée",
+                          "Voulez-vous vraiment supprimer les dépenses sélectionnées ?\nCette action est irréversible.",
+                          delete_depenses, depenses)
+
+    def superviser_selection(self):
+        depenses = [depense for depense in self.bulk_bar.selected_records()
+                    if depense["statut_validation"] == "en_attente"]
+        self.bulk_bar.run("Supervision groupée", "Superviser les dépenses sélectionnées ?",
+                          superviser_depenses, depenses)
+
+    def valider_selection(self, statut):
+        depenses = [depense for depense in self.bulk_bar.selected_records()
+                    if depense["statut_validation"] == "en_attente" and depense.get("supervise_par")]
+        if statut == "validee":
+            self.bulk_bar.run("Validation groupée", "Valider les dépenses sélectionnées ?",
+                              valider_depenses, depenses, statut)
+        else:
+            self.bulk_bar.run("Rejet groupé", "Rejeter les dépenses sélectionnées ?",
+                              valider_depenses, depenses, statut)
 
-    def superviser_depense(self, depense_id):
+    def superviser_depense(self, depense):
         # Boîte de dialogue pour commentaire
         dialog = QDialog(self)
         dialog.setWindowTitle("Supervision de la dépense")
@@ -857,14 +1095,10 @@ class DepensesWidget(QWidget):
 
         if dialog.exec_():
             commentaire = text_edit.toPlainText().strip()
-            result = superviser_depense(depense_id, commentaire if commentaire else None)
-            if result["success"]:
-                self.show_success_message("Succès", result["message"])
-                self.refresh_data()
-            else:
-                self.show_error_message("Erreur", result["message"])
+            self.run_optimistic(depense, dict(depense, supervise_par=AuthService.user_data.get("id", True)),
+                                superviser_depense, depense["id"], commentaire if commentaire else None)
 
-    def valider_depense(self, depense_id, statut):
+    def valider_depense(self, depense, statut):
         # Boîte de dialogue pour commentaire
         dialog = QDialog(self)
         dialog.setWindowTitle("Commentaire pour le Comptable")
@@ -965,9 +1199,5 @@ class DepensesWidget(QWidget):
 
         if dialog.exec_():
             commentaire = text_edit.toPlainText().strip()
-            result = valider_depense(depense_id, statut, commentaire if commentaire else None)
-            if result["success"]:
-                self.show_success_message("Succès", result["message"])
-                self.refresh_data()
-            else:
-                self.show_error_message("Erreur", result["message"])
\ No newline at end of file
+            self.run_optimistic(depense, dict(depense, statut_validation=statut),
+                                valider_depense, depense["id"], statut, commentaire if commentaire else None)
\ No newline at end of file
@@ -1,22 +1,103 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QTableView,
                              QHeaderView, QMessageBox, QHBoxLayout, QPushButton, QComboBox,
                              QLineEdit, QGraphicsDropShadowEffect)
-from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve
+from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QTimer
 from PyQt5.QtGui import QColor, QFont, QBrush
-from services.audit_service import get_audit_logs
+from services.async_service import run_async
+from services.audit_service import get_audit_logs, forget_audit_logs_page, sync_audit_logs
+from services.sorting import Sorter, TEXT, DATE
+from services.date_index import DateIndex
+from services.filter_engine import FilterEngine, DEBOUNCE_MS
+from services.search_index import SearchIndex
 from services.auth_service import AuthService
+from services.metrics import timed
+from ui.remote_page_list import RemotePageList
+from ui.chunked_table_model import ChunkedTableModel, CHUNK_SIZE, CONTINUOUS
+from ui.date_range_filter import DateRangeFilter
+from ui.sort_header import SortHeader
 import datetime
 import math
 
 
+def log_search_fields(log):
+    """Valeurs trouvables par la barre de recherche."""
+    return (log.get("utilisateur_nom", ""), log.get("utilisateur_email", ""),
+            log.get("action", ""), log.get("date_heure", ""))
+
+
+def action_color(action):
+    """Couleur d'une action du journal selon son type, None par défaut."""
+    action = action.lower()
+    if "création" in action or "ajout" in action:
+        return "#27ae60"  # Vert
+    if "suppression" in action or "supprimer" in action:
+        return "#e74c3c"  # Rouge
+    if "modification" in action or "mise à jour" in action:
+        return "#f39c12"  # Orange
+    if "connexion" in action or "login" in action:
+        return "#3498db"  # Bleu
+    return None
+
+
+class JournalTableModel(ChunkedTableModel):
+    """
+    Modèle des entrées du journal affichées dans le QTableView.
+    Les cellules sont formatées à la demande : seules les lignes visibles
+    sont calculées, y compris en défilement continu.
+    """
+    HEADERS = ["Utilisateur", "Email", "Action", "Date"]
+
+    EVEN_ROW_BRUSH = QBrush(QColor("#f8f9fa"))
+    ACTION_BRUSHES = {color: QBrush(QColor(color)) for color in ("#27ae60", "#e74c3c", "#f39c12", "#3498db")}
+
+    def record_data(self, log, index, role):
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return log.get("utilisateur_nom", "Inconnu")
+            if column == 1:
+                return log.get("utilisateur_email", "Inconnu")
+            if column == 2:
+                return log.get("action", "N/A")
+            return log.get("date_heure", "")[:19]  # Format ISO
+        if role == Qt.UserRole:
+            return log
+        if role == Qt.ForegroundRole and column == 2:
+            return self.ACTION_BRUSHES.get(action_color(log.get("action", "N/A")))
+        if role == Qt.BackgroundRole and index.row() % 2 == 0:
+            return self.EVEN_ROW_BRUSH
+        return None
+
+
 class JournalAuditWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Journal d'Audit")
         self.audit_logs = []
+        self.last_log_id = None  # Entrée la plus récente de self.audit_logs (None : jamais chargé)
+        self.search_index = SearchIndex(log_search_fields)
+        self.date_index = DateIndex(lambda log: log.get("date_heure"))
+        self.filter_engine = FilterEngine(self.search_index, {
+            "utilisateur": lambda log: log.get("utilisateur_nom", "Inconnu"),
+            "action": lambda log: log.get("action", "N/A"),
+        }, ranges={"periode": self.date_index})
+        self.sorter = Sorter({
+            "utilisateur": (lambda log: log.get("utilisateur_nom"), TEXT),
+            "email": (lambda log: log.get("utilisateur_email"), TEXT),
+            "action": (lambda log: log.get("action"), TEXT),
+            "date": (lambda log: log.get("date_heure"), DATE),
+        })
         self.filtered_logs = []
         self.current_page = 1
         self.items_per_page = 10
+        self.continuous = False  # Défilement continu : lignes ajoutées par tranches, sans pages
+        self._load_task = None
+        self._full_loaded = False
+        self.remote_audit_logs = RemotePageList(get_audit_logs, self.items_per_page, parent=self,
+                                                forget_page=forget_audit_logs_page)
+        self.remote_audit_logs.page_loaded.connect(self.on_audit_logs_page_loaded)
+        self.remote_audit_logs.load_failed.connect(self.on_audit_logs_page_failed)
         self.setup_ui()
         self.load_audit_logs()
         self.setup_animations()
@@ -111,15 +192,25 @@ class JournalAuditWidget(QWidget):
                 min-width: 200px;
             }
         """)
-        self.search_input.textChanged.connect(self.apply_filters)
+        # Frappes rapides regroupées : le filtre n'est appliqué qu'après une pause
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.apply_filters)
+        self.search_input.textChanged.connect(lambda _: self.search_timer.start())
         filter_bar.addWidget(QLabel("Recherche:"))
         filter_bar.addWidget(self.search_input)
 
+        # Filtre par période (index trié des dates)
+        self.period_filter = DateRangeFilter()
+        self.period_filter.changed.connect(self.apply_filters)
+        filter_bar.addWidget(self.period_filter)
+
         filter_bar.addStretch()
 
         # Sélecteur d'éléments par page
         self.items_per_page_combo = QComboBox()
-        self.items_per_page_combo.addItems(["5", "10", "20", "50", "100"])
+        self.items_per_page_combo.addItems(["5", "10", "20", "50", "100", CONTINUOUS])
         self.items_per_page_combo.setCurrentText("10")
         self.items_per_page_combo.setStyleSheet("""
             QComboBox {
@@ -141,12 +232,13 @@ class JournalAuditWidget(QWidget):
 
         layout.addLayout(filter_bar)
 
-        # Tableau des logs d'audit
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Utilisateur", "Email", "Action", "Date"])
+        # Tableau des logs d'audit (modèle/vue : les cellules sont formatées à la demande)
+        self.model = JournalTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.model.watch(self.table)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: white;
                 border-radius: 8px;
                 gridline-color: #ecf0f1;
@@ -161,10 +253,10 @@ class JournalAuditWidget(QWidget):
                 border: none;
                 font-weight: bold;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 10px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #e0f2fe;
                 color: #2c3e50;
             }
@@ -172,11 +264,16 @@ class JournalAuditWidget(QWidget):
 
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         self.table.setShowGrid(False)
 
+        # Tri sur toute la collection filtrée (clic sur l'en-tête)
+        self.sort_header = SortHeader(
+            self.table, {0: "utilisateur", 1: "email", 2: "action", 3: "date"}, self)
+        self.sort_header.changed.connect(self.apply_filters)
+
         # Effet d'ombre
         shadow = QGraphicsDropShadowEffect()
         shadow.setBlurRadius(15)
@@ -276,8 +373,8 @@ class JournalAuditWidget(QWidget):
         status_bar.addWidget(role_label)
 
         # Bouton de rafraîchissement
-        refresh_btn = QPushButton("🔄 Rafraîchir")
-        refresh_btn.setStyleSheet("""
+        self.refresh_btn = QPushButton("🔄 Rafraîchir")
+        self.refresh_btn.setStyleSheet("""
             QPushButton {
                 background-color: #ecf0f1;
                 color: #2c3e50;
@@ -289,12 +386,12 @@ class JournalAuditWidget(QWidget):
                 background-color: #d5dbdb;
             }
         """)
-        refresh_btn.setCursor(Qt.PointingHandCursor)
-        refresh_btn.clicked.connect(self.refresh_data)
-        status_bar.addWidget(refresh_btn)
+        self.refresh_btn.setCursor(Qt.PointingHandCursor)
+        self.refresh_btn.clicked.connect(self.refresh_data)
+        status_bar.addWidget(self.refresh_btn)
 
         # Bouton d'exportation
-        export_btn = QPushButton("📊 Exporter")
+        export_btn = self.export_btn = QPushButton("📊 Exporter")
         export_btn.setStyleSheet("""
             QPushButton {
                 background-color: #3498db;
@@ -315,133 +412,221 @@ class JournalAuditWidget(QWidget):
         layout.addLayout(status_bar)
 
     def load_audit_logs(self):
-        result = get_audit_logs()
-        if result["success"]:
-            self.audit_logs = result["data"]
-            self.filtered_logs = self.audit_logs
-
-            # Extraire les utilisateurs et actions uniques pour les filtres
-            users = set()
-            actions = set()
-            for log in self.audit_logs:
-                users.add(log.get("utilisateur_nom"))
-                actions.add(log.get("action", "N/A"))
-
-            # Mettre à jour les combobox de filtres
-            current_user = self.user_filter.currentText()
-            current_action = self.action_filter.currentText()
-
-            self.user_filter.clear()
-            self.user_filter.addItem("Tous les utilisateurs", "tous")
-            for user in sorted(users):
-                self.user_filter.addItem(user, user)
-
-            self.action_filter.clear()
-            self.action_filter.addItem("Toutes les actions", "toutes")
-            for action in sorted(actions):
-                self.action_filter.addItem(action, action)
-
-            # Restaurer les sélections précédentes si possible
-            user_index = self.user_filter.findText(current_user)
-            if user_index > 0:
-                self.user_filter.setCurrentIndex(user_index)
-
-            action_index = self.action_filter.findText(current_action)
-            if action_index > 0:
-                self.action_filter.setCurrentIndex(action_index)
+        # Sans filtre actif, seule la page affichée (et la suivante) est demandée au
+        # serveur ; la collection complète n'est chargée que pour filtrer localement.
+        if self._load_task is not None:
+            self._load_task.cancel()
+            self._load_task = None
+        self.set_loading(True)
+        if self.filters_active():
+            self.load_all_audit_logs()
+        else:
+            self._full_loaded = False
+            # Pages affichées redemandées ; leurs lignes restent à l'écran jusqu'à
+            # la réponse, puis seules les différences sont redessinées
+            if self.continuous:
+                self.remote_audit_logs.refresh()
+                self.remote_audit_logs.ensure_page(1)
+            else:
+                self.remote_audit_logs.refresh([self.current_page])
+
+    def load_all_audit_logs(self):
+        # Synchronisation incrémentale : seules les nouvelles entrées sont téléchargées
+        self._load_task = run_async(sync_audit_logs, after_id=self.last_log_id,
+                                    on_result=self.on_audit_logs_loaded, owner=self)
+
+    def on_audit_logs_page_loaded(self, page):
+        # Une page du serveur est arrivée : redessiner si c'est celle affichée
+        if self.filters_active():
+            return
+        if self.continuous:
+            # Les tranches sont ajoutées au tableau par le modèle lui-même
+            self.update_filter_options(self.remote_audit_logs, merge=True)
+            if self.filtered_logs is not self.remote_audit_logs:
+                self.filtered_logs = self.remote_audit_logs
+                self.update_table()
+            self.set_loading(False)
+            self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
+            return
+        if page != self.current_page:
+            return
+        self.filtered_logs = self.remote_audit_logs
+        self.update_filter_options(self.remote_audit_logs, merge=True)
+        self.set_loading(False)
+        self.update_table()
+        self.update_pagination()
+        self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
 
-            self.apply_filters()
+    def on_audit_logs_page_failed(self, message):
+        self.set_loading(False)
+        self.show_error_message("Erreur", message)
+
+    def on_audit_logs_loaded(self, result):
+        self._load_task = None
+        self.set_loading(False)
+        if result["success"]:
+            self._full_loaded = True
+            if self.merge_audit_logs(result) or self.filtered_logs is not self.audit_logs:
+                self.filtered_logs = self.audit_logs
+                self.show_filtered()  # Page courante conservée : seules les différences sont redessinées
+            self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
         else:
             self.show_error_message("Erreur", result["message"])
 
-    def apply_filters(self):
-        # Récupérer les valeurs des filtres
-        user_filter = self.user_filter.currentData()
-        action_filter = self.action_filter.currentData()
-        search_text = self.search_input.text().lower()
+    def merge_audit_logs(self, result):
+        """
+        Intègre le résultat de sync_audit_logs : le journal complet au premier
+        chargement, ensuite les seules nouvelles entrées, ajoutées sur place à
+        la collection, aux index et aux filtres. Renvoie True si le journal a changé.
+        """
+        if result["reset"]:
+            self.audit_logs = result["data"]
+            self.search_index.set_records(self.audit_logs)
+            self.date_index.set_records(self.audit_logs)
+            self.update_filter_options(self.audit_logs)
+            new = self.audit_logs
+        else:
+            # Entrées déjà reçues par une synchronisation concurrente (export) écartées
+            new = [log for log in result["data"] if (log.get("id") or 0) > (self.last_log_id or 0)]
+            if not new:
+                return False
+            if result["newest_first"]:
+                self.audit_logs[:0] = new
+            else:
+                self.audit_logs.extend(new)
+            self.search_index.add(new, first=result["newest_first"])
+            for log in new:
+                self.date_index.upsert(log)
+            self.update_filter_options(new, merge=True)
+        self.last_log_id = max((log.get("id") or 0 for log in new), default=self.last_log_id)
+        return True
+
+    def update_filter_options(self, logs, merge=False):
+        """
+        Met à jour les utilisateurs et actions proposés dans les filtres.
+        Avec merge=True (pages reçues, nouvelles entrées), les valeurs de `logs` s'ajoutent aux existantes.
+        """
+        # Extraire les utilisateurs et actions uniques pour les filtres
+        users = set()
+        actions = set()
+        for log in logs:
+            users.add(log.get("utilisateur_nom"))
+            actions.add(log.get("action", "N/A"))
+        if merge:
+            users.update(self.user_filter.itemData(i) for i in range(1, self.user_filter.count()))
+            actions.update(self.action_filter.itemData(i) for i in range(1, self.action_filter.count()))
+
+        # Mettre à jour les combobox de filtres (sans relancer le filtrage à chaque ajout)
+        current_user = self.user_filter.currentText()
+        current_action = self.action_filter.currentText()
+        self.user_filter.blockSignals(True)
+        self.action_filter.blockSignals(True)
+
+        self.user_filter.clear()
+        self.user_filter.addItem("Tous les utilisateurs", "tous")
+        for user in sorted(users):
+            self.user_filter.addItem(user, user)
 
-        # Filtrer les logs
-        self.filtered_logs = []
-        for log in self.audit_logs:
-            # Filtre par utilisateur
-            if user_filter != "tous" and log.get("utilisateur_nom", "Inconnu") != user_filter:
-                continue
+        self.action_filter.clear()
+        self.action_filter.addItem("Toutes les actions", "toutes")
+        for action in sorted(actions):
+            self.action_filter.addItem(action, action)
 
-            # Filtre par action
-            if action_filter != "toutes" and log.get("action", "N/A") != action_filter:
-                continue
+        # Restaurer les sélections précédentes si possible
+        user_index = self.user_filter.findText(current_user)
+        if user_index > 0:
+            self.user_filter.setCurrentIndex(user_index)
 
-            # Filtre par texte de recherche
-            searchable_text = (
-                    log.get("utilisateur_nom", "").lower() +
-                    log.get("utilisateur_email", "").lower() +
-                    log.get("action", "").lower() +
-                    log.get("date_heure", "").lower()
-            )
+        action_index = self.action_filter.findText(current_action)
+        if action_index > 0:
+            self.action_filter.setCurrentIndex(action_index)
 
-            if search_text and search_text not in searchable_text:
-                continue
+        self.user_filter.blockSignals(False)
+        self.action_filter.blockSignals(False)
 
-            self.filtered_logs.append(log)
+    def set_loading(self, loading):
+        self.refresh_btn.setEnabled(not loading)
+        if loading:
+            self.results_label.setText("⏳ Chargement du journal...")
+        else:
+            self.results_label.setText(f"{len(self.filtered_logs)} entrée(s) trouvée(s)")
 
+    def filters_active(self):
+        # Filtre ou tri : traitement local sur toute la collection
+        return (self.user_filter.currentData() != "tous" or self.action_filter.currentData() != "toutes"
+                or bool(self.search_input.text()) or self.period_filter.is_active()
+                or self.sort_header.is_active())
+
+    def apply_filters(self):
         self.current_page = 1  # Reset to first page when filters change
+        self.show_filtered()
+
+    def show_filtered(self):
+        """Recalcule le résultat filtré et l'affiche à la page courante."""
+        if not self.filters_active() and self.remote_audit_logs.is_ready():
+            # Aucun filtre : pagination côté serveur
+            self.filtered_logs = self.remote_audit_logs
+            self.update_table()
+            self.update_pagination()
+            self.results_label.setText(f"{len(self.filtered_logs)} entrée(s) trouvée(s)")
+            return
+        if self.filters_active() and not self._full_loaded and self._load_task is None:
+            # Le filtrage local porte sur toute la collection
+            self.set_loading(True)
+            self.load_all_audit_logs()
+
+        # Récupérer les valeurs des filtres
+        user_filter = self.user_filter.currentData()
+        action_filter = self.action_filter.currentData()
+
+        # Filtrer les logs (index construit au chargement, complété par les seules
+        # nouvelles entrées à chaque synchronisation ; affinage du résultat précédent)
+        self.filtered_logs = self.filter_engine.filter(
+            self.search_input.text(),
+            utilisateur=None if user_filter == "tous" else user_filter,
+            action=None if action_filter == "toutes" else action_filter,
+            periode=self.period_filter.period())
+        self.filtered_logs = self.sorter.sort(self.filtered_logs, self.sort_header.order)
+
+        total_pages = math.ceil(len(self.filtered_logs) / self.items_per_page) or 1
+        self.current_page = min(self.current_page, total_pages)
         self.update_table()
         self.update_pagination()
         self.results_label.setText(f"{len(self.filtered_logs)} entrée(s) trouvée(s)")
 
     def change_items_per_page(self, text):
+        continuous = text == CONTINUOUS
+        if continuous != self.continuous:
+            # Passage de/vers le défilement continu : tranches de CHUNK_SIZE lignes
+            self.continuous = continuous
+            if not continuous:
+                self.items_per_page = int(text)
+            self.remote_audit_logs.reset(CHUNK_SIZE if continuous else self.items_per_page)
+            self.apply_filters()
+            return
+        if continuous:
+            return
         self.items_per_page = int(text)
+        self.remote_audit_logs.reset(self.items_per_page)
         self.current_page = 1  # Reset to first page when items per page changes
         self.update_table()
         self.update_pagination()
 
+    @timed("journal.update_table")
     def update_table(self):
-        start_index = (self.current_page - 1) * self.items_per_page
-        end_index = start_index + self.items_per_page
-        paginated_logs = self.filtered_logs[start_index:end_index]
-
-        self.table.setRowCount(len(paginated_logs))
-
-        for i, log in enumerate(paginated_logs):
-            nom = log.get("utilisateur_nom", "Inconnu")
-            email = log.get("utilisateur_email", "Inconnu")
-            action = log.get("action", "N/A")
-            date_heure = log.get("date_heure", "")[:19]  # Format ISO
-
-            # Utilisateur
-            nom_item = QTableWidgetItem(nom)
-            self.table.setItem(i, 0, nom_item)
-
-            # Email
-            email_item = QTableWidgetItem(email)
-            self.table.setItem(i, 1, email_item)
-
-            # Action (avec couleur selon le type)
-            action_item = QTableWidgetItem(action)
-
-            # Coloration selon le type d'action
-            if "création" in action.lower() or "ajout" in action.lower():
-                action_item.setForeground(QColor("#27ae60"))  # Vert
-            elif "suppression" in action.lower() or "supprimer" in action.lower():
-                action_item.setForeground(QColor("#e74c3c"))  # Rouge
-            elif "modification" in action.lower() or "mise à jour" in action.lower():
-                action_item.setForeground(QColor("#f39c12"))  # Orange
-            elif "connexion" in action.lower() or "login" in action.lower():
-                action_item.setForeground(QColor("#3498db"))  # Bleu
-
-            self.table.setItem(i, 2, action_item)
-
-            # Date (formatée)
-            date_item = QTableWidgetItem(date_heure)
-            self.table.setItem(i, 3, date_item)
-
-            # Alternance des couleurs de ligne
-            if i % 2 == 0:
-                for j in range(self.table.columnCount()):
-                    if self.table.item(i, j):
-                        self.table.item(i, j).setBackground(QColor("#f8f9fa"))
+        if self.continuous:
+            # Sans pagination : la vue ne dessine que les lignes visibles et, côté
+            # serveur, le modèle demande les tranches au fil du défilement
+            self.model.set_rows(self.filtered_logs)
+        else:
+            start_index = (self.current_page - 1) * self.items_per_page
+            end_index = start_index + self.items_per_page
+            self.model.set_rows(self.filtered_logs[start_index:end_index])
+        self.pagination_widget.setVisible(not self.continuous)
 
     def update_pagination(self):
+        if self.continuous:
+            return  # Pagination masquée : inutile de recréer les boutons de page
         # Clear existing page buttons
         for i in reversed(range(self.page_buttons_layout.count())):
             widget = self.page_buttons_layout.itemAt(i).widget()
@@ -538,7 +723,6 @@ class JournalAuditWidget(QWidget):
 
     def refresh_data(self):
         self.load_audit_logs()
-        self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
 
         # Animation de rafraîchissement
         anim = QPropertyAnimation(self.table, b"windowOpacity")
@@ -549,21 +733,41 @@ class JournalAuditWidget(QWidget):
         anim.start()
 
     def export_data(self):
+        from PyQt5.QtWidgets import QFileDialog
+
+        # Demander à l'utilisateur où enregistrer le fichier
+        filename, _ = QFileDialog.getSaveFileName(
+            self, "Exporter les logs d'audit",
+            f"audit_logs_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+            "Fichiers Excel (*.xlsx)"
+        )
+
+        if not filename:
+            return
+
+        if self.filtered_logs is self.remote_audit_logs:
+            # Mode paginé : l'export porte sur tout le journal, pas seulement les pages
+            # reçues ; synchronisation en arrière-plan, export à la réception
+            self.export_btn.setEnabled(False)
+            self.export_btn.setText("⏳ Export...")
+            run_async(sync_audit_logs, after_id=self.last_log_id, owner=self,
+                      on_result=lambda result: self.on_export_logs_loaded(filename, result))
+            return
+        self.write_export(filename, self.filtered_logs)
+
+    def on_export_logs_loaded(self, filename, result):
+        self.export_btn.setEnabled(True)
+        self.export_btn.setText("📊 Exporter")
+        if not result["success"]:
+            self.show_error_message("Erreur", result["message"])
+            return
+        self.merge_audit_logs(result)
+        self.write_export(filename, self.audit_logs)
+
+    def write_export(self, filename, logs):
         try:
-            from PyQt5.QtWidgets import QFileDialog
             import openpyxl
             from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-            from openpyxl.utils import get_column_letter
-
-            # Demander à l'utilisateur où enregistrer le fichier
-            filename, _ = QFileDialog.getSaveFileName(
-                self, "Exporter les logs d'audit",
-                f"audit_logs_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                "Fichiers Excel (*.xlsx)"
-            )
-
-            if not filename:
-                return
 
             # Créer un nouveau classeur Excel
             wb = openpyxl.Workbook()
@@ -604,7 +808,7 @@ class JournalAuditWidget(QWidget):
                 cell.border = thin_border
 
             # Données
-            for row_num, log in enumerate(self.filtered_logs, 2):
+            for row_num, log in enumerate(logs, 2):
                 # Récupérer les données
                 nom = log.get("utilisateur_nom", "Inconnu")
                 email = log.get("utilisateur_email", "Inconnu")
@@ -648,7 +852,7 @@ class JournalAuditWidget(QWidget):
                 ws.column_dimensions[column].width = adjusted_width
 
             # Ajouter un filtre automatique
-            ws.auto_filter.ref = f"A1:D{len(self.filtered_logs) + 1}"
+            ws.auto_filter.ref = f"A1:D{len(logs) + 1}"
 
             # Ajouter un titre et des métadonnées
             ws['A1'].value = "JOURNAL D'AUDIT DES ACTIONS UTILISATEURS"
@@ -8,7 +8,14 @@ from PyQt5.QtGui import QColor, QFont, QBrush, QIcon
 import datetime
 import math
 
+from services.async_service import run_async
 from services.rapport_service import get_rapports, generer_rapport, telecharger_rapport, update_rapport, delete_rapport
+from services.sorting import Sorter, TEXT
+from services.metrics import timed
+from ui.remote_page_list import RemotePageList
+from ui.action_buttons_delegate import ActionButtonsDelegate
+from ui.optimistic import OptimisticActions
+from ui.sort_header import SortHeader
 from ui.modules.rapport_form_dialog import RapportFormDialog
 from services.auth_service import AuthService
 
@@ -18,9 +25,23 @@ class RapportsWidget(QWidget):
         super().__init__()
         self.user_role = AuthService.get_user_role()
         self.rapports = []
+        self.sorter = Sorter({
+            "periode": (lambda r: r.get("periode"), TEXT),
+            "type": (lambda r: r.get("type"), TEXT),
+            "fichier": (lambda r: r.get("nom_fichier"), TEXT),
+            "genere_par": (lambda r: r.get("genere_par_nom"), TEXT),
+            "statut": (lambda r: "Disponible" if r.get("nom_fichier") else "Non généré", TEXT),
+        })
         self.filtered_rapports = []
         self.current_page = 1
         self.items_per_page = 10
+        self._load_task = None
+        self._full_loaded = False
+        self.remote_rapports = RemotePageList(get_rapports, self.items_per_page, parent=self)
+        self.remote_rapports.page_loaded.connect(self.on_rapports_page_loaded)
+        self.remote_rapports.load_failed.connect(self.on_rapports_page_failed)
+        # Suppressions appliquées sans attendre le serveur
+        self.optimistic = OptimisticActions(self, self.load_rapports)
         self.setup_ui_style()
         self.init_ui()
         self.load_rapports()
@@ -190,6 +211,12 @@ class RapportsWidget(QWidget):
         self.table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         self.table.setShowGrid(False)
+        self.table.setItemDelegateForColumn(5, ActionButtonsDelegate(self.get_actions, self.table, 5))
+
+        # Tri sur toute la collection filtrée (clic sur l'en-tête)
+        self.sort_header = SortHeader(
+            self.table, {0: "periode", 1: "type", 2: "fichier", 3: "genere_par", 4: "statut"}, self)
+        self.sort_header.changed.connect(self.apply_filters)
 
         # Effet d'ombre
         shadow = QGraphicsDropShadowEffect()
@@ -274,8 +301,8 @@ class RapportsWidget(QWidget):
 
         status_bar.addStretch()
 
-        refresh_btn = QPushButton("🔄 Rafraîchir")
-        refresh_btn.setStyleSheet("""
+        self.refresh_btn = QPushButton("🔄 Rafraîchir")
+        self.refresh_btn.setStyleSheet("""
             QPushButton {
                 background-color: #ecf0f1;
                 color: #2c3e50;
@@ -287,22 +314,81 @@ class RapportsWidget(QWidget):
                 background-color: #d5dbdb;
             }
         """)
-        refresh_btn.setCursor(Qt.PointingHandCursor)
-        refresh_btn.clicked.connect(self.refresh_data)
-        status_bar.addWidget(refresh_btn)
+        self.refresh_btn.setCursor(Qt.PointingHandCursor)
+        self.refresh_btn.clicked.connect(self.refresh_data)
+        status_bar.addWidget(self.refresh_btn)
 
         layout.addLayout(status_bar)
 
     def load_rapports(self):
-        result = get_rapports()
+        # Sans filtre actif, seule la page affichée (et la suivante) est demandée au
+        # serveur ; la collection complète n'est chargée que pour filtrer localement.
+        if self._load_task is not None:
+            self._load_task.cancel()
+            self._load_task = None
+        self.set_loading(True)
+        if self.filters_active():
+            self.load_all_rapports()
+        else:
+            self._full_loaded = False
+            self.remote_rapports.reset()
+            self.remote_rapports.ensure_page(self.current_page)
+
+    def load_all_rapports(self):
+        self._load_task = run_async(get_rapports, on_result=self.on_rapports_loaded, owner=self)
+
+    def on_rapports_page_loaded(self, page):
+        # Une page du serveur est arrivée : redessiner si c'est celle affichée
+        if self.filters_active() or page != self.current_page:
+            return
+        self.filtered_rapports = self.remote_rapports
+        self.set_loading(False)
+        self.update_table()
+        self.update_pagination()
+        self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
+
+    def on_rapports_page_failed(self, message):
+        self.set_loading(False)
+        self.show_error_message("Erreur", message)
+
+    def on_rapports_loaded(self, result):
+        self._load_task = None
+        self.set_loading(False)
         if result["success"]:
+            self._full_loaded = True
             self.rapports = result["data"]
             self.filtered_rapports = self.rapports
             self.apply_filters()
+            self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
         else:
             self.show_error_message("Erreur", result["message"])
 
+    def set_loading(self, loading):
+        self.refresh_btn.setEnabled(not loading)
+        if loading:
+            self.results_label.setText("⏳ Chargement des rapports...")
+        else:
+            self.results_label.setText(f"{len(self.filtered_rapports)} rapport(s) trouvé(s)")
+
+    def filters_active(self):
+        # Filtre ou tri : traitement local sur toute la collection
+        return (self.type_filter.currentData() != "tous" or bool(self.search_input.text())
+                or self.sort_header.is_active())
+
     def apply_filters(self):
+        if not self.filters_active() and self.remote_rapports.is_ready():
+            # Aucun filtre : pagination côté serveur
+            self.filtered_rapports = self.remote_rapports
+            self.current_page = 1
+            self.update_table()
+            self.update_pagination()
+            self.results_label.setText(f"{len(self.filtered_rapports)} rapport(s) trouvé(s)")
+            return
+        if self.filters_active() and not self._full_loaded and self._load_task is None:
+            # Le filtrage local porte sur toute la collection
+            self.set_loading(True)
+            self.load_all_rapports()
+
         type_filter = self.type_filter.currentData()
         search_text = self.search_input.text().lower()
 
@@ -323,6 +409,8 @@ class RapportsWidget(QWidget):
 
             self.filtered_rapports.append(rapport)
 
+        self.filtered_rapports = self.sorter.sort(self.filtered_rapports, self.sort_header.order)
+
         self.current_page = 1  # Reset to first page when filters change
         self.update_table()
         self.update_pagination()
@@ -330,10 +418,12 @@ class RapportsWidget(QWidget):
 
     def change_items_per_page(self, text):
         self.items_per_page = int(text)
+        self.remote_rapports.reset(self.items_per_page)
         self.current_page = 1  # Reset to first page when items per page changes
         self.update_table()
         self.update_pagination()
 
+    @timed("rapports.update_table")
     def update_table(self):
         start_index = (self.current_page - 1) * self.items_per_page
         end_index = start_index + self.items_per_page
@@ -367,9 +457,10 @@ class RapportsWidget(QWidget):
                 statut_item.setForeground(QBrush(QColor("#e74c3c")))
             self.table.setItem(i, 4, statut_item)
 
-            # Actions
-            action_widget = self.create_action_widget(rapport)
-            self.table.setCellWidget(i, 5, action_widget)
+            # Actions (boutons dessinés par le délégué)
+            action_item = QTableWidgetItem()
+            action_item.setData(Qt.UserRole, rapport)
+            self.table.setItem(i, 5, action_item)
 
             # Alternance des couleurs de ligne
             if i % 2 == 0:
@@ -463,90 +554,25 @@ class RapportsWidget(QWidget):
         if self.current_page < total_pages:
             self.go_to_page(self.current_page + 1)
 
-    def create_action_widget(self, rapport):
-        action_widget = QWidget()
-        action_layout = QHBoxLayout(action_widget)
-        action_layout.setContentsMargins(5, 0, 5, 0)
-        action_layout.setSpacing(8)
+    def get_actions(self, rapport):
+        """
+        Boutons de la colonne « Actions » (dessinés par ActionButtonsDelegate) :
+        (liste de (libellé, couleur, callback, infobulle), texte si aucune action).
+        """
+        actions = []
 
         # Bouton Télécharger (visible si rapport disponible)
         if rapport.get("nom_fichier"):
-            download_btn = QPushButton("⬇ Télécharger")
-            download_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #3498db;
-                    color: white;
-                    padding: 5px 10px;
-                    border-radius: 3px;
-                    font-size: 12px;
-                    min-width: 100px;
-                    border: none;
-                }
-                QPushButton:hover {
-                    background-color: #2980b9;
-                    box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-                }
-                QPushButton:pressed {
-                    background-color: #1f618d;
-                }
-            """)
-            download_btn.setToolTip("Télécharger ce rapport")
-            download_btn.setCursor(Qt.PointingHandCursor)
-            download_btn.clicked.connect(lambda: self.telecharger_rapport(rapport["id"]))
-            action_layout.addWidget(download_btn)
+            actions.append(("⬇ Télécharger", "#3498db",
+                            lambda: self.telecharger_rapport(rapport["id"]), "Télécharger ce rapport"))
 
         # Boutons Modifier/Supprimer (seulement pour comptable)
         if self.user_role == "comptable":
-            modifier_btn = QPushButton("✏️ Modifier")
-            modifier_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #f39c12;
-                    color: white;
-                    padding: 5px 10px;
-                    border-radius: 3px;
-                    font-size: 12px;
-                    min-width: 80px;
-                    border: none;
-                }
-                QPushButton:hover {
-                    background-color: #e67e22;
-                    box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-                }
-                QPushButton:pressed {
-                    background-color: #d35400;
-                }
-            """)
-            modifier_btn.setToolTip("Modifier ce rapport")
-            modifier_btn.setCursor(Qt.PointingHandCursor)
-            modifier_btn.clicked.connect(lambda: self.modifier_rapport(rapport))
-            action_layout.addWidget(modifier_btn)
-
-            supprimer_btn = QPushButton("🗑 Supprimer")
-            supprimer_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #e74c3c;
-                    color: white;
-                    padding: 5px 10px;
-                    border-radius: 3px;
-                    font-size: 12px;
-                    min-width: 80px;
-                    border: none;
-                }
-                QPushButton:hover {
-                    background-color: #c0392b;
-                    box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-                }
-                QPushButton:pressed {
-                    background-color: #922b21;
-                }
-            """)
-            supprimer_btn.setToolTip("Supprimer ce rapport")
-            supprimer_btn.setCursor(Qt.PointingHandCursor)
-            supprimer_btn.clicked.connect(lambda: self.supprimer_rapport(rapport["id"]))
-            action_layout.addWidget(supprimer_btn)
-
-        action_layout.addStretch()
-        return action_widget
+            actions.append(("✏️ Modifier", "#f39c12",
+                            lambda: self.modifier_rapport(rapport), "Modifier ce rapport"))
+            actions.append(("🗑 Supprimer", "#e74c3c",
+                            lambda: self.supprimer_rapport(rapport), "Supprimer ce rapport"))
+        return actions, ""
 
     def setup_animations(self):
         self.anim = QPropertyAnimation(self.table, b"windowOpacity")
@@ -558,7 +584,6 @@ class RapportsWidget(QWidget):
 
     def refresh_data(self):
         self.load_rapports()
-        self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
 
         anim = QPropertyAnimation(self.table, b"windowOpacity")
         anim.setDuration(300)
@@ -589,19 +614,31 @@ class RapportsWidget(QWidget):
             self.refresh_data()
             self.show_success_message("Succès", "Le rapport a été modifié avec succès!")
 
-    def supprimer_rapport(self, rapport_id):
+    def supprimer_rapport(self, rapport):
         confirm = self.show_confirmation_dialog(
             "Confirmation de suppression",
             "Voulez-vous vraiment supprimer ce rapport ?",
             "Cette action est irréversible."
         )
         if confirm == QMessageBox.Yes:
-            result = delete_rapport(rapport_id)
-            if result["success"]:
-                self.show_success_message("Succès", "Le rapport a été supprimé avec succès!")
-                self.refresh_data()
-            else:
-                self.show_error_message("Erreur", result["message"])
+            # Retiré immédiatement, rétabli par rechargement si le serveur refuse
+            self.optimistic.run(delete_rapport, rapport["id"], done_message="Rapport supprimé.",
+                                apply=lambda: self.remove_rapport(rapport), rollback=self.load_rapports)
+
+    def remove_rapport(self, rapport):
+        """Retire un rapport de toutes les données affichées en conservant la page courante."""
+        self.remote_rapports.replace(rapport, None)
+        self.rapports = [r for r in self.rapports if r is not rapport]
+        if self.filtered_rapports is not self.remote_rapports:
+            page = self.current_page
+            self.apply_filters()
+            total_pages = math.ceil(len(self.filtered_rapports) / self.items_per_page) or 1
+            if min(page, total_pages) != self.current_page:
+                self.go_to_page(min(page, total_pages))
+            return
+        self.update_table()
+        self.update_pagination()
+        self.results_label.setText(f"{len(self.filtered_rapports)} rapport(s) trouvé(s)")
 
     def telecharger_rapport(self, rapport_id):
         path, _ = QFileDialog.getSaveFileName(
@@ -1,25 +1,61 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QPushButton, QTableWidget,
                              QTableWidgetItem, QHeaderView, QMessageBox, QHBoxLayout,
                              QLineEdit, QComboBox, QGraphicsDropShadowEffect)
-from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve
+from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QTimer
 from PyQt5.QtGui import QColor, QBrush
 
 from services.auth_service import AuthService
+from services.async_service import run_async
 from services.recette_service import get_recettes, delete_recette
+from services.local_store import local_store
+from services.metrics import timed
+from services.sorting import Sorter, TEXT, NUMBER, DATE
+from services.date_index import DateIndex
+from services.filter_engine import FilterEngine, DEBOUNCE_MS
+from services.search_index import SearchIndex
+from ui.remote_page_list import RemotePageList
+from ui.action_buttons_delegate import ActionButtonsDelegate
+from ui.date_range_filter import DateRangeFilter
+from ui.optimistic import OptimisticActions
+from ui.sort_header import SortHeader
 from ui.modules.recette_form_dialog import RecetteFormDialog, ModifierRecetteDialog
 import datetime
 import math
 
 
+def recette_search_fields(recette):
+    """Valeurs trouvables par la barre de recherche."""
+    return recette["date"], recette["source"], recette["type"], recette["montant"]
+
+
 class RecettesWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.user_role = AuthService.get_user_role()
         self.recettes = []
+        self.search_index = SearchIndex(recette_search_fields)
+        self.date_index = DateIndex(lambda r: r["date"])
+        self.filter_engine = FilterEngine(self.search_index, {"type": lambda r: r["type"]},
+                                          ranges={"periode": self.date_index})
+        self.sorter = Sorter({
+            "date": (lambda r: r["date"], DATE),
+            "source": (lambda r: r["source"], TEXT),
+            "type": (lambda r: r["type"], TEXT),
+            "montant": (lambda r: r["montant"], NUMBER),
+            "justificatif": (lambda r: r.get("justificatif"), TEXT),
+        })
         self.filtered_recettes = []
         self.current_page = 1
         self.items_per_page = 10
+        self._load_task = None
+        self._full_loaded = False
+        self.remote_recettes = RemotePageList(get_recettes, self.items_per_page, parent=self)
+        self.remote_recettes.page_loaded.connect(self.on_recettes_page_loaded)
+        self.remote_recettes.load_failed.connect(self.on_recettes_page_failed)
+        # Suppressions appliquées sans attendre le serveur
+        self.optimistic = OptimisticActions(self, self.load_recettes)
         self.setup_ui()
+        self.show_cached_recettes()
         self.load_recettes()
         self.setup_animations()
 
@@ -120,10 +156,20 @@ class RecettesWidget(QWidget):
                 background-color: white;
             }
         """)
-        self.search_input.textChanged.connect(self.apply_filters)
+        # Frappes rapides regroupées : le filtre n'est appliqué qu'après une pause
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.apply_filters)
+        self.search_input.textChanged.connect(lambda _: self.search_timer.start())
         filter_bar.addWidget(QLabel("Recherche:"))
         filter_bar.addWidget(self.search_input)
 
+        # Filtre par période (index trié des dates)
+        self.period_filter = DateRangeFilter()
+        self.period_filter.changed.connect(self.apply_filters)
+        filter_bar.addWidget(self.period_filter)
+
         filter_bar.addStretch()
 
         # Sélecteur d'éléments par page
@@ -185,6 +231,12 @@ class RecettesWidget(QWidget):
         self.table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         self.table.setShowGrid(False)
+        self.table.setItemDelegateForColumn(5, ActionButtonsDelegate(self.get_actions, self.table, 5))
+
+        # Tri sur toute la collection filtrée (clic sur l'en-tête)
+        self.sort_header = SortHeader(
+            self.table, {0: "date", 1: "source", 2: "type", 3: "montant", 4: "justificatif"}, self)
+        self.sort_header.changed.connect(self.apply_filters)
 
         # Ajouter un effet d'ombre
         shadow = QGraphicsDropShadowEffect()
@@ -272,8 +324,8 @@ class RecettesWidget(QWidget):
         status_bar.addStretch()
 
         # Bouton de rafraîchissement
-        refresh_btn = QPushButton("🔄 Rafraîchir")
-        refresh_btn.setStyleSheet("""
+        self.refresh_btn = QPushButton("🔄 Rafraîchir")
+        self.refresh_btn.setStyleSheet("""
             QPushButton {
                 background-color: #ecf0f1;
                 color: #2c3e50;
@@ -285,45 +337,114 @@ class RecettesWidget(QWidget):
                 background-color: #d5dbdb;
             }
         """)
-        refresh_btn.setCursor(Qt.PointingHandCursor)
-        refresh_btn.clicked.connect(self.refresh_data)
-        status_bar.addWidget(refresh_btn)
+        self.refresh_btn.setCursor(Qt.PointingHandCursor)
+        self.refresh_btn.clicked.connect(self.refresh_data)
+        status_bar.addWidget(self.refresh_btn)
 
         layout.addLayout(status_bar)
 
+    def show_cached_recettes(self):
+        # Affichage immédiat de la dernière version connue, revalidée ensuite par load_recettes
+        cached = local_store.load("recettes")
+        if cached:
+            self.recettes = cached
+            self.search_index.set_records(cached)
+            self.date_index.set_records(cached)
+            self.apply_filters()
+            self.update_label.setText("Données en cache - actualisation en cours...")
+
     def load_recettes(self):
-        result = get_recettes()
+        # Sans filtre actif, seule la page affichée (et la suivante) est demandée au
+        # serveur ; la collection complète n'est chargée que pour filtrer localement.
+        if self._load_task is not None:
+            self._load_task.cancel()
+            self._load_task = None
+        self.set_loading(True)
+        if self.filters_active():
+            self.load_all_recettes()
+        else:
+            self._full_loaded = False
+            self.remote_recettes.reset()
+            self.remote_recettes.ensure_page(self.current_page)
+
+    def load_all_recettes(self):
+        self._load_task = run_async(get_recettes, on_result=self.on_recettes_loaded, owner=self)
+
+    def on_recettes_page_loaded(self, page):
+        # Une page du serveur est arrivée : redessiner si c'est celle affichée
+        if self.filters_active() or page != self.current_page:
+            return
+        self.filtered_recettes = self.remote_recettes
+        self.set_loading(False)
+        self.update_table()
+        self.update_pagination()
+        self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
+
+    def on_recettes_page_failed(self, message):
+        self.set_loading(False)
+        self.show_error_message("Erreur", message)
+
+    def on_recettes_loaded(self, result):
+        self._load_task = None
+        self.set_loading(False)
         if result["success"]:
-            self.recettes = result["data"]
-            self.filtered_recettes = self.recettes
-            self.apply_filters()
+            self._full_loaded = True
+            if result["data"] != self.recettes:
+                self.patch_recettes(result["data"])
+            self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
         else:
             self.show_error_message("Erreur", result["message"])
 
-    def apply_filters(self):
-        # Récupérer les valeurs des filtres
-        type_filter = self.type_filter.currentData()
-        search_text = self.search_input.text().lower()
+    def patch_recettes(self, recettes):
+        """Remplace les données affichées en conservant la page courante."""
+        self.recettes = recettes
+        self.search_index.set_records(recettes)
+        self.date_index.set_records(recettes)
+        self.show_filtered()
+
+    def show_filtered(self):
+        """Réapplique les filtres en conservant la page courante."""
+        page = self.current_page
+        self.apply_filters()
+        total_pages = math.ceil(len(self.filtered_recettes) / self.items_per_page) or 1
+        if min(page, total_pages) != self.current_page:
+            self.go_to_page(min(page, total_pages))
 
-        # Filtrer les recettes
-        self.filtered_recettes = []
-        for recette in self.recettes:
-            # Filtre par type
-            if type_filter != "tous" and recette["type"] != type_filter:
-                continue
+    def set_loading(self, loading):
+        self.refresh_btn.setEnabled(not loading)
+        if loading:
+            self.results_label.setText("⏳ Chargement des recettes...")
+        else:
+            self.results_label.setText(f"{len(self.filtered_recettes)} recette(s) trouvée(s)")
+
+    def filters_active(self):
+        # Filtre ou tri : traitement local sur toute la collection
+        return (self.type_filter.currentData() != "tous" or bool(self.search_input.text())
+                or self.period_filter.is_active() or self.sort_header.is_active())
 
-            # Filtre par texte de recherche
-            searchable_text = (
-                    recette["date"].lower() +
-                    recette["source"].lower() +
-                    recette["type"].lower() +
-                    str(recette["montant"])
-            )
+    def apply_filters(self):
+        if not self.filters_active() and self.remote_recettes.is_ready():
+            # Aucun filtre : pagination côté serveur
+            self.filtered_recettes = self.remote_recettes
+            self.current_page = 1
+            self.update_table()
+            self.update_pagination()
+            self.results_label.setText(f"{len(self.filtered_recettes)} recette(s) trouvée(s)")
+            return
+        if self.filters_active() and not self._full_loaded and self._load_task is None:
+            # Le filtrage local porte sur toute la collection
+            self.set_loading(True)
+            self.load_all_recettes()
 
-            if search_text and search_text not in searchable_text:
-                continue
+        # Récupérer les valeurs des filtres
+        type_filter = self.type_filter.currentData()
 
-            self.filtered_recettes.append(recette)
+        # Filtrer les recettes (affinage du résultat précédent si possible)
+        self.filtered_recettes = self.filter_engine.filter(
+            self.search_input.text(),
+            type=None if type_filter == "tous" else type_filter,
+            periode=self.period_filter.period())
+        self.filtered_recettes = self.sorter.sort(self.filtered_recettes, self.sort_header.order)
 
         self.current_page = 1  # Reset to first page when filters change
         self.update_table()
@@ -332,10 +453,12 @@ class RecettesWidget(QWidget):
 
     def change_items_per_page(self, text):
         self.items_per_page = int(text)
+        self.remote_recettes.reset(self.items_per_page)
         self.current_page = 1  # Reset to first page when items per page changes
         self.update_table()
         self.update_pagination()
 
+    @timed("recettes.update_table")
     def update_table(self):
         start_index = (self.current_page - 1) * self.items_per_page
         end_index = start_index + self.items_per_page
@@ -366,9 +489,10 @@ class RecettesWidget(QWidget):
             justif_item = QTableWidgetItem(justificatif)
             self.table.setItem(i, 4, justif_item)
 
-            # Actions
-            action_widget = self.create_action_widget(recette)
-            self.table.setCellWidget(i, 5, action_widget)
+            # Actions (boutons dessinés par le délégué)
+            action_item = QTableWidgetItem()
+            action_item.setData(Qt.UserRole, recette)
+            self.table.setItem(i, 5, action_item)
 
             # Alternance des couleurs de ligne
             if i % 2 == 0:
@@ -462,72 +586,18 @@ class RecettesWidget(QWidget):
         if self.current_page < total_pages:
             self.go_to_page(self.current_page + 1)
 
-    def create_action_widget(self, recette):
-        action_widget = QWidget()
-        action_layout = QHBoxLayout(action_widget)
-        action_layout.setContentsMargins(5, 0, 5, 0)
-        action_layout.setSpacing(8)
-
-        # Bouton Modifier
-        modifier_btn = QPushButton("✏️ Modifier")
-        modifier_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                padding: 5px 10px;
-                border-radius: 3px;
-                font-size: 12px;
-                min-width: 80px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-                box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-            }
-            QPushButton:pressed {
-                background-color: #1f618d;
-            }
-        """)
-        modifier_btn.setToolTip("Modifier cette recette")
-        modifier_btn.setCursor(Qt.PointingHandCursor)
-        modifier_btn.clicked.connect(lambda: self.modifier_recette(recette))
-        action_layout.addWidget(modifier_btn)
-
-        # Désactiver création pour CSA & Directeur
-        if self.user_role in ["directeur", "csa"]:
-            modifier_btn.setVisible(False)
-
-        # Bouton Supprimer
-        supprimer_btn = QPushButton("🗑 Supprimer")
-        supprimer_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                padding: 5px 10px;
-                border-radius: 3px;
-                font-size: 12px;
-                min-width: 80px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-                box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-            }
-            QPushButton:pressed {
-                background-color: #922b21;
-            }
-        """)
-        supprimer_btn.setToolTip("Supprimer cette recette")
-        supprimer_btn.setCursor(Qt.PointingHandCursor)
-        supprimer_btn.clicked.connect(lambda: self.supprimer_recette(recette))
-        action_layout.addWidget(supprimer_btn)
-
-        # Désactiver création pour CSA & Directeur
+    def get_actions(self, recette):
+        """
+        Boutons de la colonne « Actions » (dessinés par ActionButtonsDelegate) :
+        (liste de (libellé, couleur, callback, infobulle), texte si aucune action).
+        """
+        # Désactiver modification et suppression pour CSA & Directeur
         if self.user_role in ["directeur", "csa"]:
-            supprimer_btn.setVisible(False)
-
-        action_layout.addStretch()
-        return action_widget
+            return [], ""
+        return [
+            ("✏️ Modifier", "#3498db", lambda: self.modifier_recette(recette), "Modifier cette recette"),
+            ("🗑 Supprimer", "#e74c3c", lambda: self.supprimer_recette(recette), "Supprimer cette recette"),
+        ], ""
 
     def darken_color(self, hex_color, amount=20):
         color = QColor(hex_color)
@@ -545,7 +615,6 @@ class RecettesWidget(QWidget):
 
     def refresh_data(self):
         self.load_recettes()
-        self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
 
         # Animation de rafraîchissement
         anim = QPropertyAnimation(self.table, b"windowOpacity")
@@ -683,9 +752,44 @@ class RecettesWidget(QWidget):
             f"Montant: {recette['montant']:,.2f} F - Cette action est irréversible."
         )
         if confirm == QMessageBox.Yes:
-            result = delete_recette(recette['budget'])
-            if result["success"]:
-                self.show_success_message("Succès", "La recette a été supprimée avec succès!")
-                self.refresh_data()
-            else:
-                self.show_error_message("Erreur", result["message"])
\ No newline at end of file
+            # Retirée immédiatement, rétablie à sa place si le serveur refuse
+            positions = []
+            self.optimistic.run(delete_recette, recette['id'], done_message="Recette supprimée.",
+                                apply=lambda: positions.extend(self.remove_recette(recette)),
+                                rollback=lambda: self.restore_recette(recette, *positions))
+
+    def remove_recette(self, recette):
+        """
+        Retire une recette de toutes les données affichées.
+        Renvoie ses positions (collection complète, pages du serveur), ou None.
+        """
+        remote_rank = self.remote_recettes.replace(recette, None)
+        rank = self.search_index.rank_of(recette["id"])
+        if rank is not None and rank < len(self.recettes) and self.recettes[rank] is recette:
+            # Index mis à jour pour ce seul élément (les listes reçues sont partagées : copie)
+            self.recettes = self.recettes[:rank] + self.recettes[rank + 1:]
+            self.search_index.remove(recette["id"])
+            self.date_index.remove(recette)
+        else:
+            rank = None
+        self.show_replaced()
+        return rank, remote_rank
+
+    def restore_recette(self, recette, rank, remote_rank):
+        """Annulation d'une suppression : la recette revient à ses positions d'origine."""
+        if remote_rank is not None:
+            self.remote_recettes.insert(remote_rank, recette)
+        if rank is not None and recette["id"] not in self.search_index:
+            self.recettes = self.recettes[:rank] + [recette] + self.recettes[rank:]
+            self.search_index.upsert(recette, rank)
+            self.date_index.upsert(recette)
+        self.show_replaced()
+
+    def show_replaced(self):
+        # Page affichée redessinée après une modification locale
+        if self.filtered_recettes is not self.remote_recettes:
+            self.show_filtered()
+            return
+        self.update_table()
+        self.update_pagination()
+        self.results_label.setText(f"{len(self.filtered_recettes)} recette(s) trouvée(s)")
\ No newline at end of file
@@ -5,6 +5,8 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve
 from PyQt5.QtGui import QColor, QFont, QBrush
 
+from ui.action_buttons_delegate import ActionButtonsDelegate
+from ui.optimistic import OptimisticActions
 from ui.modules.utilisateur_form_dialog import UtilisateurFormDialog
 from services.utilisateur_service import get_utilisateurs, delete_utilisateur
 from services.auth_service import AuthService
@@ -14,6 +16,8 @@ class UtilisateursWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.user_role = AuthService.get_user_role()
+        # Suppressions appliquées sans attendre le serveur
+        self.optimistic = OptimisticActions(self, self.load_utilisateurs)
         self.setup_ui_style()
         self.init_ui()
         self.load_utilisateurs()
@@ -120,6 +124,7 @@ class UtilisateursWidget(QWidget):
         self.table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         self.table.setShowGrid(False)
+        self.table.setItemDelegateForColumn(4, ActionButtonsDelegate(self.get_actions, self.table, 4))
 
         # Effet d'ombre
         shadow = QGraphicsDropShadowEffect()
@@ -168,9 +173,10 @@ class UtilisateursWidget(QWidget):
                 date_item.setTextAlignment(Qt.AlignCenter)
                 self.table.setItem(i, 3, date_item)
 
-                # Actions
-                action_widget = self.create_action_widget(utilisateur)
-                self.table.setCellWidget(i, 4, action_widget)
+                # Actions (boutons dessinés par le délégué)
+                action_item = QTableWidgetItem()
+                action_item.setData(Qt.UserRole, utilisateur)
+                self.table.setItem(i, 4, action_item)
 
                 # Alternance des couleurs de ligne
                 if i % 2 == 0:
@@ -183,80 +189,25 @@ class UtilisateursWidget(QWidget):
         # Fin de l'animation de chargement
         self.stop_loading_animation()
 
-    def create_action_widget(self, utilisateur):
-        action_widget = QWidget()
-        action_layout = QHBoxLayout(action_widget)
-        action_layout.setContentsMargins(5, 0, 5, 0)
-        action_layout.setSpacing(8)
-
-        # Bouton Modifier
-        modifier_btn = QPushButton("✏️ Modifier")
-        modifier_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f39c12;
-                color: white;
-                padding: 5px 10px;
-                border-radius: 3px;
-                font-size: 12px;
-                min-width: 80px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #e67e22;
-                box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-            }
-            QPushButton:pressed {
-                background-color: #d35400;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-            }
-        """)
-        modifier_btn.setToolTip("Modifier cet utilisateur")
-        modifier_btn.setCursor(Qt.PointingHandCursor)
-        modifier_btn.clicked.connect(lambda _, u=utilisateur: self.open_edit_dialog(u))
-
-        # Désactiver si pas admin
-        if self.user_role == "comptable" and "directeur" and "csa":
-            modifier_btn.setVisible(False)
-
-        action_layout.addWidget(modifier_btn)
-
-        # Bouton Supprimer
-        supprimer_btn = QPushButton("🗑 Supprimer")
-        supprimer_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                padding: 5px 10px;
-                border-radius: 3px;
-                font-size: 12px;
-                min-width: 80px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-                box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-            }
-            QPushButton:pressed {
-                background-color: #922b21;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-            }
-        """)
-        supprimer_btn.setToolTip("Supprimer cet utilisateur")
-        supprimer_btn.setCursor(Qt.PointingHandCursor)
-        supprimer_btn.clicked.connect(lambda _, u_id=utilisateur["id"]: self.supprimer_utilisateur(u_id))
-
-        # Désactiver si pas admin ou si c'est le compte actuel
+    def get_actions(self, utilisateur):
+        """
+        Boutons de la colonne « Actions » (dessinés par ActionButtonsDelegate) :
+        (liste de (libellé, couleur, callback, infobulle), texte si aucune action).
+        Un callback None dessine le bouton grisé.
+        """
+        actions = []
+
+        # Bouton Modifier, masqué si pas admin
+        if not (self.user_role == "comptable" and "directeur" and "csa"):
+            actions.append(("✏️ Modifier", "#f39c12",
+                            lambda: self.open_edit_dialog(utilisateur), "Modifier cet utilisateur"))
+
+        # Bouton Supprimer, désactivé si pas admin ou si c'est le compte actuel
+        supprimer = lambda: self.supprimer_utilisateur(utilisateur)
         if self.user_role != "comptable" or utilisateur["id"] == AuthService.user_data.get("id"):
-            supprimer_btn.setEnabled(False)
-
-        action_layout.addWidget(supprimer_btn)
-
-        action_layout.addStretch()
-        return action_widget
+            supprimer = None
+        actions.append(("🗑 Supprimer", "#e74c3c", supprimer, "Supprimer cet utilisateur"))
+        return actions, ""
 
     def start_loading_animation(self):
         self.create_btn.setEnabled(False)
@@ -306,19 +257,23 @@ class UtilisateursWidget(QWidget):
             self.load_utilisateurs()
             self.show_success_message("Succès", "Utilisateur modifié avec succès!")
 
-    def supprimer_utilisateur(self, utilisateur_id):
+    def supprimer_utilisateur(self, utilisateur):
         reply = self.show_confirmation_dialog(
             "Confirmation de suppression",
             "Voulez-vous vraiment supprimer cet utilisateur ?",
             "Cette action est irréversible."
         )
         if reply == QMessageBox.Yes:
-            result = delete_utilisateur(utilisateur_id)
-            if result["success"]:
-                self.show_success_message("Succès", "Utilisateur supprimé avec succès!")
-                self.load_utilisateurs()
-            else:
-                self.show_error_message("Erreur", result["message"])
+            # Ligne retirée immédiatement, rétablie par rechargement si le serveur refuse
+            self.optimistic.run(delete_utilisateur, utilisateur["id"], done_message="Utilisateur supprimé.",
+                                apply=lambda: self.remove_utilisateur(utilisateur), rollback=self.load_utilisateurs)
+
+    def remove_utilisateur(self, utilisateur):
+        for row in range(self.table.rowCount()):
+            item = self.table.item(row, 4)
+            if item is not None and item.data(Qt.UserRole) == utilisateur:
+                self.table.removeRow(row)
+                return
 
     def show_error_message(self, title, message):
         msg = QMessageBox(self)
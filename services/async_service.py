@@ -0,0 +1,120 @@
+# services/async_service.py
+"""
+Exécution des appels de service hors du thread GUI.
+
+Les fonctions des services (get_depenses, get_audit_logs, ...) sont bloquantes.
+run_async() les exécute dans un QThreadPool et renvoie leur résultat dans le
+thread GUI via un signal Qt, ce qui évite de figer la fenêtre pendant les
+allers-retours vers l'API.
+"""
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+
+from services.auth_service import AuthService
+
+_pool = None
+_active_tasks = set()  # Références conservées jusqu'à la livraison du résultat
+
+
+def get_thread_pool():
+    """
+    Pool de threads dédié aux services. Sa taille suit celle du pool HTTP
+    pour ne jamais lancer plus d'appels simultanés que de connexions disponibles.
+    """
+    global _pool
+    if _pool is None:
+        _pool = QThreadPool()
+        _pool.setMaxThreadCount(AuthService.POOL_SIZE)
+    return _pool
+
+
+class TaskSignals(QObject):
+    """
+    Signaux d'une tâche. L'objet est créé (et vit) dans le thread GUI :
+    le résultat émis depuis le thread de travail lui parvient donc en
+    connexion différée, et `finished` est ré-émis dans le thread GUI.
+    """
+    _done = pyqtSignal(object)
+    finished = pyqtSignal(object)
+    cancelled = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.is_cancelled = False
+        self._done.connect(self._deliver)
+
+    @pyqtSlot(object)
+    def _deliver(self, result):
+        if not self.is_cancelled:
+            self.finished.emit(result)
+
+
+class ServiceTask(QRunnable):
+    """
+    Tâche exécutant une fonction de service dans le pool.
+    Le résultat (le dict {"success": ..., ...} habituel) est transmis par
+    `signals.finished`. Une tâche annulée ne livre jamais son résultat.
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = TaskSignals()
+        self.owner = None
+        self.signals.finished.connect(self._release)
+        self.signals.cancelled.connect(self._release)
+
+    def run(self):
+        if self.signals.is_cancelled:
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            result = {"success": False, "message": str(e)}
+        self.signals._done.emit(result)
+
+    def cancel(self):
+        """
+        Annule la tâche : retirée de la file si elle n'a pas démarré,
+        résultat ignoré si l'appel réseau est déjà en cours.
+        """
+        if self.signals.is_cancelled:
+            return
+        self.signals.is_cancelled = True
+        get_thread_pool().tryTake(self)
+        self.signals.cancelled.emit()
+
+    def is_cancelled(self):
+        return self.signals.is_cancelled
+
+    def _release(self, *_):
+        _active_tasks.discard(self)
+        if self.owner is not None:
+            # Sinon chaque tâche terminée reste connectée (et référencée) jusqu'à la
+            # destruction de l'owner
+            try:
+                self.owner.destroyed.disconnect(self.cancel)
+            except (TypeError, RuntimeError):
+                pass  # owner déjà détruit (annulation par destroyed)
+            self.owner = None
+
+
+def run_async(fn, *args, on_result=None, owner=None, **kwargs):
+    """
+    Lance `fn(*args, **kwargs)` dans le pool de threads et retourne la tâche.
+
+    - on_result : appelé dans le thread GUI avec le résultat de `fn`
+    - owner     : QObject dont la destruction annule automatiquement la tâche
+                  (évite de mettre à jour un widget déjà fermé)
+    """
+    task = ServiceTask(fn, *args, **kwargs)
+    if on_result is not None:
+        task.signals.finished.connect(on_result)
+    if owner is not None:
+        task.owner = owner
+        owner.destroyed.connect(task.cancel)
+    _active_tasks.add(task)
+    get_thread_pool().start(task)
+    return task
@@ -1,13 +1,147 @@
-import requests
+import threading
+
 from services.auth_service import AuthService
+from services.local_store import local_store
+from services.pagination import fetch_all, fetch_page, forget_page
 
 BASE_URL = f"{AuthService.BASE_URL}/journal/"
 
-def get_audit_logs():
-    try:
-        response = requests.get(BASE_URL, headers=AuthService.get_headers())
-        if response.status_code == 200:
-            return {"success": True, "data": response.json()}
-        return {"success": False, "message": response.text}
-    except Exception as e:
-        return {"success": False, "message": str(e)}
+JOURNAL_ENTITY = "journal"
+SINCE_PARAM = "since_id"  # Filtre de l'API : entrées d'id strictement supérieur
+
+# Journal synchronisé conservé en mémoire entre deux rafraîchissements
+_journal = {"owner": None, "rows": None, "last_id": None}
+_journal_lock = threading.Lock()
+
+
+def get_audit_logs(page=None, page_size=None):
+    """
+    Récupère le journal d'audit.
+    Sans `page`, toute la collection est récupérée (liens "next" suivis) ;
+    avec `page`, seule cette page est demandée (voir services.pagination.fetch_page).
+    """
+    if page is not None:
+        return fetch_page(BASE_URL, page, page_size)
+    return fetch_all(BASE_URL)
+
+
+def forget_audit_logs_page(page, page_size):
+    """Libère le cache HTTP d'une page retirée de l'affichage (défilement continu)."""
+    forget_page(BASE_URL, page, page_size)
+
+
+def _log_id(log):
+    return log.get("id") or 0
+
+
+def _newest(rows):
+    """Entrée la plus récente (id le plus grand) d'une liste du journal."""
+    return max(rows, key=_log_id, default=None)
+
+
+def _fetch_since(last_id):
+    """
+    Entrées d'id strictement supérieur à `last_id`.
+
+    Si l'API ignore SINCE_PARAM, elle renvoie aussi des entrées déjà connues :
+    elles sont écartées ici et, pour un journal trié du plus récent au plus
+    ancien, le parcours des pages s'arrête à la première entrée connue (les
+    pages suivantes sont plus anciennes). Trié dans l'autre sens, le journal
+    doit être parcouru en entier ; un avertissement le signale.
+    """
+    ignored = []
+
+    def reached_known(page_rows):
+        if not page_rows or min(_log_id(page_rows[0]), _log_id(page_rows[-1])) > last_id:
+            return False  # Page triée : aucune entrée connue
+        ignored.append(True)
+        # Plus récent en tête (ou dernière page d'un seul élément) : la suite est déjà connue
+        return len(page_rows) == 1 or _log_id(page_rows[0]) > _log_id(page_rows[-1])
+
+    result = fetch_all(BASE_URL, params={SINCE_PARAM: last_id}, until=reached_known)
+    if not result["success"]:
+        return result
+    new = [log for log in result["data"] if _log_id(log) > last_id]
+    if ignored or len(new) < len(result["data"]):
+        print(f"⚠️ Journal d'audit : le paramètre {SINCE_PARAM} semble ignoré par l'API "
+              f"({len(result['data'])} entrées reçues pour {len(new)} nouvelles).")
+    return {"success": True, "data": new}
+
+
+def _newest_first(rows):
+    """Vrai si le journal est trié du plus récent au plus ancien (ordre de l'API)."""
+    return len(rows) > 1 and _log_id(rows[0]) > _log_id(rows[-1])
+
+
+def _newer_than(rows, after_id, newest_first):
+    """Entrées d'id supérieur à `after_id`, lues depuis l'extrémité la plus récente du journal."""
+    count = 0
+    for log in (rows if newest_first else reversed(rows)):
+        if _log_id(log) <= after_id:
+            break
+        count += 1
+    if newest_first:
+        return rows[:count]
+    return rows[len(rows) - count:]
+
+
+def sync_audit_logs(full=False, after_id=None):
+    """
+    Synchronisation incrémentale du journal d'audit.
+
+    Le journal ne fait que grandir : seules les entrées plus récentes que la
+    dernière connue (id mémorisé dans le cache local) sont demandées à l'API
+    puis ajoutées, sur place, au journal conservé en mémoire et au cache
+    local. `full=True` force un rechargement complet.
+
+    `after_id` est la dernière entrée déjà détenue par l'appelant : seules les
+    entrées plus récentes lui sont renvoyées, de sorte que le coût d'un
+    rafraîchissement dépend du nombre de nouvelles entrées, pas de la taille
+    du journal. Sans `after_id`, tout le journal est renvoyé (copie).
+
+    Retourne {"success": True, "data": entrées, "reset": True si "data" est
+    le journal complet, "newest_first": True si les entrées vont en tête}.
+    """
+    with _journal_lock:
+        owner = AuthService.get_user_email()
+        rows, last_id = None, None
+        if not full:
+            if _journal["owner"] == owner and _journal["rows"] is not None:
+                rows, last_id = _journal["rows"], _journal["last_id"]
+            else:
+                rows = local_store.load(JOURNAL_ENTITY)
+                last_id = local_store.get_meta(JOURNAL_ENTITY, "last_id")
+                last_id = int(last_id) if rows is not None and last_id else None
+
+        if last_id is None:
+            result = fetch_all(BASE_URL)
+            if not result["success"]:
+                return result
+            rows = list(result["data"])
+            new = rows
+            local_store.save(JOURNAL_ENTITY, rows)
+        else:
+            result = _fetch_since(last_id)
+            if not result["success"]:
+                return result
+            new = result["data"]
+            if new:
+                # Conserver l'ordre de l'API (plus récent en tête ou en fin)
+                prepend = _newest_first(rows)
+                if prepend:
+                    rows[:0] = new
+                else:
+                    rows.extend(new)
+                local_store.merge(JOURNAL_ENTITY, new, prepend=prepend)
+
+        newest = _newest(new)
+        if newest is not None:
+            last_id = newest.get("id") or last_id
+            local_store.set_meta(JOURNAL_ENTITY, "last_id", str(last_id))
+
+        _journal.update(owner=owner, rows=rows, last_id=last_id)
+        newest_first = _newest_first(rows)
+        if after_id is None:
+            return {"success": True, "data": list(rows), "reset": True, "newest_first": newest_first}
+        return {"success": True, "data": _newer_than(rows, after_id, newest_first), "reset": False,
+                "newest_first": newest_first}
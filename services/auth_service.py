@@ -1,19 +1,81 @@
 import requests
+from requests.adapters import HTTPAdapter
+
+from services.json_codec import ACCEPT_ENCODING
+
 
 class AuthService:
     BASE_URL = "http://localhost:8000/api"
+    POOL_SIZE = 10  # Connexions keep-alive conservées vers l'API
     temp_email = None
     token = None
     user_data = {}
+    _session = None
+    _response_hooks = []
 
     @classmethod
     def get_headers(cls):
         return {"Authorization": f"Bearer {cls.token}"} if cls.token else {}
 
+    # 🔹 Session HTTP partagée par tous les services
+    @classmethod
+    def get_session(cls):
+        """
+        Retourne l'unique session HTTP de l'application.
+        Les connexions TCP vers l'API sont réutilisées (keep-alive) et
+        l'en-tête Authorization est porté par la session elle-même.
+        Les réponses compressées (gzip/deflate, brotli si disponible) sont acceptées.
+        """
+        if cls._session is None:
+            session = requests.Session()
+            cls._mount_adapters(session, cls.POOL_SIZE)
+            session.headers.update(cls.get_headers())
+            session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+            session.hooks["response"].extend(cls._response_hooks)
+            cls._session = session
+        return cls._session
+
+    @classmethod
+    def add_response_hook(cls, hook):
+        """
+        Enregistre un hook requests appelé après chaque réponse de la session
+        (invalidation du cache, mesures, ...).
+        """
+        if hook in cls._response_hooks:
+            return
+        cls._response_hooks.append(hook)
+        if cls._session is not None:
+            cls._session.hooks["response"].append(hook)
+
+    @classmethod
+    def configure_pool(cls, pool_size):
+        """
+        Modifie la taille du pool de connexions (utile si plusieurs écrans
+        chargent leurs données en parallèle).
+        """
+        cls.POOL_SIZE = max(1, int(pool_size))
+        if cls._session is not None:
+            cls._mount_adapters(cls._session, cls.POOL_SIZE)
+
+    @staticmethod
+    def _mount_adapters(session, pool_size):
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+    @classmethod
+    def _set_token(cls, token):
+        cls.token = token
+        session = cls.get_session()
+        if token:
+            session.headers["Authorization"] = f"Bearer {token}"
+        else:
+            session.headers.pop("Authorization", None)
+
     @classmethod
     def login(cls, email, password):
         try:
-            response = requests.post(f"{cls.BASE_URL}/login/", json={
+            response = cls.get_session().post(f"{cls.BASE_URL}/login/", json={
                 "email": email,
                 "password": password
             })
@@ -27,13 +89,13 @@ class AuthService:
     @classmethod
     def verify_code(cls, code):
         try:
-            response = requests.post(f"{cls.BASE_URL}/login/2fa/", json={
+            response = cls.get_session().post(f"{cls.BASE_URL}/login/2fa/", json={
                 "email": cls.temp_email,
                 "code": code
             })
             if response.status_code == 200:
                 data = response.json()
-                cls.token = data.get("access")
+                cls._set_token(data.get("access"))
                 cls.user_data = data.get("user", {})  # {"nom": "Faty", "role": "Comptable", ...}
                 print(f"🔵 USER DATA = {cls.user_data}")
                 return {"success": True, "message": "Connexion réussie."}
@@ -44,7 +106,7 @@ class AuthService:
     @classmethod
     def resend_code(cls):
         try:
-            response = requests.post(f"{cls.BASE_URL}/2fa/resend/", json={"email": cls.temp_email})
+            response = cls.get_session().post(f"{cls.BASE_URL}/2fa/resend/", json={"email": cls.temp_email})
             if response.status_code == 200:
                 return {"success": True, "message": "Nouveau code envoyé."}
             return {"success": False, "message": response.json().get("error", "Erreur lors du renvoi.")}
@@ -67,13 +129,13 @@ class AuthService:
     @classmethod
     def logout(cls):
         cls.user_data = {}
-        cls.token = None
+        cls._set_token(None)
         cls.temp_email = None
 
     @classmethod
     def refresh_user_data(cls):
         try:
-            response = requests.get(f"{cls.BASE_URL}/me/", headers=cls.get_headers())
+            response = cls.get_session().get(f"{cls.BASE_URL}/me/")
             if response.status_code == 200:
                 cls.user_data = response.json()
         except Exception as e:
@@ -83,7 +145,7 @@ class AuthService:
 def update_my_account(data):
     try:
         url = f"{AuthService.BASE_URL}/me/update/"
-        response = requests.put(url, json=data, headers=AuthService.get_headers())
+        response = AuthService.get_session().put(url, json=data)
         if response.status_code in (200, 204):
             return {"success": True}
         return {"success": False, "message": response.text}
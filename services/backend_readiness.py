@@ -0,0 +1,118 @@
+# services/backend_readiness.py
+"""
+Attente du backend Django lancé par wrapper_main.py.
+
+`runserver` met plusieurs secondes à écouter sur un poste lent : une requête
+envoyée trop tôt échoue (connexion refusée). backend.start() interroge l'API
+dans un thread dédié, avec un délai croissant entre les tentatives
+(FIRST_DELAY, x BACKOFF, plafonné à MAX_DELAY), pendant que Qt s'initialise :
+- progress(tentative, secondes écoulées) à chaque échec ;
+- ready() dès que le serveur répond (n'importe quel code HTTP) ;
+- failed(message) si le processus du serveur s'arrête ou après BOOT_TIMEOUT.
+Si le serveur n'a pas pu être lancé, launch_failed(message) signale l'échec
+tout de suite, sans attente.
+
+Les actions qui ont besoin du serveur (connexion) passent par
+backend.when_ready(callback) : exécutées immédiatement si le serveur répond
+déjà, sinon mises en file jusqu'à la fin de l'attente (succès ou échec :
+en cas d'échec, la requête part quand même et affiche l'erreur habituelle).
+
+Sans appel à start() (application lancée par main.py, serveur démarré à part),
+le serveur est considéré comme prêt.
+"""
+import threading
+import time
+
+import requests
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from services.auth_service import AuthService
+
+FIRST_DELAY = 0.1      # Secondes avant la deuxième tentative
+BACKOFF = 1.5          # Facteur d'allongement du délai entre deux tentatives
+MAX_DELAY = 0.5        # Délai maximal entre deux tentatives (connexion refusée : peu coûteux)
+REQUEST_TIMEOUT = 2.0  # Délai d'une tentative (serveur qui accepte sans répondre)
+BOOT_TIMEOUT = 90.0    # Abandon de l'attente (premier lancement sur un poste lent : migrations...)
+
+IDLE, WAITING, READY, FAILED = "idle", "waiting", "ready", "failed"
+
+
+class BackendReadiness(QObject):
+    progress = pyqtSignal(int, float)
+    ready = pyqtSignal()
+    failed = pyqtSignal(str)
+    _finished = pyqtSignal(bool, str)  # Émis par le thread de sondage, reçu dans le thread GUI
+
+    def __init__(self, url=None):
+        super().__init__()
+        self.url = url or f"{AuthService.BASE_URL}/"
+        self.state = IDLE
+        self.message = ""
+        self.callbacks = []
+        self._finished.connect(self._on_finished)
+
+    def start(self, process=None, timeout=BOOT_TIMEOUT):
+        """
+        Lance le sondage en arrière-plan. `process` (subprocess.Popen du
+        serveur) permet de détecter un serveur arrêté sans attendre `timeout`.
+        """
+        if self.state == WAITING:
+            return
+        self.state = WAITING
+        threading.Thread(target=self._probe, args=(process, timeout),
+                         name="backend-readiness", daemon=True).start()
+
+    def launch_failed(self, message):
+        """Serveur non lancé (wrapper_main.start_backend) : rien à attendre, échec signalé."""
+        if self.state != WAITING:
+            self._on_finished(False, message)
+
+    def is_waiting(self):
+        return self.state == WAITING
+
+    def has_failed(self):
+        return self.state == FAILED
+
+    def when_ready(self, callback):
+        if self.state == WAITING:
+            self.callbacks.append(callback)
+        else:
+            callback()
+
+    def _probe(self, process, timeout):
+        start = time.monotonic()
+        delay = FIRST_DELAY
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                requests.get(self.url, timeout=REQUEST_TIMEOUT)
+                self._finished.emit(True, f"Serveur prêt en {time.monotonic() - start:.1f} s.")
+                return
+            except requests.RequestException:
+                pass
+            elapsed = time.monotonic() - start
+            if process is not None and process.poll() is not None:
+                self._finished.emit(False, f"Le serveur s'est arrêté au démarrage (code {process.returncode}).")
+                return
+            if elapsed >= timeout:
+                self._finished.emit(False, f"Le serveur ne répond pas après {timeout:.0f} s.")
+                return
+            self.progress.emit(attempt, elapsed)
+            time.sleep(delay)
+            delay = min(delay * BACKOFF, MAX_DELAY)
+
+    def _on_finished(self, ok, message):
+        self.state = READY if ok else FAILED
+        self.message = message
+        print(("[OK] " if ok else "[ERREUR] ") + message)
+        if ok:
+            self.ready.emit()
+        else:
+            self.failed.emit(message)
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+backend = BackendReadiness()
@@ -0,0 +1,64 @@
+# services/batch.py
+"""
+Actions groupées (validation, suppression...) sur plusieurs éléments.
+
+run_batch() applique une fonction de service à chaque identifiant, avec au
+plus BATCH_CONCURRENCY requêtes simultanées (jamais plus que de connexions
+dans le pool HTTP), et regroupe les réponses en un seul résultat :
+
+    {"success": aucun échec,
+     "data": {"succeeded": [ids], "failed": [(id, message)], "cancelled": [ids]},
+     "message": résumé}
+
+La fonction est bloquante : les écrans l'exécutent via run_async.
+"""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from services.auth_service import AuthService
+
+BATCH_CONCURRENCY = 4  # Requêtes simultanées : le serveur traite chaque mutation séparément
+
+
+def run_batch(fn, ids, *args, progress=None, should_stop=None, concurrency=BATCH_CONCURRENCY, **kwargs):
+    """
+    Exécute fn(id, *args, **kwargs) pour chaque identifiant de `ids`.
+
+    - progress    : appelé avec (traités, total) après chaque réponse
+    - should_stop : appelé après chaque réponse ; s'il renvoie True, les
+                    éléments pas encore envoyés sont abandonnés ("cancelled")
+    """
+    ids = list(ids)
+    results = {}
+    cancelled = []
+    if ids:
+        executor = ThreadPoolExecutor(max_workers=max(1, min(concurrency, AuthService.POOL_SIZE, len(ids))))
+        try:
+            futures = {executor.submit(fn, item_id, *args, **kwargs): item_id for item_id in ids}
+            for done, future in enumerate(as_completed(futures), 1):
+                if future.cancelled():
+                    continue
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    results[futures[future]] = {"success": False, "message": str(e)}
+                if progress is not None:
+                    progress(done, len(ids))
+                if should_stop is not None and should_stop():
+                    cancelled = [item_id for item, item_id in futures.items() if item.cancel()]
+        finally:
+            executor.shutdown(wait=True)
+
+    # Résultats dans l'ordre des identifiants reçus
+    succeeded = [item_id for item_id in ids if item_id in results and results[item_id].get("success")]
+    failed = [(item_id, results[item_id].get("message") or "Erreur inconnue")
+              for item_id in ids if item_id in results and not results[item_id].get("success")]
+    message = f"{len(succeeded)} élément(s) traité(s) sur {len(ids)}."
+    if failed:
+        message += f" {len(failed)} échec(s)."
+    if cancelled:
+        message += f" {len(cancelled)} annulé(s)."
+    return {
+        "success": not failed and not cancelled,
+        "data": {"succeeded": succeeded, "failed": failed, "cancelled": cancelled},
+        "message": message,
+    }
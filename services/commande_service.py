@@ -1,16 +1,18 @@
-import requests
 from services.auth_service import AuthService
+from services.batch import run_batch
+from services.pagination import fetch_all, fetch_page
 
 BASE_URL = f"{AuthService.BASE_URL}/commandes/"
 
-def get_commandes():
-    try:
-        response = requests.get(BASE_URL, headers=AuthService.get_headers())
-        if response.status_code == 200:
-            return {"success": True, "data": response.json()}
-        return {"success": False, "message": response.text}
-    except Exception as e:
-        return {"success": False, "message": str(e)}
+def get_commandes(page=None, page_size=None):
+    """
+    Récupère la liste des commandes.
+    Sans `page`, toute la collection est récupérée (liens "next" suivis) ;
+    avec `page`, seule cette page est demandée (voir services.pagination.fetch_page).
+    """
+    if page is not None:
+        return fetch_page(BASE_URL, page, page_size)
+    return fetch_all(BASE_URL, entity="commandes")
 
 
 def create_commande(data):
@@ -19,10 +21,9 @@ def create_commande(data):
         if not data.get('fournisseur'):
             return {"success": False, "message": "Le fournisseur est obligatoire"}
 
-        response = requests.post(
+        response = AuthService.get_session().post(
             BASE_URL,
-            json=data,
-            headers=AuthService.get_headers()
+            json=data
         )
 
         if response.status_code == 201:
@@ -34,7 +35,7 @@ def create_commande(data):
 def delete_commande(commande_id):
     try:
         url = f"{BASE_URL}{commande_id}/"
-        response = requests.delete(url, headers=AuthService.get_headers())
+        response = AuthService.get_session().delete(url)
         if response.status_code in (200, 204):
             return {"success": True}
         return {"success": False, "message": response.text}
@@ -44,7 +45,7 @@ def delete_commande(commande_id):
 def valider_commande(commande_id, statut):
     try:
         url = f"{BASE_URL}{commande_id}/valider/"
-        response = requests.post(url, json={"statut": statut}, headers=AuthService.get_headers())
+        response = AuthService.get_session().post(url, json={"statut": statut})
         if response.status_code == 200:
             return {"success": True}
         return {"success": False, "message": response.text}
@@ -52,12 +53,24 @@ def valider_commande(commande_id, statut):
         return {"success": False, "message": str(e)}
 
 
+def valider_commandes(commande_ids, statut, progress=None, should_stop=None):
+    """
+    Validation groupée de plusieurs commandes (voir services.batch.run_batch).
+    """
+    return run_batch(valider_commande, commande_ids, statut, progress=progress, should_stop=should_stop)
+
+def delete_commandes(commande_ids, progress=None, should_stop=None):
+    """
+    Suppression groupée de plusieurs commandes (voir services.batch.run_batch).
+    """
+    return run_batch(delete_commande, commande_ids, progress=progress, should_stop=should_stop)
+
+
 def update_commande(commande_id, data):
     try:
-        response = requests.put(
+        response = AuthService.get_session().put(
             f"{BASE_URL}{commande_id}/",
-            json=data,
-            headers=AuthService.get_headers()
+            json=data
         )
         if response.status_code == 200:
             return {"success": True, "data": response.json()}
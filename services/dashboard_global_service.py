@@ -1,31 +1,60 @@
-import requests
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
 from services.auth_service import AuthService
+from services.pagination import fetch_all
+
+BASE_URL = AuthService.BASE_URL
+DASHBOARD_TIMEOUT = 15  # Délai commun (en secondes) aux trois requêtes du dashboard
+ENDPOINTS = ("budgets", "recettes", "depenses")
 
-BASE_URL = "http://localhost:8000/api"
 
-def get_dashboard_data():
+def get_dashboard_data(timeout=DASHBOARD_TIMEOUT):
     """
     Récupère les budgets, recettes et dépenses pour calculer le dashboard global.
+    Les trois requêtes partent en parallèle et partagent la même échéance :
+    le temps d'attente est celui de la plus lente, pas leur somme.
     """
     headers = AuthService.get_headers()
 
     if not headers.get("Authorization"):
         return {"success": False, "message": "Aucun token d'authentification. Veuillez vous reconnecter."}
 
+    deadline = time.monotonic() + timeout
+    executor = ThreadPoolExecutor(max_workers=len(ENDPOINTS))
     try:
-        budgets = requests.get(f"{BASE_URL}/budgets/", headers=headers).json()
-        recettes = requests.get(f"{BASE_URL}/recettes/", headers=headers).json()
-        depenses = requests.get(f"{BASE_URL}/depenses/", headers=headers).json()
+        futures = {
+            name: executor.submit(fetch_all, f"{BASE_URL}/{name}/", entity=name, deadline=deadline)
+            for name in ENDPOINTS
+        }
+        _, pending = wait(futures.values(), timeout=max(0, deadline - time.monotonic()))
+        if pending:
+            return {"success": False, "message": "Le serveur met trop de temps à répondre."}
+
+        results = {name: future.result() for name, future in futures.items()}
+        for result in results.values():
+            if not result["success"] or not isinstance(result["data"], list):
+                return {"success": False, "message": "Erreur lors de la récupération des données."}
 
-        if not isinstance(budgets, list) or not isinstance(recettes, list) or not isinstance(depenses, list):
-            return {"success": False, "message": "Erreur lors de la récupération des données."}
+        # Agrégation en une seule passe par réponse
+        total_budget = 0
+        budgets_en_cours = 0
+        budgets_clotures = 0
+        for b in results["budgets"]["data"]:
+            total_budget += b.get("montant_total", 0)
+            statut = b.get("statut")
+            if statut == "en_cours":
+                budgets_en_cours += 1
+            elif statut == "cloture":
+                budgets_clotures += 1
 
-        total_budget = sum(b.get("montant_total", 0) for b in budgets)
-        total_recettes = sum(r.get("montant", 0) for r in recettes)
-        total_depenses = sum(d.get("montant", 0) for d in depenses)
+        total_recettes = 0
+        for r in results["recettes"]["data"]:
+            total_recettes += r.get("montant", 0)
 
-        budgets_en_cours = len([b for b in budgets if b.get("statut") == "en_cours"])
-        budgets_clotures = len([b for b in budgets if b.get("statut") == "cloture"])
+        total_depenses = 0
+        for d in results["depenses"]["data"]:
+            total_depenses += d.get("montant", 0)
 
         taux_utilisation = round((total_depenses / total_budget * 100), 2) if total_budget else 0
 
@@ -43,3 +72,6 @@ def get_dashboard_data():
 
     except Exception as e:
         return {"success": False, "message": f"Erreur : {str(e)}"}
+    finally:
+        # Ne pas attendre les requêtes abandonnées après l'échéance
+        executor.shutdown(wait=False)
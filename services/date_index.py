@@ -0,0 +1,114 @@
+# services/date_index.py
+"""
+Index trié des dates d'une collection, pour les filtres par période.
+
+Les dates sont analysées une fois (services.sorting.date_key) et gardées
+triées : une requête « entre le 1er et le 31 mars » se fait par dichotomie,
+en O(log n + k) pour k éléments trouvés, au lieu de parcourir et comparer
+les chaînes de date de toute la collection.
+"""
+import bisect
+import datetime
+
+from services.search_index import default_key
+from services.sorting import date_key
+
+INSERT_LIMIT = 500  # Au-delà, reconstruire l'index est plus rapide que des insertions
+
+
+class DateIndex:
+    """
+    field(élément) renvoie la date de l'élément (chaîne ISO, "jj/mm/aaaa"...).
+    Les éléments sans date lisible ne sont jamais trouvés par between().
+    """
+
+    def __init__(self, field, key=None):
+        self.field = field
+        self.key = key or default_key
+        self.version = 0
+        self._source = None
+        self._count = None    # Taille de la collection indexée (None : jamais indexée)
+        self._known = set()   # identités des éléments indexés
+        self._dates = []      # dates triées
+        self._elements = []   # éléments, dans l'ordre de self._dates
+
+    def __len__(self):
+        return len(self._dates)
+
+    def set_records(self, records):
+        """Indexe la collection ; de nouveaux éléments seuls sont insérés à leur place."""
+        if records is self._source:
+            return
+        records = list(records) if records is not None else []
+        new = [element for element in records if id(element) not in self._known]
+        if self._count is not None and len(records) - len(new) == self._count and len(new) <= INSERT_LIMIT:
+            # Synchronisation : seuls des éléments ont été ajoutés
+            for element in new:
+                self._insert(element)
+        else:
+            dated = [(date_key(self.field(element)), rank, element) for rank, element in enumerate(records)]
+            dated = sorted(item for item in dated if item[0] is not None)
+            self._dates = [value for value, _, _ in dated]
+            self._elements = [element for _, _, element in dated]
+        self._source = records
+        self._count = len(records)
+        self._known = {id(element) for element in records}
+        self.version += 1
+
+    def upsert(self, element, old=None):
+        """
+        Met à jour un seul élément sans reparcourir la collection : `element`
+        remplace `old` (modification) ou s'ajoute (création, retrait annulé).
+        """
+        if old is not None:
+            self._discard(old)
+        if id(element) not in self._known:
+            self._insert(element)
+            self._known.add(id(element))
+            self._count = (self._count or 0) + 1
+        self._source = None
+        self.version += 1
+
+    def remove(self, element):
+        """Retire un seul élément (suppression)."""
+        if self._discard(element):
+            self._source = None
+            self.version += 1
+
+    def _insert(self, element):
+        value = date_key(self.field(element))
+        if value is not None:
+            position = bisect.bisect_right(self._dates, value)
+            self._dates.insert(position, value)
+            self._elements.insert(position, element)
+
+    def _discard(self, element):
+        if id(element) not in self._known:
+            return False
+        self._known.discard(id(element))
+        self._count -= 1
+        value = date_key(self.field(element))
+        if value is not None:
+            # Parmi les éléments de même date, retrouver celui-ci (identité)
+            for position in range(bisect.bisect_left(self._dates, value), bisect.bisect_right(self._dates, value)):
+                if self._elements[position] is element:
+                    del self._dates[position]
+                    del self._elements[position]
+                    break
+        return True
+
+    def between(self, start, end):
+        """
+        Éléments datés du jour `start` au jour `end` inclus (datetime.date,
+        None = sans borne), du plus ancien au plus récent.
+        """
+        low, high = 0, len(self._dates)
+        if start is not None:
+            low = bisect.bisect_left(self._dates, datetime.datetime.combine(start, datetime.time.min))
+        if end is not None:
+            end = datetime.datetime.combine(end + datetime.timedelta(days=1), datetime.time.min)
+            high = bisect.bisect_left(self._dates, end)
+        return self._elements[low:high]
+
+    def keys_between(self, start, end):
+        return {self.key(element) for element in self.between(start, end)}
@@ -1,5 +1,6 @@
-import requests
 from services.auth_service import AuthService
+from services.batch import run_batch
+from services.pagination import fetch_all
 
 BASE_URL = f"{AuthService.BASE_URL}/demandes/"
 
@@ -7,17 +8,11 @@ def get_demandes_depense():
     """
     Récupère la liste des demandes de dépense.
     """
-    try:
-        response = requests.get(BASE_URL, headers=AuthService.get_headers())
-        if response.status_code == 200:
-            return {"success": True, "data": response.json()}
-        return {"success": False, "message": response.text}
-    except Exception as e:
-        return {"success": False, "message": str(e)}
+    return fetch_all(BASE_URL)
 
 def create_demande_depense(data):
     try:
-        response = requests.post(BASE_URL, json=data, headers=AuthService.get_headers())
+        response = AuthService.get_session().post(BASE_URL, json=data)
         if response.status_code == 201:
             # Si le backend ne renvoie pas de message, on force un message par défaut
             return {"success": True, "message": "Demande de dépense créée avec succès."}
@@ -31,7 +26,7 @@ def valider_demande_depense(demande_id, statut, commentaire=None):
     if commentaire:
         data["commentaire"] = commentaire
     try:
-        response = requests.post(url, json=data, headers=AuthService.get_headers())
+        response = AuthService.get_session().post(url, json=data)
         if response.status_code == 200:
             return {"success": True, "message": response.json().get("message", "Traitement effectué.")}
         else:
@@ -45,7 +40,7 @@ def valider_demande_depense(demande_id, statut, commentaire=None):
 def delete_demande_depense(demande_id):
         url = f"{BASE_URL}{demande_id}/"
         try:
-            response = requests.delete(url, headers=AuthService.get_headers())
+            response = AuthService.get_session().delete(url)
             if response.status_code in (200, 204):
                 return {"success": True, "message": "Demande supprimée avec succès."}
             return {"success": False, "message": response.text}
@@ -58,9 +53,22 @@ def update_demande_depense(demande_id, data, files=None):
     """
     url = f"{BASE_URL}{demande_id}/"
     try:
-        response = requests.put(url, data=data, files=files, headers=AuthService.get_headers())
+        response = AuthService.get_session().put(url, data=data, files=files)
         if response.status_code in (200, 204):
             return {"success": True, "message": "Dépense mise à jour avec succès."}
         return {"success": False, "message": response.text}
     except Exception as e:
         return {"success": False, "message": str(e)}
+
+def valider_demandes_depense(demande_ids, statut, commentaire=None, progress=None, should_stop=None):
+    """
+    Approbation ou refus groupé de plusieurs demandes (voir services.batch.run_batch).
+    """
+    return run_batch(valider_demande_depense, demande_ids, statut, commentaire,
+                     progress=progress, should_stop=should_stop)
+
+def delete_demandes_depense(demande_ids, progress=None, should_stop=None):
+    """
+    Suppression groupée de plusieurs demandes (voir services.batch.run_batch).
+    """
+    return run_batch(delete_demande_depense, demande_ids, progress=progress, should_stop=should_stop)
@@ -1,26 +1,29 @@
-import requests
 from services.auth_service import AuthService
+from services.batch import run_batch
+from services.pagination import fetch_all, fetch_page, forget_page
 
 BASE_URL = f"{AuthService.BASE_URL}/depenses/"
 
-def get_depenses():
+def get_depenses(page=None, page_size=None):
     """
     Récupère la liste des dépenses.
+    Sans `page`, toute la collection est récupérée (liens "next" suivis) ;
+    avec `page`, seule cette page est demandée (voir services.pagination.fetch_page).
     """
-    try:
-        response = requests.get(BASE_URL, headers=AuthService.get_headers())
-        if response.status_code == 200:
-            return {"success": True, "data": response.json()}
-        return {"success": False, "message": response.text}
-    except Exception as e:
-        return {"success": False, "message": str(e)}
+    if page is not None:
+        return fetch_page(BASE_URL, page, page_size)
+    return fetch_all(BASE_URL, entity="depenses")
+
+def forget_depenses_page(page, page_size):
+    """Libère le cache HTTP d'une page retirée de l'affichage (défilement continu)."""
+    forget_page(BASE_URL, page, page_size)
 
 def create_depense(data, files=None):
     """
     Crée une nouvelle dépense (Comptable).
     """
     try:
-        response = requests.post(BASE_URL, data=data, files=files, headers=AuthService.get_headers())
+        response = AuthService.get_session().post(BASE_URL, data=data, files=files)
         if response.status_code in (200, 201):
             return {"success": True, "message": "Dépense enregistrée avec succès."}
         return {"success": False, "message": response.text}
@@ -33,7 +36,7 @@ def update_depense(depense_id, data, files=None):
     """
     url = f"{BASE_URL}{depense_id}/"
     try:
-        response = requests.put(url, data=data, files=files, headers=AuthService.get_headers())
+        response = AuthService.get_session().put(url, data=data, files=files)
         if response.status_code in (200, 204):
             return {"success": True, "message": "Dépense mise à jour avec succès."}
         return {"success": False, "message": response.text}
@@ -46,7 +49,7 @@ def delete_depense(depense_id):
     """
     url = f"{BASE_URL}{depense_id}/"
     try:
-        response = requests.delete(url, headers=AuthService.get_headers())
+        response = AuthService.get_session().delete(url)
         if response.status_code in (200, 204):
             return {"success": True, "message": "Dépense supprimée avec succès."}
         return {"success": False, "message": response.text}
@@ -63,7 +66,7 @@ def superviser_depense(depense_id, commentaire=None):
     if commentaire:
         data["commentaire"] = commentaire
     try:
-        response = requests.post(url, json=data, headers=AuthService.get_headers())
+        response = AuthService.get_session().post(url, json=data)
         if response.status_code == 200:
             return {"success": True, "message": "Supervision effectuée."}
         return {"success": False, "message": response.text}
@@ -79,9 +82,29 @@ def valider_depense(depense_id, statut, commentaire=None):
     if commentaire:
         payload["commentaire"] = commentaire
     try:
-        response = requests.post(url, json=payload, headers=AuthService.get_headers())
+        response = AuthService.get_session().post(url, json=payload)
         if response.status_code == 200:
             return {"success": True, "message": f"Dépense {statut}."}
         return {"success": False, "message": response.text}
     except Exception as e:
-        return {"success": False, "message": str(e)}
\ No newline at end of file
+        return {"success": False, "message": str(e)}
+
+def superviser_depenses(depense_ids, commentaire=None, progress=None, should_stop=None):
+    """
+    Supervision groupée de plusieurs dépenses (voir services.batch.run_batch).
+    """
+    return run_batch(superviser_depense, depense_ids, commentaire,
+                     progress=progress, should_stop=should_stop)
+
+def valider_depenses(depense_ids, statut, commentaire=None, progress=None, should_stop=None):
+    """
+    Validation ou rejet groupé de plusieurs dépenses (voir services.batch.run_batch).
+    """
+    return run_batch(valider_depense, depense_ids, statut, commentaire,
+                     progress=progress, should_stop=should_stop)
+
+def delete_depenses(depense_ids, progress=None, should_stop=None):
+    """
+    Suppression groupée de plusieurs dépenses (voir services.batch.run_batch).
+    """
+    return run_batch(delete_depense, depense_ids, progress=progress, should_stop=should_stop)
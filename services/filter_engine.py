@@ -0,0 +1,120 @@
+# services/filter_engine.py
+"""
+Moteur de filtrage incrémental des écrans de liste.
+
+Combine la recherche texte (services.search_index), les filtres par liste
+déroulante (statut, utilisateur, action...) et les périodes
+(services.date_index) en réutilisant le résultat précédent :
+- la requête prolonge la précédente ("four" -> "fourn", ajout d'un mot ou
+  d'un filtre, période réduite) : seul le résultat précédent est affiné ;
+- des caractères sont effacés : le résultat déjà calculé pour cette requête
+  est réutilisé, sinon il est recalculé depuis la collection complète.
+
+Les frappes rapides sont regroupées côté écran : le filtre n'est appliqué
+qu'après DEBOUNCE_MS sans nouvelle frappe.
+"""
+from services.search_index import normalize
+
+DEBOUNCE_MS = 250   # Pause de frappe avant application du filtre
+HISTORY_SIZE = 64   # Résultats mémorisés (retour arrière dans la recherche)
+REFINE_LIMIT = 2000  # Au-delà, l'index est plus rapide qu'un test élément par élément
+
+
+class FilterEngine:
+    """
+    criteria : nom -> fonction(élément) renvoyant la valeur comparée au filtre.
+    ranges : nom -> DateIndex, filtré par une période (début, fin).
+    filter(query, nom=valeur, ...) ; une valeur None désactive le filtre.
+    """
+
+    def __init__(self, index, criteria=None, ranges=None):
+        self.index = index
+        self.criteria = criteria or {}
+        self.ranges = ranges or {}
+        self._version = None
+        self.reset()
+
+    def reset(self):
+        self._words = ()
+        self._selected = {}
+        self._result = None
+        self._history = {}
+
+    def filter(self, query, **selected):
+        """Éléments correspondant à la recherche et aux filtres, dans l'ordre de la collection."""
+        words = tuple(normalize(query).split())
+        selected = {name: value for name, value in selected.items() if value is not None}
+        version = (self.index.version,) + tuple(index.version for index in self.ranges.values())
+        if version != self._version:
+            # Collection modifiée : les résultats mémorisés ne sont plus valables
+            self.reset()
+            self._version = version
+
+        key = (words, tuple(sorted(selected.items())))
+        result = self._history.get(key)
+        if result is None:
+            if self._result is not None and self._narrows(words, selected):
+                result = self._refine(words, selected)
+            else:
+                result = self._compute(words, selected)
+            if len(self._history) >= HISTORY_SIZE:
+                self._history.clear()
+            self._history[key] = result
+
+        self._words, self._selected, self._result = words, selected, result
+        return result
+
+    def _compute(self, words, selected):
+        periods = [name for name in selected if name in self.ranges]
+        if periods and not words:
+            # Sans texte recherché, on part des seuls éléments de la période
+            name = periods[0]
+            elements = self.index.ordered(self.ranges[name].between(*selected[name]))
+            return self._select(elements, {n: v for n, v in selected.items() if n != name})
+        return self._select(self.index.search(" ".join(words)), selected)
+
+    def _narrows(self, words, selected):
+        # Chaque ancien mot doit être contenu dans un nouveau mot, les anciens
+        # filtres conservés et les périodes réduites : le nouveau résultat est
+        # inclus dans le précédent.
+        for name, value in selected.items():
+            old = self._selected.get(name)
+            if old is None or old == value:
+                continue
+            if name not in self.ranges or not self._within(value, old):
+                return False
+        if any(name not in selected for name in self._selected):
+            return False
+        return all(any(old in new for new in words) for old in self._words)
+
+    @staticmethod
+    def _within(period, old):
+        start, end = period
+        old_start, old_end = old
+        return ((old_start is None or (start is not None and start >= old_start))
+                and (old_end is None or (end is not None and end <= old_end)))
+
+    def _refine(self, words, selected):
+        previous = self._result
+        if words != self._words:
+            if len(previous) > REFINE_LIMIT:
+                # Résultat précédent large : l'index donne les clés, il reste à les croiser
+                keys = self.index.keys_matching(" ".join(words))
+                previous = [element for element in previous if self.index.key(element) in keys]
+            else:
+                previous = [element for element in previous if self.index.matches(element, words)]
+        changed = {name: value for name, value in selected.items() if self._selected.get(name) != value}
+        return self._select(previous, changed)
+
+    def _select(self, elements, selected):
+        if not selected:
+            return elements
+        tests = [self._test(name, value) for name, value in selected.items()]
+        return [element for element in elements if all(test(element) for test in tests)]
+
+    def _test(self, name, value):
+        if name in self.ranges:
+            keys = self.ranges[name].keys_between(*value)
+            return lambda element: self.index.key(element) in keys
+        get = self.criteria[name]
+        return lambda element: get(element) == value
@@ -1,30 +1,34 @@
-import requests
 from services.auth_service import AuthService
+from services.pagination import fetch_all, fetch_page
 
 BASE_URL = f"{AuthService.BASE_URL}/fournisseurs/"
 
-def get_fournisseurs():
-    response = requests.get(BASE_URL, headers=AuthService.get_headers())
-    if response.status_code == 200:
-        return {"success": True, "data": response.json()}
-    return {"success": False, "message": response.text}
+def get_fournisseurs(page=None, page_size=None):
+    """
+    Récupère la liste des fournisseurs.
+    Sans `page`, toute la collection est récupérée (liens "next" suivis) ;
+    avec `page`, seule cette page est demandée (voir services.pagination.fetch_page).
+    """
+    if page is not None:
+        return fetch_page(BASE_URL, page, page_size)
+    return fetch_all(BASE_URL, entity="fournisseurs")
 
 def create_fournisseur(data):
-    response = requests.post(BASE_URL, json=data, headers=AuthService.get_headers())
+    response = AuthService.get_session().post(BASE_URL, json=data)
     if response.status_code in (200, 201):
         return {"success": True}
     return {"success": False, "message": response.text}
 
 def update_fournisseur(fournisseur_id, data):
     url = f"{BASE_URL}{fournisseur_id}/"
-    response = requests.put(url, json=data, headers=AuthService.get_headers())
+    response = AuthService.get_session().put(url, json=data)
     if response.status_code in (200, 204):
         return {"success": True}
     return {"success": False, "message": response.text}
 
 def delete_fournisseur(fournisseur_id):
     url = f"{BASE_URL}{fournisseur_id}/"
-    response = requests.delete(url, headers=AuthService.get_headers())
+    response = AuthService.get_session().delete(url)
     if response.status_code in (200, 204):
         return {"success": True}
     return {"success": False, "message": response.text}
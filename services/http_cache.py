@@ -0,0 +1,222 @@
+# services/http_cache.py
+"""
+Cache HTTP conditionnel (ETag / Last-Modified) pour les endpoints de liste.
+
+Chaque réponse 200 porteuse de validateurs est mémorisée avec ses données déjà
+décodées. Les requêtes suivantes envoient If-None-Match / If-Modified-Since :
+si le serveur répond 304, les objets déjà décodés sont réutilisés sans
+re-télécharger ni re-parser la liste.
+
+Les requêtes identiques sont de plus regroupées (single-flight) : si un écran
+demande une collection déjà en cours de téléchargement, il attend la réponse
+de l'appel en cours au lieu d'en lancer un second. Une réponse reste ensuite
+« fraîche » pendant FRESHNESS_WINDOW secondes, sans aucun aller-retour réseau ;
+toute écriture (POST, PUT, PATCH, DELETE) met fin à cette fraîcheur.
+
+Les données renvoyées sont partagées entre les appels : les appelants doivent
+les considérer en lecture seule (copier un enregistrement avant de le modifier).
+"""
+import threading
+import time
+
+from services.auth_service import AuthService
+from services.json_codec import decode_response
+from services.metrics import metrics, endpoint_name
+
+FRESHNESS_WINDOW = 2.0  # Secondes pendant lesquelles une réponse est réutilisée telle quelle
+
+
+class CacheEntry:
+    __slots__ = ("etag", "last_modified", "data")
+
+    def __init__(self, etag, last_modified, data):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.data = data
+
+
+class ResponseCache:
+    """
+    Validateurs et données décodées, indexés par (url, paramètres).
+    Le cache est vidé automatiquement quand le jeton change (déconnexion,
+    autre utilisateur), les données dépendant des droits de l'utilisateur.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._fresh = {}
+        self._writes = 0  # Écritures vues (expire_fresh) : GET commencés avant une écriture
+        self._token = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url, params=None):
+        return url, tuple(sorted((params or {}).items()))
+
+    def _check_token(self):
+        if self._token != AuthService.token:
+            self._entries.clear()
+            self._fresh.clear()
+            self._token = AuthService.token
+
+    def get(self, key):
+        with self._lock:
+            self._check_token()
+            return self._entries.get(key)
+
+    def store(self, key, etag, last_modified, data):
+        with self._lock:
+            self._check_token()
+            self._entries[key] = CacheEntry(etag, last_modified, data)
+
+    def discard(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._fresh.pop(key, None)
+
+    def get_fresh(self, key):
+        """Résultat reçu il y a moins de FRESHNESS_WINDOW secondes, sinon None."""
+        with self._lock:
+            self._check_token()
+            fresh = self._fresh.get(key)
+            if fresh is None or time.monotonic() - fresh[0] > FRESHNESS_WINDOW:
+                return None
+            return fresh[1]
+
+    def write_generation(self):
+        with self._lock:
+            return self._writes
+
+    def store_fresh(self, key, result, generation=None):
+        """
+        Marque `result` comme frais, sauf si une écriture a eu lieu depuis
+        `generation` (write_generation() au départ du GET) : la réponse peut
+        alors précéder l'écriture et sera revalidée au prochain GET.
+        """
+        with self._lock:
+            self._check_token()
+            if generation is not None and generation != self._writes:
+                return
+            self._fresh[key] = (time.monotonic(), result)
+
+    def expire_fresh(self):
+        with self._lock:
+            self._writes += 1
+            self._fresh.clear()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._fresh.clear()
+
+
+class SingleFlight:
+    """
+    Regroupe les appels identiques simultanés : le premier appelant exécute
+    la requête, les suivants attendent et reçoivent le même résultat.
+    """
+
+    class _Call:
+        __slots__ = ("event", "result")
+
+        def __init__(self):
+            self.event = threading.Event()
+            self.result = None
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, timeout=None):
+        """
+        Retourne (résultat, partagé) ; `partagé` vaut True pour les appelants en attente.
+        Un appelant en attente le reste au plus `timeout` secondes (TimeoutError au-delà),
+        même si l'appel en cours n'a pas de délai.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = SingleFlight._Call()
+        if not leader:
+            if not call.event.wait(timeout):
+                raise TimeoutError(key)
+            return call.result, True
+        try:
+            call.result = fn()
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result, False
+
+
+response_cache = ResponseCache()
+single_flight = SingleFlight()
+
+
+def _expire_on_write(response, *args, **kwargs):
+    # Une écriture peut modifier n'importe quelle collection : les réponses
+    # « fraîches » seront revalidées (requête conditionnelle) au prochain GET.
+    if response.request is not None and response.request.method != "GET":
+        response_cache.expire_fresh()
+
+
+AuthService.add_response_hook(_expire_on_write)
+
+
+def cached_get(url, params=None, timeout=None):
+    """
+    GET conditionnel renvoyant le dict habituel des services :
+    {"success": True, "data": ...} ou {"success": False, "message": ...}.
+    Sur un 304, le dict porte en plus "not_modified": True.
+    Un résultat partagé avec un autre appel (requête regroupée ou réponse
+    encore fraîche) porte "shared": True.
+    """
+    key = ResponseCache.make_key(url, params)
+    fresh = response_cache.get_fresh(key)
+    if fresh is not None:
+        return dict(fresh, shared=True)
+
+    try:
+        result, shared = single_flight.do(key, lambda: _conditional_get(key, url, params, timeout), timeout)
+    except TimeoutError:
+        return {"success": False, "message": "Le serveur met trop de temps à répondre."}
+    if shared:
+        return dict(result, shared=True)
+    return dict(result)
+
+
+def _conditional_get(key, url, params, timeout):
+    generation = response_cache.write_generation()
+    entry = response_cache.get(key)
+
+    headers = {}
+    if entry is not None:
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+    try:
+        response = AuthService.get_session().get(url, params=params, headers=headers, timeout=timeout)
+        if response.status_code == 304 and entry is not None:
+            result = {"success": True, "data": entry.data, "not_modified": True}
+            response_cache.store_fresh(key, result, generation)
+            return result
+        if response.status_code == 200:
+            start = time.perf_counter()
+            data = decode_response(response)
+            metrics.record_decode(endpoint_name("GET", response.url), (time.perf_counter() - start) * 1000)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                response_cache.store(key, etag, last_modified, data)
+            else:
+                response_cache.discard(key)
+            result = {"success": True, "data": data}
+            response_cache.store_fresh(key, result, generation)
+            return result
+        return {"success": False, "message": response.text}
+    except Exception as e:
+        return {"success": False, "message": str(e)}
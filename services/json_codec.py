@@ -0,0 +1,54 @@
+# services/json_codec.py
+"""
+Décodage JSON rapide et négociation de la compression HTTP.
+
+- loads() utilise orjson, sinon ujson, sinon le module json standard,
+  selon ce qui est installé (aucune dépendance obligatoire).
+- ACCEPT_ENCODING annonce gzip/deflate, et brotli (br) si le module
+  brotli (ou brotlicffi) est disponible pour que urllib3 sache le décoder.
+"""
+import json
+
+try:
+    import orjson
+
+    DECODER = "orjson"
+
+    def loads(data):
+        return orjson.loads(data)
+
+except ImportError:
+    try:
+        import ujson
+
+        DECODER = "ujson"
+
+        def loads(data):
+            return ujson.loads(data)
+
+    except ImportError:
+        DECODER = "json"
+
+        def loads(data):
+            return json.loads(data)
+
+try:
+    import brotli  # noqa: F401  (utilisé par urllib3 pour décoder "br")
+    HAS_BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        HAS_BROTLI = True
+    except ImportError:
+        HAS_BROTLI = False
+
+ACCEPT_ENCODING = "br, gzip, deflate" if HAS_BROTLI else "gzip, deflate"
+
+
+def decode_response(response):
+    """
+    Équivalent de response.json() avec le décodeur le plus rapide disponible.
+    Le contenu brut (déjà décompressé par urllib3) est décodé directement,
+    sans passer par response.text.
+    """
+    return loads(response.content)
@@ -1,6 +1,6 @@
 # services/ligne_budgetaire_service.py
-import requests
 from services.auth_service import AuthService
+from services.pagination import fetch_all
 
 BASE_URL = f"{AuthService.BASE_URL}/lignes/"
 
@@ -9,13 +9,7 @@ def get_lignes_by_budget(budget_id):
     """
     Récupère les lignes budgétaires associées à un budget donné.
     """
-    try:
-        response = requests.get(BASE_URL, headers=AuthService.get_headers(), params={"budget": budget_id})
-        if response.status_code == 200:
-            return {"success": True, "data": response.json()}
-        return {"success": False, "message": response.text}
-    except Exception as e:
-        return {"success": False, "message": str(e)}
+    return fetch_all(BASE_URL, params={"budget": budget_id}, entity="lignes", scope=budget_id)
 
 
 def create_ligne_budgetaire(data, budget_disponible=None):
@@ -27,7 +21,7 @@ def create_ligne_budgetaire(data, budget_disponible=None):
         if budget_disponible is not None and data['montant_alloue'] > budget_disponible:
             return {"success": False, "message": "Montant alloué dépasse le budget disponible."}
 
-        response = requests.post(BASE_URL, json=data, headers=AuthService.get_headers())
+        response = AuthService.get_session().post(BASE_URL, json=data)
         if response.status_code == 201:
             return {"success": True, "message": "Ligne ajoutée."}
         return {"success": False, "message": response.text}
@@ -38,7 +32,7 @@ def create_ligne_budgetaire(data, budget_disponible=None):
 
 def update_ligne_budgetaire(ligne_id, data):
     try:
-        response = requests.put(f"{BASE_URL}{ligne_id}/", json=data, headers=AuthService.get_headers())
+        response = AuthService.get_session().put(f"{BASE_URL}{ligne_id}/", json=data)
         if response.status_code == 200:
             return {"success": True}
         return {"success": False, "message": response.text}
@@ -47,7 +41,7 @@ def update_ligne_budgetaire(ligne_id, data):
 
 def delete_ligne_budgetaire(ligne_id):
     try:
-        response = requests.delete(f"{BASE_URL}{ligne_id}/", headers=AuthService.get_headers())
+        response = AuthService.get_session().delete(f"{BASE_URL}{ligne_id}/")
         if response.status_code in (200, 204):
             return {"success": True}
         return {"success": False, "message": response.text}
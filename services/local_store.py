@@ -0,0 +1,244 @@
+# services/local_store.py
+"""
+Cache local persistant (SQLite) des entités principales.
+
+Les dernières listes reçues de l'API (budgets, lignes, dépenses, recettes,
+commandes, fournisseurs) sont enregistrées dans le profil de l'utilisateur.
+À l'ouverture d'un écran, ces lignes sont affichées immédiatement puis
+revalidées en arrière-plan (stale-while-revalidate).
+
+Les données sont cloisonnées par utilisateur connecté (email).
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from services.auth_service import AuthService
+
+APP_DIR_NAME = "GestionBudgetUFR"
+DB_NAME = "cache_local.sqlite3"
+
+
+def get_cache_dir():
+    """
+    Dossier du cache dans le profil utilisateur
+    (%LOCALAPPDATA%\\GestionBudgetUFR sous Windows, ~/.gestion_budget_ufr ailleurs).
+    """
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("APPDATA")
+    if base:
+        path = os.path.join(base, APP_DIR_NAME)
+    else:
+        path = os.path.join(os.path.expanduser("~"), ".gestion_budget_ufr")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+class LocalStore:
+    """
+    Stockage ligne par ligne : (propriétaire, entité, portée, id) -> JSON.
+    La portée distingue les sous-collections (ex. lignes d'un budget donné).
+    Une connexion SQLite est ouverte par thread, les appels de service
+    s'exécutant aussi bien dans le thread GUI que dans le pool de threads.
+    """
+
+    def __init__(self, path=None):
+        self.path = path  # Résolu à la première connexion
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self.path is None:
+                self.path = os.path.join(get_cache_dir(), DB_NAME)
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._init_lock:
+                if not self._initialized:
+                    self._create_schema(conn)
+                    self._initialized = True
+        return conn
+
+    @staticmethod
+    def _create_schema(conn):
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS rows (
+                    owner TEXT NOT NULL,
+                    entity TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    id TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (owner, entity, scope, id)
+                )
+            """)
+            # Bornes de position lues par merge() sans parcourir la collection
+            conn.execute("CREATE INDEX IF NOT EXISTS rows_position ON rows (owner, entity, scope, position)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    owner TEXT NOT NULL,
+                    entity TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT,
+                    PRIMARY KEY (owner, entity, scope, key)
+                )
+            """)
+
+    @staticmethod
+    def _owner():
+        return AuthService.user_data.get("email") or ""
+
+    @staticmethod
+    def _row_id(row, position):
+        row_id = row.get("id") if isinstance(row, dict) else None
+        return str(row_id) if row_id is not None else f"#{position}"
+
+    def load(self, entity, scope=""):
+        """
+        Retourne les lignes enregistrées (dans l'ordre reçu de l'API),
+        ou None si cette collection n'a jamais été synchronisée.
+        """
+        owner = self._owner()
+        if not owner:
+            return None
+        try:
+            conn = self._connection()
+            if self.get_meta(entity, "synced_at", scope) is None:
+                return None
+            cursor = conn.execute(
+                "SELECT payload FROM rows WHERE owner=? AND entity=? AND scope=? ORDER BY position",
+                (owner, entity, str(scope)))
+            return [json.loads(payload) for (payload,) in cursor]
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Cache local illisible ({entity}) :", e)
+            return None
+
+    def save(self, entity, rows, scope=""):
+        """
+        Remplace la collection par `rows`. Seules les lignes ajoutées,
+        modifiées ou supprimées sont réécrites sur le disque.
+        """
+        owner = self._owner()
+        if not owner or not isinstance(rows, list):
+            return
+        scope = str(scope)
+        try:
+            conn = self._connection()
+            existing = {
+                row_id: (position, payload)
+                for row_id, position, payload in conn.execute(
+                    "SELECT id, position, payload FROM rows WHERE owner=? AND entity=? AND scope=?",
+                    (owner, entity, scope))
+            }
+
+            upserts = []
+            seen = set()
+            for position, row in enumerate(rows):
+                row_id = self._row_id(row, position)
+                seen.add(row_id)
+                payload = json.dumps(row, ensure_ascii=False, sort_keys=True)
+                if existing.get(row_id) != (position, payload):
+                    upserts.append((owner, entity, scope, row_id, position, payload))
+            removed = [(owner, entity, scope, row_id) for row_id in existing if row_id not in seen]
+
+            with conn:
+                if removed:
+                    conn.executemany(
+                        "DELETE FROM rows WHERE owner=? AND entity=? AND scope=? AND id=?", removed)
+                if upserts:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO rows (owner, entity, scope, id, position, payload) "
+                        "VALUES (?, ?, ?, ?, ?, ?)", upserts)
+                self._set_meta(conn, owner, entity, scope, "synced_at", str(time.time()))
+        except sqlite3.Error as e:
+            print(f"Écriture du cache local impossible ({entity}) :", e)
+
+    def merge(self, entity, rows, scope="", prepend=False):
+        """
+        Ajoute (ou remplace, à id égal) `rows` sans réécrire le reste de la
+        collection : utilisé par la synchronisation incrémentale. Les lignes
+        sont placées en tête (prepend=True) ou en fin de collection.
+        """
+        owner = self._owner()
+        if not owner or not rows:
+            return
+        scope = str(scope)
+        try:
+            conn = self._connection()
+            # Deux sous-requêtes : SQLite ne lit MIN/MAX dans l'index que séparément
+            bounds = "SELECT {}(position) FROM rows WHERE owner=? AND entity=? AND scope=?"
+            low, high = conn.execute(
+                f"SELECT ({bounds.format('MIN')}), ({bounds.format('MAX')})",
+                (owner, entity, scope) * 2).fetchone()
+            if low is None:
+                start = 0
+            else:
+                start = low - len(rows) if prepend else high + 1
+
+            values = []
+            for offset, row in enumerate(rows):
+                position = start + offset
+                payload = json.dumps(row, ensure_ascii=False, sort_keys=True)
+                values.append((owner, entity, scope, self._row_id(row, position), position, payload))
+
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO rows (owner, entity, scope, id, position, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?)", values)
+                self._set_meta(conn, owner, entity, scope, "synced_at", str(time.time()))
+        except sqlite3.Error as e:
+            print(f"Écriture du cache local impossible ({entity}) :", e)
+
+    def set_meta(self, entity, key, value, scope=""):
+        owner = self._owner()
+        if not owner:
+            return
+        try:
+            conn = self._connection()
+            with conn:
+                self._set_meta(conn, owner, entity, scope, key, value)
+        except sqlite3.Error as e:
+            print(f"Écriture du cache local impossible ({entity}) :", e)
+
+    def get_meta(self, entity, key, scope=""):
+        owner = self._owner()
+        if not owner:
+            return None
+        try:
+            row = self._connection().execute(
+                "SELECT value FROM meta WHERE owner=? AND entity=? AND scope=? AND key=?",
+                (owner, entity, str(scope), key)).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error:
+            return None
+
+    @staticmethod
+    def _set_meta(conn, owner, entity, scope, key, value):
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (owner, entity, scope, key, value) VALUES (?, ?, ?, ?, ?)",
+            (owner, entity, str(scope), key, value))
+
+    def clear(self, entity=None):
+        """Efface le cache de l'utilisateur courant (toutes entités ou une seule)."""
+        owner = self._owner()
+        try:
+            conn = self._connection()
+            with conn:
+                if entity is None:
+                    conn.execute("DELETE FROM rows WHERE owner=?", (owner,))
+                    conn.execute("DELETE FROM meta WHERE owner=?", (owner,))
+                else:
+                    conn.execute("DELETE FROM rows WHERE owner=? AND entity=?", (owner, entity))
+                    conn.execute("DELETE FROM meta WHERE owner=? AND entity=?", (owner, entity))
+        except sqlite3.Error as e:
+            print("Effacement du cache local impossible :", e)
+
+
+local_store = LocalStore()
@@ -0,0 +1,221 @@
+# services/metrics.py
+"""
+Mesures de performance des appels API et de l'interface.
+
+Pour chaque appel passant par la session partagée (AuthService.get_session) :
+- ttfb     : temps jusqu'aux en-têtes de la réponse (backend + latence réseau)
+- download : temps de lecture du corps (débit réseau)
+- total    : temps de bout en bout (ttfb + download)
+- octets transférés (compressés) et code HTTP
+et, pour les listes, le temps de décodage JSON (services.json_codec).
+
+Les côtés interface (reconstruction des tableaux, ...) se mesurent avec
+le décorateur @timed("nom").
+
+Chaque série conserve les WINDOW derniers échantillons pour calculer des
+percentiles glissants, consultables dans le panneau de diagnostic
+(Ctrl+Maj+D depuis la fenêtre principale).
+"""
+import functools
+import re
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+from services.auth_service import AuthService
+
+WINDOW = 200  # Échantillons conservés par série
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_name(method, url):
+    """
+    Regroupe les URLs par route : "GET /depenses/{id}/" (paramètres ignorés).
+    """
+    path = urlsplit(url).path
+    base_path = urlsplit(AuthService.BASE_URL).path
+    if path.startswith(base_path):
+        path = path[len(base_path):] or "/"
+    return f"{method} {_ID_SEGMENT.sub('/{id}', path)}"
+
+
+def percentile(values, fraction):
+    """Percentile par rang le plus proche sur une liste déjà triée."""
+    if not values:
+        return None
+    index = min(len(values) - 1, max(0, int(round(fraction * (len(values) - 1)))))
+    return values[index]
+
+
+class Series:
+    """Fenêtre glissante d'échantillons numériques."""
+    __slots__ = ("samples",)
+
+    def __init__(self):
+        self.samples = deque(maxlen=WINDOW)
+
+    def add(self, value):
+        self.samples.append(value)
+
+    def summary(self):
+        values = sorted(self.samples)
+        return {
+            "p50": percentile(values, 0.50),
+            "p90": percentile(values, 0.90),
+            "p99": percentile(values, 0.99),
+            "max": values[-1] if values else None,
+        }
+
+
+class EndpointStats:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.last_status = None
+        self.total = Series()
+        self.ttfb = Series()
+        self.download = Series()
+        self.decode = Series()
+        self.size = Series()
+
+
+class Metrics:
+    def __init__(self):
+        self._endpoints = {}
+        self._ui = {}
+        self._lock = threading.Lock()
+
+    def _endpoint(self, name):
+        stats = self._endpoints.get(name)
+        if stats is None:
+            stats = self._endpoints[name] = EndpointStats()
+        return stats
+
+    def record_call(self, name, status, ttfb_ms, download_ms, nbytes):
+        with self._lock:
+            stats = self._endpoint(name)
+            stats.calls += 1
+            stats.last_status = status
+            if status >= 400:
+                stats.errors += 1
+            stats.ttfb.add(ttfb_ms)
+            stats.download.add(download_ms)
+            stats.total.add(ttfb_ms + download_ms)
+            stats.size.add(nbytes)
+
+    def record_decode(self, name, decode_ms):
+        with self._lock:
+            self._endpoint(name).decode.add(decode_ms)
+
+    def record_ui(self, name, duration_ms):
+        with self._lock:
+            series = self._ui.get(name)
+            if series is None:
+                series = self._ui[name] = Series()
+            series.add(duration_ms)
+
+    def snapshot(self):
+        """
+        Copie des statistiques pour l'affichage :
+        {"endpoints": {nom: {...}}, "ui": {nom: {...}}}
+        """
+        with self._lock:
+            endpoints = {
+                name: {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "last_status": stats.last_status,
+                    "total": stats.total.summary(),
+                    "ttfb": stats.ttfb.summary(),
+                    "download": stats.download.summary(),
+                    "decode": stats.decode.summary(),
+                    "size": stats.size.summary(),
+                }
+                for name, stats in self._endpoints.items()
+            }
+            ui = {
+                name: dict(series.summary(), calls=len(series.samples))
+                for name, series in self._ui.items()
+            }
+        return {"endpoints": endpoints, "ui": ui}
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+            self._ui.clear()
+
+
+metrics = Metrics()
+
+
+def _measure_response(response, *args, **kwargs):
+    # Hook de session : appelé dès réception des en-têtes, avant la lecture
+    # du corps. Le corps est lu ici pour en mesurer le téléchargement, sauf
+    # pour une réponse en flux (stream=True, ex. téléchargement d'un rapport) :
+    # la mesure est alors faite quand l'appelant a fini de lire le flux.
+    if kwargs.get("stream"):
+        _measure_when_consumed(response)
+        return
+    try:
+        start = time.perf_counter()
+        content = response.content
+        _record_response(response, (time.perf_counter() - start) * 1000, len(content or b""))
+    except Exception as e:
+        print("Mesure de la réponse impossible :", e)
+
+
+def _measure_when_consumed(response):
+    # iter_content est aussi utilisé par response.content / .text / .json()
+    iter_content = response.iter_content
+    state = {"download_ms": 0.0, "nbytes": 0, "recorded": False}
+
+    def measured_iter_content(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            for chunk in iter_content(*args, **kwargs):
+                state["nbytes"] += len(chunk)
+                state["download_ms"] += (time.perf_counter() - start) * 1000
+                yield chunk  # Temps de l'appelant (écriture du fichier) non compté
+                start = time.perf_counter()
+        finally:
+            if not state["recorded"]:
+                state["recorded"] = True
+                _record_response(response, state["download_ms"], state["nbytes"])
+
+    response.iter_content = measured_iter_content
+
+
+def _record_response(response, download_ms, content_length):
+    try:
+        try:
+            nbytes = response.raw.tell()  # Octets reçus, avant décompression
+        except Exception:
+            nbytes = 0
+        nbytes = nbytes or content_length or int(response.headers.get("Content-Length") or 0)
+        ttfb_ms = response.elapsed.total_seconds() * 1000
+        metrics.record_call(endpoint_name(response.request.method, response.url),
+                            response.status_code, ttfb_ms, download_ms, nbytes)
+    except Exception as e:
+        print("Mesure de la réponse impossible :", e)
+
+
+AuthService.add_response_hook(_measure_response)
+
+
+def timed(name):
+    """
+    Décorateur mesurant la durée d'une méthode d'interface
+    (ex. @timed("depenses.update_table")).
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                metrics.record_ui(name, (time.perf_counter() - start) * 1000)
+        return wrapper
+    return decorator
@@ -0,0 +1,124 @@
+# services/pagination.py
+"""
+Pagination côté serveur (PageNumberPagination de Django REST Framework).
+
+- fetch_page() : une seule page -> {"success", "data": [...], "count", "next"}
+- fetch_all()  : toute la collection, en suivant les liens "next"
+- forget_page() : retire une page du cache HTTP (page libérée par l'écran)
+
+La séquence paresseuse affichée par les écrans de liste est
+ui.remote_page_list.RemotePageList.
+
+Une API non paginée (liste JSON brute) reste supportée : la liste est alors
+découpée localement (et renvoyée en entier sous la clé "all").
+"""
+import time
+
+from services.http_cache import cached_get, response_cache, ResponseCache
+from services.local_store import local_store
+
+PAGE_PARAM = "page"
+PAGE_SIZE_PARAM = "page_size"
+
+_unpaginated = set()  # URLs dont l'API renvoie une liste brute
+
+
+def _is_page(data):
+    return isinstance(data, dict) and "results" in data
+
+
+def fetch_page(url, page, page_size, params=None):
+    """
+    Récupère la page `page` (numérotée à partir de 1) de `page_size` éléments.
+    Pour une API non paginée, "all" contient aussi la collection complète reçue.
+    """
+    if url in _unpaginated:
+        result = cached_get(url, params=params)
+    else:
+        query = dict(params or {})
+        query[PAGE_PARAM] = page
+        query[PAGE_SIZE_PARAM] = page_size
+        result = cached_get(url, params=query)
+    if not result["success"]:
+        return result
+
+    data = result["data"]
+    if _is_page(data):
+        return {"success": True, "data": data["results"],
+                "count": data.get("count", len(data["results"])), "next": data.get("next")}
+    if isinstance(data, list):
+        # API non paginée : la collection complète a été reçue
+        _unpaginated.add(url)
+        start = (page - 1) * page_size
+        return {"success": True, "data": data[start:start + page_size], "count": len(data), "next": None,
+                "all": data}
+    return {"success": False, "message": "Réponse inattendue du serveur."}
+
+
+def forget_page(url, page, page_size, params=None):
+    """
+    Oublie la réponse gardée pour cette page (services.http_cache), pour que
+    la mémoire libérée par RemotePageList.evict() le soit réellement.
+    """
+    query = dict(params or {})
+    if url not in _unpaginated:
+        query[PAGE_PARAM] = page
+        query[PAGE_SIZE_PARAM] = page_size
+        response_cache.discard(ResponseCache.make_key(url, query))
+
+
+def _remaining(deadline):
+    """Temps restant (en secondes) avant l'échéance `deadline` (time.monotonic)."""
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def fetch_all(url, params=None, entity=None, scope="", deadline=None, until=None):
+    """
+    Récupère toute la collection en suivant les liens "next".
+    Si `entity` est fourni, toute nouvelle version est aussi enregistrée
+    dans le cache local persistant (services.local_store).
+    `deadline` (time.monotonic) borne la durée totale, toutes pages comprises.
+    `until(éléments_de_la_page)` renvoyant vrai arrête le parcours après cette page.
+    """
+    result = cached_get(url, params=params, timeout=_remaining(deadline))
+    if not result["success"] or not _is_page(result["data"]):
+        # Une réponse partagée a déjà été enregistrée par l'appel qui l'a reçue
+        if (result["success"] and entity is not None
+                and not result.get("not_modified") and not result.get("shared")):
+            local_store.save(entity, result["data"], scope)
+        return result
+
+    # Les pages sont concaténées ; si aucune n'a changé (304), la liste déjà
+    # assemblée est réutilisée telle quelle.
+    key = ("pages",) + ResponseCache.make_key(url, params)
+    unchanged = result.get("not_modified", False)
+    shared = result.get("shared", False)
+    rows = list(result["data"]["results"])
+    next_url = result["data"].get("next")
+    if until is not None and until(result["data"]["results"]):
+        next_url = None
+    while next_url:
+        timeout = _remaining(deadline)
+        if timeout is not None and timeout <= 0:
+            return {"success": False, "message": "Le serveur met trop de temps à répondre."}
+        page = cached_get(next_url, timeout=timeout)
+        if not page["success"]:
+            return page
+        if not _is_page(page["data"]):
+            return {"success": False, "message": "Réponse inattendue du serveur."}
+        unchanged = unchanged and page.get("not_modified", False)
+        shared = shared and page.get("shared", False)
+        rows.extend(page["data"]["results"])
+        next_url = page["data"].get("next")
+        if until is not None and until(page["data"]["results"]):
+            break
+
+    assembled = response_cache.get(key)
+    if unchanged and assembled is not None:
+        return {"success": True, "data": assembled.data, "not_modified": True}
+    response_cache.store(key, None, None, rows)
+    if entity is not None and not shared:
+        local_store.save(entity, rows, scope)
+    return {"success": True, "data": rows}
@@ -1,22 +1,21 @@
-import requests
 from services.auth_service import AuthService
+from services.pagination import fetch_all, fetch_page
 
 BASE_URL = f"{AuthService.BASE_URL}"
 
-def get_rapports():
+def get_rapports(page=None, page_size=None):
+    """
+    Récupère la liste des rapports générés.
+    Sans `page`, toute la collection est récupérée (liens "next" suivis) ;
+    avec `page`, seule cette page est demandée (voir services.pagination.fetch_page).
+    """
     url = f"{AuthService.BASE_URL}/rapports/"
-    try:
-        response = requests.get(url, headers=AuthService.get_headers())
-        if response.status_code == 200:
-            data = response.json()
-            if isinstance(data, list):
-                return {"success": True, "data": data}
-            else:
-                return {"success": False, "message": "Réponse inattendue du serveur."}
-        else:
-            return {"success": False, "message": response.text}
-    except Exception as e:
-        return {"success": False, "message": str(e)}
+    if page is not None:
+        return fetch_page(url, page, page_size)
+    result = fetch_all(url)
+    if result["success"] and not isinstance(result["data"], list):
+        return {"success": False, "message": "Réponse inattendue du serveur."}
+    return result
 
 def generer_rapport(data):
     """
@@ -25,7 +24,7 @@ def generer_rapport(data):
     """
     url = f"{AuthService.BASE_URL}/rapports/generer/"
     try:
-        response = requests.post(url, json=data, headers=AuthService.get_headers())
+        response = AuthService.get_session().post(url, json=data)
         if response.status_code == 200:
             return {"success": True, "message": "Rapport généré avec succès."}
         return {"success": False, "message": response.json().get("error", response.text)}
@@ -38,7 +37,7 @@ def telecharger_rapport(rapport_id, save_path):
     """
     url = f"{BASE_URL}/rapports/{rapport_id}/telecharger/"
     try:
-        response = requests.get(url, headers=AuthService.get_headers(), stream=True)
+        response = AuthService.get_session().get(url, stream=True)
         if response.status_code == 200:
             with open(save_path, "wb") as f:
                 for chunk in response.iter_content(chunk_size=8192):
@@ -54,7 +53,7 @@ def update_rapport(rapport_id, data):
     """
     url = f"{BASE_URL}/rapports/{rapport_id}/"
     try:
-        response = requests.put(url, json=data, headers=AuthService.get_headers())
+        response = AuthService.get_session().put(url, json=data)
         if response.status_code in (200, 204):
             return {"success": True}
         return {"success": False, "message": response.text}
@@ -67,7 +66,7 @@ def delete_rapport(rapport_id):
     """
     url = f"{BASE_URL}/rapports/{rapport_id}/"
     try:
-        response = requests.delete(url, headers=AuthService.get_headers())
+        response = AuthService.get_session().delete(url)
         if response.status_code in (200, 204):
             return {"success": True}
         return {"success": False, "message": response.text}
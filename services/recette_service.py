@@ -1,25 +1,23 @@
-import requests
 from services.auth_service import AuthService
+from services.pagination import fetch_all, fetch_page
 
 BASE_URL = f"{AuthService.BASE_URL}/recettes/"
 
-def get_recettes():
-    try:
-        response = requests.get(BASE_URL, headers=AuthService.get_headers())
-        if response.status_code == 200:
-            return {"success": True, "data": response.json()}
-        return {"success": False, "message": response.text}
-    except Exception as e:
-        return {"success": False, "message": str(e)}
+def get_recettes(page=None, page_size=None):
+    """
+    Récupère la liste des recettes.
+    Sans `page`, toute la collection est récupérée (liens "next" suivis) ;
+    avec `page`, seule cette page est demandée (voir services.pagination.fetch_page).
+    """
+    if page is not None:
+        return fetch_page(BASE_URL, page, page_size)
+    return fetch_all(BASE_URL, entity="recettes")
 
 def create_recette(data, justificatif_path=None):
     try:
-        headers = AuthService.get_headers()
-        headers.pop('Content-Type', None)  # Important pour multipart/form-data
-
         files = {'justificatif': open(justificatif_path, 'rb')} if justificatif_path else None
 
-        response = requests.post(BASE_URL, data=data, files=files, headers=headers)
+        response = AuthService.get_session().post(BASE_URL, data=data, files=files)
 
         if response.status_code == 201:
             return {"success": True, "message": "Recette ajoutée avec succès."}
@@ -29,7 +27,7 @@ def create_recette(data, justificatif_path=None):
 
 def delete_recette(recette_id):
     try:
-        response = requests.delete(f"{BASE_URL}{recette_id}/", headers=AuthService.get_headers())
+        response = AuthService.get_session().delete(f"{BASE_URL}{recette_id}/")
         if response.status_code in (200, 204):
             return {"success": True}
         return {"success": False, "message": response.text}
@@ -38,12 +36,9 @@ def delete_recette(recette_id):
 
 def update_recette(recette_id, data, justificatif_path=None):
     try:
-        headers = AuthService.get_headers()
-        headers.pop('Content-Type', None)
-
         files = {'justificatif': open(justificatif_path, 'rb')} if justificatif_path else None
 
-        response = requests.patch(f"{BASE_URL}{recette_id}/", data=data, files=files, headers=headers)
+        response = AuthService.get_session().patch(f"{BASE_URL}{recette_id}/", data=data, files=files)
 
         if response.status_code == 200:
             return {"success": True, "message": "Recette mise à jour avec succès."}
@@ -0,0 +1,261 @@
+# services/search_index.py
+"""
+Index de recherche plein texte des écrans de liste.
+
+L'index est construit une fois au chargement de la collection, puis mis à
+jour par différence (seuls les éléments nouveaux ou modifiés sont
+réindexés). Chaque élément est découpé en mots normalisés (minuscules, sans
+accents) ; la barre de recherche interroge ensuite le vocabulaire de l'index
+au lieu de reconstruire et parcourir le texte de chaque élément à chaque
+frappe.
+
+Un mot recherché correspond à tout mot indexé qui le contient ("fourn"
+trouve "Fournitures", "2024-03" trouve "2024-03-15", "ecole" trouve
+"École"). Plusieurs mots sont combinés par ET.
+"""
+import functools
+import unicodedata
+
+MATCH_CACHE_SIZE = 256  # Mots recherchés dont les correspondances sont mémorisées
+
+
+@functools.lru_cache(maxsize=65536)
+def _words(text):
+    # Les mêmes valeurs (types, statuts, noms) reviennent sur de nombreux éléments
+    return tuple(normalize(text).split())
+
+
+def normalize(text):
+    """Minuscules sans accents : "Dépense Été" -> "depense ete"."""
+    text = str(text)
+    if text.isascii():
+        return text.lower()
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in text if not unicodedata.combining(c)).casefold()
+
+
+def tokenize(values):
+    tokens = set()
+    for value in values:
+        if value is not None and value != "":
+            tokens.update(_words(str(value)))
+    return tokens
+
+
+def default_key(element):
+    key = element.get("id")
+    return id(element) if key is None else key
+
+
+class SearchIndex:
+    """
+    Index inversé mot -> clés des éléments.
+
+    fields(element) renvoie les valeurs cherchables d'un élément ;
+    key(element) son identifiant (par défaut element["id"], ou l'objet
+    lui-même pour un élément sans id).
+    search() renvoie les éléments dans l'ordre de la collection.
+    """
+
+    def __init__(self, fields, key=None):
+        self.fields = fields
+        self.key = key or default_key
+        self.clear()
+
+    def clear(self):
+        self.version = getattr(self, "version", 0) + 1  # Change à chaque modification
+        self._source = None
+        self._records = []
+        self._position = {}   # clé -> rang dans la collection, décalé de self._shift
+        self._shift = 0       # Ajouts en tête : les rangs existants ne sont pas renumérotés
+        self._elements = {}   # clé -> élément indexé
+        self._values = {}     # clé -> valeurs indexées (détection des modifications)
+        self._tokens = {}     # clé -> mots de l'élément
+        self._postings = {}   # mot -> ensemble de clés
+        self._matches = {}    # mot recherché -> mots indexés qui le contiennent
+
+    def __len__(self):
+        return len(self._records)
+
+    def set_records(self, records):
+        """
+        Aligne l'index sur la collection `records` : les éléments inchangés
+        sont conservés, les nouveaux/modifiés réindexés, les absents retirés.
+        """
+        if records is self._source and len(records) == len(self._records):
+            return
+        records = list(records) if records is not None else []
+        seen = set()
+        for element in records:
+            key = self.key(element)
+            seen.add(key)
+            if self._elements.get(key) is element:
+                continue
+            values = tuple(self.fields(element))
+            self._elements[key] = element
+            if self._values.get(key) != values:
+                self._index(key, values)
+        for key in [key for key in self._elements if key not in seen]:
+            self._unindex(key)
+        self._source = records
+        self._records = records
+        self._position = {self.key(element): rank for rank, element in enumerate(records)}
+        self._shift = 0
+        self.version += 1
+
+    def add(self, elements, first=False):
+        """
+        Ajoute de nouveaux éléments en tête (first=True) ou en fin de
+        collection (synchronisation incrémentale) : seuls ces éléments sont
+        indexés, les rangs des autres ne sont pas recalculés.
+        """
+        fresh = []
+        for element in elements:
+            if self.key(element) in self._position:
+                self.upsert(element)
+            else:
+                fresh.append(element)
+        if not fresh:
+            return
+        if first:
+            self._shift -= len(fresh)
+            self._records[:0] = fresh
+            start = self._shift
+        else:
+            start = self._shift + len(self._records)
+            self._records.extend(fresh)
+        for position, element in enumerate(fresh, start):
+            key = self.key(element)
+            self._position[key] = position
+            self._elements[key] = element
+            self._index(key, tuple(self.fields(element)))
+        self._source = None
+        self.version += 1
+
+    def __contains__(self, key):
+        return key in self._position
+
+    def rank_of(self, key):
+        """Rang de l'élément `key` dans la collection indexée, ou None."""
+        position = self._position.get(key)
+        return None if position is None else position - self._shift
+
+    def upsert(self, element, position=None):
+        """
+        Ajoute ou réindexe un seul élément (création, modification, retrait
+        annulé) sans parcourir la collection. Un nouvel élément est inséré au
+        rang `position` (par défaut à la fin) ; un élément existant garde le sien.
+        """
+        key = self.key(element)
+        rank = self.rank_of(key)
+        if rank is not None:
+            self._records[rank] = element
+        else:
+            rank = len(self._records) if position is None else max(0, min(position, len(self._records)))
+            self._records.insert(rank, element)
+            self._renumber(rank)
+        self._source = None
+        self._elements[key] = element
+        values = tuple(self.fields(element))
+        if self._values.get(key) != values:
+            self._index(key, values)
+        self.version += 1
+
+    def remove(self, key):
+        """Retire un élément de l'index (suppression) ; renvoie son rang, ou None."""
+        rank = self.rank_of(key)
+        if rank is None:
+            return None
+        del self._position[key]
+        self._unindex(key)
+        del self._records[rank]
+        self._renumber(rank)
+        self._source = None
+        self.version += 1
+        return rank
+
+    def _renumber(self, start):
+        # Rangs décalés par une insertion ou un retrait au rang `start`
+        position, key, shift = self._position, self.key, self._shift
+        for rank in range(start, len(self._records)):
+            position[key(self._records[rank])] = rank + shift
+
+    def _index(self, key, values):
+        self._unindex_tokens(key)
+        tokens = tokenize(values)
+        self._values[key] = values
+        self._tokens[key] = tokens
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = set()
+            postings.add(key)
+        self._matches.clear()
+
+    def _unindex_tokens(self, key):
+        for token in self._tokens.pop(key, ()):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self._postings[token]
+        self._matches.clear()
+
+    def _unindex(self, key):
+        self._unindex_tokens(key)
+        self._values.pop(key, None)
+        self._elements.pop(key, None)
+
+    def _tokens_matching(self, word):
+        tokens = self._matches.get(word)
+        if tokens is not None:
+            return tokens
+        # Frappe au clavier : les correspondances de "fourn" sont un sous-ensemble
+        # de celles de "four", déjà calculées à la frappe précédente.
+        candidates = self._matches.get(word[:-1])
+        if candidates is None:
+            candidates = self._matches.get(word[1:])
+        if candidates is None:
+            candidates = self._postings
+        tokens = [token for token in candidates if word in token]
+        if len(self._matches) >= MATCH_CACHE_SIZE:
+            self._matches.clear()
+        self._matches[word] = tokens
+        return tokens
+
+    def ordered(self, elements):
+        """Éléments indexés de `elements`, remis dans l'ordre de la collection."""
+        position = self._position
+        ranked = [(position[self.key(element)], element) for element in elements
+                  if self.key(element) in position]
+        ranked.sort(key=lambda item: item[0])
+        return [element for _, element in ranked]
+
+    def matches(self, element, words):
+        """Vrai si l'élément indexé contient tous les mots (déjà normalisés)."""
+        tokens = self._tokens.get(self.key(element), ())
+        return all(any(word in token for token in tokens) for word in words)
+
+    def keys_matching(self, query):
+        """Clés des éléments contenant tous les mots de `query` (None si vide)."""
+        words = normalize(query).split()
+        if not words:
+            return None
+        keys = None
+        # Les mots les plus longs sont les plus sélectifs
+        for word in sorted(words, key=len, reverse=True):
+            matched = set()
+            for token in self._tokens_matching(word):
+                matched |= self._postings[token]
+            keys = matched if keys is None else keys & matched
+            if not keys:
+                return set()
+        return keys
+
+    def search(self, query):
+        """Éléments correspondant à `query`, dans l'ordre de la collection."""
+        keys = self.keys_matching(query)
+        if keys is None:
+            return list(self._records)
+        shift = self._shift
+        return [self._records[position - shift] for position in sorted(self._position[key] for key in keys)]
@@ -0,0 +1,142 @@
+# services/sorting.py
+"""
+Tri multi-colonnes des écrans de liste, sur toute la collection filtrée
+(et non sur la seule page affichée).
+
+- Les clés de tri sont typées : dates analysées, montants numériques, texte
+  selon l'ordre français (casse et accents ignorés au premier niveau :
+  "école" se range avec "ecole", avant "étude"). Elles sont calculées une
+  fois par élément puis mémorisées tant que l'élément n'est pas remplacé.
+- L'ordre est stable : à égalité, l'ordre de la collection est conservé ;
+  les colonnes secondaires départagent la colonne principale.
+- Si la nouvelle liste à trier est l'ancienne plus quelques éléments
+  (synchronisation, ajout), ces éléments sont insérés par dichotomie dans
+  le résultat précédent au lieu de tout retrier.
+"""
+import datetime
+
+from services.search_index import normalize, default_key
+
+TEXT, NUMBER, DATE = "text", "number", "date"
+INSERT_LIMIT = 500  # Au-delà, un tri complet est plus rapide que des insertions
+
+
+def text_key(value):
+    if value is None or value == "":
+        return None
+    value = str(value)
+    return normalize(value), value.casefold(), value
+
+
+def number_key(value):
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def date_key(value):
+    if not value:
+        return None
+    if isinstance(value, datetime.datetime):
+        return value.replace(tzinfo=None)
+    text = str(value).strip()
+    try:
+        return datetime.datetime.fromisoformat(text.replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        pass
+    for fmt in ("%d/%m/%Y %H:%M", "%d/%m/%Y", "%Y-%m"):
+        try:
+            return datetime.datetime.strptime(text, fmt)
+        except ValueError:
+            pass
+    return None
+
+
+KEY_FUNCTIONS = {TEXT: text_key, NUMBER: number_key, DATE: date_key}
+
+
+class Sorter:
+    """
+    columns : nom -> (fonction(élément) -> valeur, type TEXT/NUMBER/DATE).
+    sort(elements, order) où order est une suite de (nom, décroissant).
+    Les valeurs absentes sont toujours rangées en fin de liste.
+    """
+
+    def __init__(self, columns, key=None):
+        self.columns = columns
+        self.key = key or default_key
+        self._keys = {name: {} for name in columns}  # nom -> clé élément -> (élément, clé de tri)
+        self._last = None  # (ordre, éléments en entrée, identités, résultat)
+
+    def sort_key(self, name, element):
+        cache = self._keys[name]
+        key = self.key(element)
+        entry = cache.get(key)
+        if entry is None or entry[0] is not element:
+            getter, kind = self.columns[name]
+            entry = cache[key] = (element, KEY_FUNCTIONS[kind](getter(element)))
+        return entry[1]
+
+    def sort(self, elements, order):
+        order = tuple(order)
+        if not order:
+            return elements
+        result = self._insert_new(elements, order)
+        if result is None:
+            result = list(elements)
+            # Tris stables successifs, de la colonne la moins prioritaire à la principale
+            for name, descending in reversed(order):
+                result.sort(key=self._pass_key(name, descending), reverse=descending)
+        self._last = (order, elements, {id(element) for element in elements}, result)
+        return result
+
+    def _pass_key(self, name, descending):
+        # Les valeurs absentes restent en fin de liste dans les deux sens
+        missing = (-1,) if descending else (1,)
+
+        def key(element):
+            value = self.sort_key(name, element)
+            return missing if value is None else (0, value)
+        return key
+
+    def _insert_new(self, elements, order):
+        if self._last is None or self._last[0] != order:
+            return None
+        _, previous, known, result = self._last
+        if elements is previous:
+            return result
+        new = [element for element in elements if id(element) not in known]
+        if len(elements) - len(new) != len(previous) or len(new) > INSERT_LIMIT:
+            return None  # Éléments retirés ou trop d'ajouts : tri complet
+        result = list(result)
+        for element in new:
+            result.insert(self._position(result, element, order), element)
+        return result
+
+    def compare(self, a, b, order):
+        """-1, 0 ou 1 selon l'ordre de tri `order`."""
+        for name, descending in order:
+            key_a, key_b = self.sort_key(name, a), self.sort_key(name, b)
+            if key_a == key_b:
+                continue
+            if key_a is None:
+                return 1
+            if key_b is None:
+                return -1
+            smaller = key_a < key_b
+            return (1 if smaller else -1) if descending else (-1 if smaller else 1)
+        return 0
+
+    def _position(self, result, element, order):
+        # Après les éléments égaux (comme un tri stable d'un ajout en fin de collection)
+        low, high = 0, len(result)
+        while low < high:
+            middle = (low + high) // 2
+            if self.compare(element, result[middle], order) < 0:
+                high = middle
+            else:
+                low = middle + 1
+        return low
@@ -0,0 +1,251 @@
+# services/startup_timeline.py
+"""
+Chronologie du démarrage, du lancement du processus au tableau de bord utilisable.
+
+Désactivée par défaut. Pour l'activer, définir la variable d'environnement
+UFR_STARTUP_TIMELINE avant de lancer l'application :
+- "1"               : journal dans le dossier du cache local
+                      (%LOCALAPPDATA%\\GestionBudgetUFR\\startup_timeline.jsonl)
+- un chemin         : journal à cet emplacement
+
+Ce module doit être le premier importé par le script de lancement
+(wrapper_main.py ou main.py) : son import est l'origine des temps (t = 0).
+Il n'utilise que la bibliothèque standard pour ne rien fausser.
+
+Chaque lancement ajoute une ligne JSON au journal :
+    {"run": ..., "started_at": ..., "entry": "wrapper_main.py", "frozen": false,
+     "marks": [{"name": "qapplication_created", "t_ms": 412.3}, ...]}
+Les étapes antérieures à Python (création du processus, lanceur PyInstaller
+qui décompresse l'exécutable) ont un t_ms négatif.
+
+Résumé des derniers lancements :
+    python -m services.startup_timeline [fichier] [nombre_de_lancements]
+ou, dans l'application, le panneau de diagnostic (Ctrl+Maj+D).
+"""
+import atexit
+import datetime
+import json
+import os
+import statistics
+import sys
+import time
+
+ENV_VAR = "UFR_STARTUP_TIMELINE"
+LOG_NAME = "startup_timeline.jsonl"
+
+# Étapes dans l'ordre attendu, avec leur libellé pour le résumé
+MARK_LABELS = {
+    "launcher_start": "Lanceur PyInstaller démarré",
+    "process_start": "Processus Python créé",
+    "script_start": "Script de lancement exécuté",
+    "qapplication_created": "QApplication créée",
+    "mainapp_constructed": "MainApp construite",
+    "login_shown": "Formulaire de connexion affiché",
+    "2fa_verified": "Code 2FA vérifié",
+    "main_layout_built": "MainLayout construit",
+    "dashboard_painted": "Tableau de bord affiché",
+    "dashboard_data_loaded": "Données du tableau de bord reçues",
+}
+# Le journal est écrit dès que toutes ces étapes sont atteintes (sinon à la fermeture)
+FINAL_MARKS = {"dashboard_painted", "dashboard_data_loaded"}
+
+_origin = time.perf_counter()
+_origin_epoch = time.time()
+_value = os.environ.get(ENV_VAR, "").strip()
+_enabled = _value not in ("", "0")
+_marks = []
+_written = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def mark(name):
+    """Enregistre l'étape `name` (seul son premier passage compte, ex. reconnexion)."""
+    if not _enabled or any(existing == name for existing, _ in _marks):
+        return
+    _marks.append((name, (time.perf_counter() - _origin) * 1000))
+    if FINAL_MARKS.issubset(existing for existing, _ in _marks):
+        flush()
+
+
+def mark_first_paint(widget, name):
+    """Enregistre l'étape `name` au premier affichage effectif (QEvent.Paint) de `widget`."""
+    if not _enabled:
+        return
+    from PyQt5.QtCore import QObject, QEvent
+
+    class FirstPaintFilter(QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Paint:
+                mark(name)
+                watched.removeEventFilter(self)
+                self.deleteLater()
+            return False
+
+    widget.installEventFilter(FirstPaintFilter(widget))
+
+
+def current_marks():
+    """Étapes du lancement en cours : [(nom, t_ms)], triées par temps."""
+    return sorted(_marks, key=lambda item: item[1])
+
+
+def log_path():
+    if _value.lower() in ("1", "true", "oui", "yes"):
+        from services.local_store import get_cache_dir  # Importé tard : dépend de requests
+        return os.path.join(get_cache_dir(), LOG_NAME)
+    return _value
+
+
+def flush():
+    """Ajoute le lancement en cours au journal (une seule fois)."""
+    global _written
+    if not _enabled or _written or not _marks:
+        return
+    _written = True
+    record = {
+        "run": f"{int(_origin_epoch)}-{os.getpid()}",
+        "started_at": datetime.datetime.fromtimestamp(_origin_epoch).isoformat(timespec="seconds"),
+        "entry": os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else "",
+        "frozen": bool(getattr(sys, "frozen", False)),
+        "marks": [{"name": name, "t_ms": round(t_ms, 1)} for name, t_ms in current_marks()],
+    }
+    try:
+        with open(log_path(), "a", encoding="utf-8") as log:
+            log.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except OSError as e:
+        print("Chronologie du démarrage non enregistrée :", e)
+
+
+# ---------------------------------------------------------------------------
+# Étapes antérieures à Python : dates de création des processus
+# ---------------------------------------------------------------------------
+
+def _windows_creation_time(pid=None):
+    import ctypes
+    from ctypes import wintypes
+
+    kernel32 = ctypes.windll.kernel32
+    if pid is None:
+        handle, close = kernel32.GetCurrentProcess(), False
+    else:
+        handle, close = kernel32.OpenProcess(0x1000, False, pid), True  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return None
+    try:
+        times = [wintypes.FILETIME() for _ in range(4)]
+        if not kernel32.GetProcessTimes(handle, *[ctypes.byref(t) for t in times]):
+            return None
+        ticks = (times[0].dwHighDateTime << 32) | times[0].dwLowDateTime  # 100 ns depuis 1601
+        return ticks / 1e7 - 11644473600
+    finally:
+        if close:
+            kernel32.CloseHandle(handle)
+
+
+def _linux_creation_time(pid="self"):
+    with open("/proc/stat") as stat:
+        boot = next(int(line.split()[1]) for line in stat if line.startswith("btime"))
+    with open(f"/proc/{pid}/stat") as stat:
+        fields = stat.read().rsplit(")", 1)[1].split()
+    return boot + int(fields[19]) / os.sysconf("SC_CLK_TCK")
+
+
+def _record_process_marks():
+    try:
+        if sys.platform == "win32":
+            creation = _windows_creation_time
+        elif os.path.exists("/proc/self/stat"):
+            creation = _linux_creation_time
+        else:
+            return
+        started = creation()
+        if started is not None:
+            _marks.append(("process_start", (started - _origin_epoch) * 1000))
+        if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+            # Exécutable « onefile » : le lanceur parent décompresse puis lance ce processus
+            started = creation(os.getppid())
+            if started is not None:
+                _marks.append(("launcher_start", (started - _origin_epoch) * 1000))
+    except Exception as e:
+        print("Date de création du processus indisponible :", e)
+
+
+if _enabled and __name__ != "__main__":  # Pas pour la commande de résumé
+    _record_process_marks()
+    _marks.append(("script_start", 0.0))
+    atexit.register(flush)
+
+
+# ---------------------------------------------------------------------------
+# Résumé
+# ---------------------------------------------------------------------------
+
+def load_runs(path):
+    runs = []
+    with open(path, encoding="utf-8") as log:
+        for line in log:
+            line = line.strip()
+            if line:
+                try:
+                    runs.append(json.loads(line))
+                except ValueError:
+                    continue  # Ligne tronquée (application arrêtée pendant l'écriture)
+    return runs
+
+
+def summary_rows(marks):
+    """[(libellé, t_ms, écart avec l'étape précédente)] pour une liste [(nom, t_ms)]."""
+    rows = []
+    previous = None
+    for name, t_ms in sorted(marks, key=lambda item: item[1]):
+        rows.append((MARK_LABELS.get(name, name), t_ms, None if previous is None else t_ms - previous))
+        previous = t_ms
+    return rows
+
+
+def format_summary(runs):
+    lines = []
+    last = runs[-1]
+    marks = [(entry["name"], entry["t_ms"]) for entry in last["marks"]]
+    lines.append(f"Dernier lancement : {last['started_at']} ({last.get('entry') or '?'}"
+                 f"{', exécutable' if last.get('frozen') else ''})")
+    lines.append(f"  {'Étape':<36} {'t (ms)':>10} {'écart (ms)':>12}")
+    for label, t_ms, delta in summary_rows(marks):
+        lines.append(f"  {label:<36} {t_ms:10.0f} {'' if delta is None else f'{delta:12.0f}'}")
+
+    if len(runs) > 1:
+        by_name = {}
+        for run in runs:
+            for entry in run["marks"]:
+                by_name.setdefault(entry["name"], []).append(entry["t_ms"])
+        lines.append("")
+        lines.append(f"Médiane sur les {len(runs)} derniers lancements :")
+        for name, values in sorted(by_name.items(), key=lambda item: statistics.median(item[1])):
+            lines.append(f"  {MARK_LABELS.get(name, name):<36} {statistics.median(values):10.0f}"
+                         f"   ({len(values)} mesures)")
+    return "\n".join(lines)
+
+
+def main(argv):
+    path = argv[1] if len(argv) > 1 else None
+    count = int(argv[2]) if len(argv) > 2 else 10
+    if path is None:
+        from services.local_store import get_cache_dir
+        path = os.path.join(get_cache_dir(), LOG_NAME)
+    if not os.path.exists(path):
+        print(f"Aucun journal de démarrage : {path}\n"
+              f"Lancer l'application avec {ENV_VAR}=1 pour l'enregistrer.")
+        return 1
+    runs = load_runs(path)[-count:]
+    if not runs:
+        print(f"Journal vide : {path}")
+        return 1
+    print(format_summary(runs))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,138 @@
+from PyQt5.QtWidgets import QStyledItemDelegate, QToolTip
+from PyQt5.QtCore import Qt, QEvent, QRect, QTimer
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QPainter
+
+
+DISABLED_COLOR = "#bdc3c7"
+FALLBACK_COLOR = "#95a5a6"
+
+
+class ActionButtonsDelegate(QStyledItemDelegate):
+    """
+    Dessine les boutons d'action d'une colonne « Actions » au lieu de créer
+    un QWidget et des QPushButton par ligne (aucun widget alloué, quelle que
+    soit la taille de la page) ; les clics sont traités par test de position
+    sur les rectangles des boutons.
+
+    actions_for(donnees) reçoit la valeur Qt.UserRole de la cellule et renvoie
+    (actions, texte) ou (actions, texte, couleur_du_texte) :
+    - actions : liste de (libellé, couleur, callback, infobulle) ; un callback
+      None dessine un bouton grisé, non cliquable ;
+    - texte : affiché à la place des boutons s'il n'y a aucune action
+      (en italique gris si aucune couleur n'est donnée).
+    """
+    MARGIN = 5
+    BUTTON_HEIGHT = 26
+
+    def __init__(self, actions_for, view, column, min_width=80, spacing=8, alignment=Qt.AlignLeft):
+        super().__init__(view)
+        self.actions_for = actions_for
+        self.view = view
+        self.column = column
+        self.min_width = min_width
+        self.spacing = spacing
+        self.alignment = alignment
+        self.hovered = None  # (ligne, numéro du bouton) sous la souris
+        view.setMouseTracking(True)
+        view.entered.connect(self.on_entered)
+        header = view.verticalHeader()
+        header.setDefaultSectionSize(max(header.defaultSectionSize(), self.BUTTON_HEIGHT + 14))
+
+    def describe(self, index):
+        record = index.data(Qt.UserRole)
+        if record is None:
+            return [], "", None  # Ligne en cours de chargement
+        result = self.actions_for(record)
+        actions, text = result[0], result[1]
+        color = result[2] if len(result) > 2 else None
+        return actions, text, color
+
+    def button_font(self, option):
+        font = QFont(option.font)
+        font.setPixelSize(12)
+        return font
+
+    def button_rects(self, option, actions):
+        metrics = QFontMetrics(self.button_font(option))
+        widths = [max(self.min_width, metrics.horizontalAdvance(action[0]) + 20) for action in actions]
+        total = sum(widths) + self.spacing * max(0, len(widths) - 1)
+        if self.alignment == Qt.AlignCenter:
+            x = option.rect.center().x() - total // 2
+        else:
+            x = option.rect.left() + self.MARGIN
+        y = option.rect.center().y() - self.BUTTON_HEIGHT // 2
+        rects = []
+        for width in widths:
+            rects.append(QRect(x, y, width, self.BUTTON_HEIGHT))
+            x += width + self.spacing
+        return rects
+
+    def hit_test(self, option, index, pos):
+        actions, _, _ = self.describe(index)
+        for number, rect in enumerate(self.button_rects(option, actions)):
+            if rect.contains(pos):
+                return number, actions[number]
+        return None, None
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)  # Fond, sélection
+        actions, text, text_color = self.describe(index)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        if not actions:
+            font = QFont(option.font)
+            if text_color is None:
+                font.setItalic(True)
+            else:
+                font.setBold(True)
+            painter.setFont(font)
+            painter.setPen(QColor(text_color or FALLBACK_COLOR))
+            if self.alignment == Qt.AlignCenter:
+                painter.drawText(option.rect, Qt.AlignCenter, text)
+            else:
+                painter.drawText(option.rect.adjusted(self.MARGIN, 0, 0, 0), Qt.AlignLeft | Qt.AlignVCenter, text)
+        else:
+            painter.setFont(self.button_font(option))
+            for number, (rect, action) in enumerate(zip(self.button_rects(option, actions), actions)):
+                enabled = action[2] is not None
+                color = QColor(action[1] if enabled else DISABLED_COLOR)
+                if enabled and self.hovered == (index.row(), number):
+                    color = color.darker(115)
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(color)
+                painter.drawRoundedRect(rect, 3, 3)
+                painter.setPen(Qt.white)
+                painter.drawText(rect, Qt.AlignCenter, action[0])
+        painter.restore()
+
+    def set_hovered(self, hovered):
+        if hovered != self.hovered:
+            self.hovered = hovered
+            self.view.viewport().setCursor(Qt.PointingHandCursor if hovered else Qt.ArrowCursor)
+            self.view.viewport().update()
+
+    def on_entered(self, index):
+        if index.column() != self.column:
+            self.set_hovered(None)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseMove:
+            number, action = self.hit_test(option, index, event.pos())
+            enabled = action is not None and action[2] is not None
+            self.set_hovered((index.row(), number) if enabled else None)
+        elif event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            _, action = self.hit_test(option, index, event.pos())
+            if action is not None and action[2] is not None:
+                # Différé : l'action peut ouvrir un dialogue et recharger le tableau
+                QTimer.singleShot(0, action[2])
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip:
+            _, action = self.hit_test(option, index, event.pos())
+            if action is not None and action[3]:
+                QToolTip.showText(event.globalPos(), action[3], view)
+                return True
+        return super().helpEvent(event, view, option, index)
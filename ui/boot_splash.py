@@ -0,0 +1,78 @@
+import os
+
+from PyQt5.QtWidgets import QSplashScreen, QApplication
+from PyQt5.QtGui import QPixmap, QPainter, QColor, QFont
+from PyQt5.QtCore import Qt, QRect, QTimer
+
+from services.backend_readiness import backend
+
+
+SPLASH_WIDTH = 460
+SPLASH_HEIGHT = 260
+MAX_SPLASH_MS = 3000  # Au-delà, la fenêtre s'affiche et la connexion attend le serveur
+LOGO_PATH = os.path.join("assets", "logo_ufr.png")
+
+
+class BootSplash(QSplashScreen):
+    """
+    Écran de démarrage de wrapper_main.py : affiché dès la création de la
+    QApplication, il suit le démarrage du serveur (services.backend_readiness)
+    pendant que la fenêtre principale se construit.
+
+    finish_when_ready(window) affiche la fenêtre dès que le serveur répond
+    (ou a échoué), et au plus tard après MAX_SPLASH_MS : sur un poste lent,
+    l'utilisateur saisit ses identifiants pendant la fin du démarrage, sa
+    connexion étant mise en file (LoginWidget).
+    """
+
+    def __init__(self):
+        super().__init__(self.create_pixmap())
+        self.window = None
+        backend.progress.connect(self.on_progress)
+        backend.ready.connect(self.show_window)
+        backend.failed.connect(self.show_window)
+
+    def create_pixmap(self):
+        pixmap = QPixmap(SPLASH_WIDTH, SPLASH_HEIGHT)
+        pixmap.fill(QColor("#002147"))
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+
+        logo = QPixmap(LOGO_PATH)
+        top = 30
+        if not logo.isNull():
+            logo = logo.scaledToHeight(70, Qt.SmoothTransformation)
+            painter.drawPixmap((SPLASH_WIDTH - logo.width()) // 2, top, logo)
+            top += 80
+
+        painter.setPen(Qt.white)
+        painter.setFont(QFont("Arial", 22, QFont.Bold))
+        painter.drawText(QRect(0, top, SPLASH_WIDTH, 40), Qt.AlignCenter, "GestionBudget")
+        painter.setPen(QColor(255, 255, 255, 200))
+        painter.setFont(QFont("Arial", 11))
+        painter.drawText(QRect(0, top + 40, SPLASH_WIDTH, 24), Qt.AlignCenter, "Système de Gestion Budgétaire")
+        painter.end()
+        return pixmap
+
+    def show_status(self, message):
+        self.showMessage(message, Qt.AlignBottom | Qt.AlignHCenter, QColor(255, 255, 255, 180))
+        QApplication.processEvents()  # Affiché avant la suite du démarrage (bloquante)
+
+    def on_progress(self, attempt, elapsed):
+        self.show_status(f"Démarrage du serveur... ({elapsed:.0f} s)")
+
+    def finish_when_ready(self, window):
+        self.window = window
+        if not backend.is_waiting():
+            self.show_window()
+            return
+        self.show_status("Démarrage du serveur...")
+        QTimer.singleShot(MAX_SPLASH_MS, self.show_window)
+
+    def show_window(self, *_):
+        if self.window is None or self.window.isVisible():
+            return  # Fenêtre pas encore construite, ou déjà affichée
+        backend.progress.disconnect(self.on_progress)
+        self.window.show()
+        self.finish(self.window)
@@ -0,0 +1,166 @@
+from PyQt5.QtWidgets import (QWidget, QHBoxLayout, QLabel, QPushButton, QMessageBox, QProgressDialog,
+                             QAbstractItemView)
+from PyQt5.QtCore import Qt, pyqtSignal
+
+from services.async_service import run_async
+
+
+MAX_LISTED_FAILURES = 10  # Échecs détaillés dans le résumé, les autres sont comptés
+MAX_MESSAGE_LENGTH = 120  # Les messages d'erreur du serveur peuvent être longs
+
+
+class BulkActionBar(QWidget):
+    """
+    Barre d'actions groupées d'un tableau : « N sélectionnée(s) » suivi des
+    boutons ajoutés par add_action(), actifs dès qu'une ligne est sélectionnée
+    (sélection multiple avec Ctrl / Maj).
+
+    run() envoie la mutation pour tous les éléments retenus via une fonction
+    de service groupée (services.batch.run_batch, exécutée par run_async),
+    affiche la progression puis un résumé unique des échecs, et recharge
+    l'écran. La barre reste masquée tant qu'aucune action n'est ajoutée
+    (rôle sans action groupée).
+
+    Les éléments sont lus dans la valeur Qt.UserRole de la colonne `column`
+    (la même que celle de ActionButtonsDelegate).
+    """
+    progressed = pyqtSignal(int, int)
+
+    def __init__(self, view, column, reload, parent=None):
+        super().__init__(parent)
+        self.view = view
+        self.column = column
+        self.reload = reload
+        self.stop_requested = False
+        self.progress_dialog = None
+        self.progressed.connect(self.on_progress)
+
+        view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        view.selectionModel().selectionChanged.connect(self.update_state)
+        view.model().modelReset.connect(self.update_state)
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+        self.count_label = QLabel()
+        self.count_label.setStyleSheet("color: #7f8c8d;")
+        layout.addWidget(self.count_label)
+        self.buttons_layout = QHBoxLayout()
+        self.buttons_layout.setSpacing(8)
+        layout.addLayout(self.buttons_layout)
+        layout.addStretch()
+
+        self.buttons = []
+        self.setVisible(False)
+        self.update_state()
+
+    def add_action(self, label, color, callback, tooltip=""):
+        button = QPushButton(label)
+        button.setStyleSheet("""
+            QPushButton {
+                background-color: %s;
+                color: white;
+                padding: 6px 14px;
+                border-radius: 4px;
+                font-size: 12px;
+            }
+            QPushButton:disabled {
+                background-color: #bdc3c7;
+            }
+        """ % color)
+        button.setCursor(Qt.PointingHandCursor)
+        button.setToolTip(tooltip)
+        button.clicked.connect(callback)
+        self.buttons_layout.addWidget(button)
+        self.buttons.append(button)
+        self.setVisible(True)
+        self.update_state()
+        return button
+
+    def selected_records(self):
+        rows = sorted(index.row() for index in self.view.selectionModel().selectedRows())
+        model = self.view.model()
+        records = [model.index(row, self.column).data(Qt.UserRole) for row in rows]
+        return [record for record in records if record is not None]  # Lignes en cours de chargement exclues
+
+    def update_state(self, *_):
+        count = len(self.view.selectionModel().selectedRows())
+        self.count_label.setText(f"{count} sélectionnée(s)" if count else "Sélection multiple : Ctrl / Maj + clic")
+        for button in self.buttons:
+            button.setEnabled(bool(count) and self.progress_dialog is None)
+
+    def run(self, title, question, batch_fn, records, *args):
+        """
+        Demande confirmation puis applique batch_fn(ids, *args, progress=..., should_stop=...)
+        aux éléments `records` (ceux de la sélection pour lesquels l'action est permise).
+        """
+        ignored = len(self.selected_records()) - len(records)
+        if not records:
+            QMessageBox.information(self, title, "Aucune ligne sélectionnée ne permet cette action.")
+            return None
+        details = f"{len(records)} élément(s) concerné(s)."
+        if ignored > 0:
+            details += f"\n{ignored} ligne(s) sélectionnée(s) ignorée(s) (action non permise)."
+        if QMessageBox.question(self, title, f"{question}\n\n{details}",
+                                QMessageBox.Yes | QMessageBox.No, QMessageBox.No) != QMessageBox.Yes:
+            return None
+
+        self.stop_requested = False
+        self.progress_dialog = QProgressDialog(f"{title} : 0 / {len(records)}", "Arrêter", 0, len(records), self)
+        self.progress_dialog.setWindowTitle(title)
+        self.progress_dialog.setWindowModality(Qt.WindowModal)
+        self.progress_dialog.setMinimumDuration(0)
+        self.progress_dialog.setAutoClose(False)
+        self.progress_dialog.setAutoReset(False)
+        self.progress_dialog.canceled.connect(self.request_stop)
+        self.progress_dialog.setValue(0)
+        self.update_state()
+        return run_async(batch_fn, [record["id"] for record in records], *args,
+                         progress=self.report, should_stop=lambda: self.stop_requested,
+                         owner=self, on_result=lambda result: self.on_done(title, result))
+
+    def report(self, done, total):
+        # Appelé depuis le thread de la tâche : le signal est livré dans le thread GUI
+        try:
+            self.progressed.emit(done, total)
+        except RuntimeError:
+            pass  # Barre détruite (écran fermé) pendant l'action
+
+    def request_stop(self):
+        self.stop_requested = True
+        if self.progress_dialog is not None:
+            self.progress_dialog.setLabelText("Arrêt après les requêtes en cours...")
+
+    def on_progress(self, done, total):
+        dialog = self.progress_dialog
+        if dialog is not None and not self.stop_requested:
+            # setLabelText avant setValue : une fenêtre modale traite les événements
+            # en attente dans setValue, y compris la fin de l'action (on_done)
+            dialog.setLabelText(f"{dialog.windowTitle()} : {done} / {total}")
+            dialog.setValue(done)
+
+    def on_done(self, title, result):
+        if self.progress_dialog is not None:
+            self.progress_dialog.close()
+            self.progress_dialog.deleteLater()
+            self.progress_dialog = None
+        self.view.clearSelection()
+        self.update_state()
+
+        data = result.get("data") or {}
+        failed = data.get("failed", [])
+        box = QMessageBox(QMessageBox.Information if result["success"] else QMessageBox.Warning,
+                          title, result.get("message", ""), QMessageBox.Ok, self)
+        if failed:
+            lines = [f"#{item_id} : {_shorten(message)}" for item_id, message in failed[:MAX_LISTED_FAILURES]]
+            if len(failed) > MAX_LISTED_FAILURES:
+                lines.append(f"... et {len(failed) - MAX_LISTED_FAILURES} autre(s)")
+            box.setInformativeText("\n".join(lines))
+        self.reload()
+        box.exec_()
+
+
+def _shorten(message):
+    message = " ".join(str(message).split())
+    return message if len(message) <= MAX_MESSAGE_LENGTH else message[:MAX_MESSAGE_LENGTH - 1] + "…"
@@ -0,0 +1,193 @@
+# ui/chart_cache.py
+"""
+Cache des graphiques rendus (QPixmap), indexé par l'empreinte des données.
+
+La clé est un SHA-1 des séries affichées (valeurs, libellés, couleurs,
+titre), de la taille en pixels logiques et du facteur d'échelle de l'écran
+(devicePixelRatio). Tant que budgets et dépenses ne changent pas, un
+graphique reconstruit (retour sur l'écran, rechargement, nouveau lancement)
+est affiché tel quel, sans nouveau rendu matplotlib ni animation.
+
+Deux niveaux, tous deux LRU :
+- mémoire : MEMORY_MAX_BYTES de pixmaps décodés ;
+- disque  : PNG dans <dossier du cache local>/charts, MAX_DISK_BYTES au
+  total ; l'ordre d'utilisation est la date de modification du fichier,
+  mise à jour à chaque lecture.
+
+À utiliser depuis le thread GUI uniquement (QPixmap).
+"""
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtGui import QPixmap, QPainter
+from PyQt5.QtCore import QTimer
+
+from services.local_store import get_cache_dir
+
+CACHE_VERSION = 1                     # À incrémenter quand le rendu d'un graphique change
+MEMORY_MAX_BYTES = 32 * 1024 * 1024
+MAX_DISK_BYTES = 20 * 1024 * 1024
+CHARTS_DIR_NAME = "charts"
+RESIZE_RENDER_DELAY_MS = 150          # Rendu après la fin d'un redimensionnement
+
+
+class ChartCache:
+    def __init__(self, directory=None):
+        self.directory = directory  # Résolu au premier accès disque
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fingerprint(*parts):
+        """Empreinte des données d'un graphique (toute valeur sérialisable en JSON)."""
+        encoded = json.dumps([CACHE_VERSION, parts], sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def make_key(fingerprint, width, height, device_pixel_ratio):
+        return hashlib.sha1(f"{fingerprint}:{width}x{height}@{device_pixel_ratio:g}".encode()).hexdigest()
+
+    def _disk_path(self, key):
+        if self.directory is None:
+            self.directory = os.path.join(get_cache_dir(), CHARTS_DIR_NAME)
+            os.makedirs(self.directory, exist_ok=True)
+        return os.path.join(self.directory, f"{key}.png")
+
+    def get(self, key, device_pixel_ratio=1.0):
+        pixmap = self._memory.get(key)
+        if pixmap is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return pixmap
+
+        path = self._disk_path(key)
+        pixmap = QPixmap()
+        if os.path.exists(path) and pixmap.load(path, "PNG"):
+            pixmap.setDevicePixelRatio(device_pixel_ratio)
+            try:
+                os.utime(path)  # Récemment utilisé
+            except OSError:
+                pass
+            self._remember(key, pixmap)
+            self.disk_hits += 1
+            return pixmap
+
+        self.misses += 1
+        return None
+
+    def put(self, key, pixmap):
+        self._remember(key, pixmap)
+        path = self._disk_path(key)
+        if not pixmap.save(path, "PNG"):
+            print("Graphique non enregistré dans le cache :", path)
+            return
+        self._evict_disk()
+
+    def _remember(self, key, pixmap):
+        if key in self._memory:
+            self._memory_bytes -= self._size_of(self._memory.pop(key))
+        self._memory[key] = pixmap
+        self._memory_bytes += self._size_of(pixmap)
+        while self._memory_bytes > MEMORY_MAX_BYTES and len(self._memory) > 1:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= self._size_of(evicted)
+
+    @staticmethod
+    def _size_of(pixmap):
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+    def _evict_disk(self):
+        try:
+            entries = []
+            for name in os.listdir(self.directory):
+                if name.endswith(".png"):
+                    stat = os.stat(os.path.join(self.directory, name))
+                    entries.append((stat.st_mtime, stat.st_size, name))
+        except OSError as e:
+            print("Cache des graphiques illisible :", e)
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= MAX_DISK_BYTES:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+                total -= size
+            except OSError:
+                pass
+
+    def clear(self):
+        self._memory.clear()
+        self._memory_bytes = 0
+        if self.directory and os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".png"):
+                    try:
+                        os.remove(os.path.join(self.directory, name))
+                    except OSError:
+                        pass
+
+
+chart_cache = ChartCache()
+
+
+class CachedChart(QWidget):
+    """
+    Affiche un graphique rendu par `render(width, height, device_pixel_ratio)`
+    -> QPixmap, via chart_cache. `fingerprint` identifie les données
+    (ChartCache.fingerprint). Une image en cache s'affiche dès le premier
+    paintEvent ; sinon le rendu est fait au tour suivant de la boucle
+    d'événements (taille définitive une fois le layout appliqué), ou
+    RESIZE_RENDER_DELAY_MS après un redimensionnement, l'image précédente
+    étant étirée en attendant.
+    """
+
+    def __init__(self, fingerprint, render, parent=None):
+        super().__init__(parent)
+        self.fingerprint = fingerprint
+        self.render = render
+        self.pixmap = None
+        self.pixmap_key = None
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.render_timer = QTimer(self)
+        self.render_timer.setSingleShot(True)
+        self.render_timer.timeout.connect(self.render_pixmap)
+
+    def current_key(self):
+        return ChartCache.make_key(self.fingerprint, self.width(), self.height(), self.devicePixelRatioF())
+
+    def render_pixmap(self):
+        if not self.isVisible() or self.width() <= 0 or self.height() <= 0:
+            return
+        key = self.current_key()
+        if key != self.pixmap_key:
+            self.pixmap = self.render(self.width(), self.height(), self.devicePixelRatioF())
+            self.pixmap_key = key
+            chart_cache.put(key, self.pixmap)
+            self.update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.render_timer.isActive():
+            self.render_timer.start(RESIZE_RENDER_DELAY_MS)  # Redimensionnement toujours en cours
+
+    def paintEvent(self, event):
+        key = self.current_key()
+        if key != self.pixmap_key and not self.render_timer.isActive():
+            cached = chart_cache.get(key, self.devicePixelRatioF())
+            if cached is not None:
+                self.pixmap, self.pixmap_key = cached, key
+            else:
+                self.render_timer.start(RESIZE_RENDER_DELAY_MS if self.pixmap is not None else 0)
+        if self.pixmap is None:
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.drawPixmap(self.rect(), self.pixmap)
+        painter.end()
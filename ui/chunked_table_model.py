@@ -0,0 +1,266 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+
+from services.search_index import default_key
+from ui.remote_page_list import RemotePageList
+
+
+CHUNK_SIZE = 100      # Lignes demandées au serveur par tranche en défilement continu
+KEEP_CHUNKS = 3       # Tranches gardées en mémoire de part et d'autre de la zone visible
+IDLE_MS = 200         # Pause de défilement avant préchargement et libération des tranches
+PATCH_LIMIT = 50      # Plages modifiées au-delà desquelles une réinitialisation est plus rapide
+LOADING_TEXT = "⏳ Chargement..."
+CONTINUOUS = "Continu"  # Choix « éléments par page » des écrans : défilement continu
+
+
+class ChunkedTableModel(QAbstractTableModel):
+    """
+    Modèle de tableau en défilement continu.
+
+    set_rows() accepte une liste (résultat filtré, déjà en mémoire) ou une
+    RemotePageList (collection paginée côté serveur) :
+    - les lignes sont ajoutées par tranches (une page de la RemotePageList)
+      quand la vue approche de la fin (canFetchMore/fetchMore) ;
+    - après IDLE_MS sans défilement, la tranche suivante est préchargée et
+      les tranches éloignées de plus de KEEP_CHUNKS de la zone visible sont
+      libérées ; si l'on y revient, elles sont redemandées au serveur et
+      leurs lignes affichent LOADING_TEXT en attendant.
+
+    Quand une liste en remplace une autre (rafraîchissement après une
+    modification, page revenue du serveur), seules les différences sont
+    signalées à la vue (voir patch_rows) : la sélection et la position de
+    défilement sont conservées.
+
+    Les sous-classes définissent HEADERS et record_data(élément, index, rôle).
+    """
+    HEADERS = []
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        self.remote = None
+        self.revealed = 0      # Lignes présentées à la vue (mode RemotePageList)
+        self.waiting = None    # Tranche demandée par la vue, affichée dès réception
+        self.view = None
+        self.headers = {}      # (colonne, rôle) -> valeur modifiée (indicateurs de tri)
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.setInterval(IDLE_MS)
+        self.idle_timer.timeout.connect(self.on_idle)
+
+    def watch(self, view):
+        """Suit le défilement de `view` pour le préchargement et la libération des tranches."""
+        self.view = view
+        view.verticalScrollBar().valueChanged.connect(lambda _: self.idle_timer.start())
+
+    def set_rows(self, rows):
+        if self.remote is None and not isinstance(rows, RemotePageList):
+            self.patch_rows(rows)
+            return
+        if rows is self.remote:
+            return  # Mêmes tranches : le modèle suit déjà leurs rechargements
+        if self.remote is not None:
+            self.remote.page_loaded.disconnect(self.on_chunk_loaded)
+        self.beginResetModel()
+        self.rows = rows
+        self.remote = rows if isinstance(rows, RemotePageList) else None
+        self.revealed = 0
+        self.waiting = None
+        if self.remote is not None:
+            self.remote.page_loaded.connect(self.on_chunk_loaded)
+            # Tranches déjà reçues depuis le début : affichées immédiatement
+            page = 1
+            while self.remote.is_loaded(page) and self.revealed < len(self.remote):
+                self.revealed = min(page * self.remote.page_size, len(self.remote))
+                page += 1
+        self.endResetModel()
+        if self.remote is not None and self.revealed == 0:
+            self.waiting = 1
+            self.remote.ensure_page(1)
+
+    def patch_rows(self, rows):
+        """
+        Remplace la liste affichée par `rows` en comparant les éléments par clé
+        (id) : seules les lignes retirées, insérées ou modifiées sont signalées.
+        Si l'ordre des lignes communes change (nouveau tri) ou si les plages
+        modifiées sont trop nombreuses, le modèle est réinitialisé.
+        """
+        old_keys = [default_key(record) for record in self.rows]
+        new_keys = [default_key(record) for record in rows]
+        old_set, new_set = set(old_keys), set(new_keys)
+        removed = [row for row, key in enumerate(old_keys) if key not in new_set]
+        inserted = [row for row, key in enumerate(new_keys) if key not in old_set]
+        removed_runs, inserted_runs = _runs(removed), _runs(inserted)
+        if (len(old_set) != len(old_keys) or len(new_set) != len(new_keys)
+                or len(removed_runs) + len(inserted_runs) > PATCH_LIMIT
+                or [key for key in old_keys if key in new_set] != [key for key in new_keys if key in old_set]):
+            self.beginResetModel()
+            self.rows = rows
+            self.endResetModel()
+            return
+
+        current = self.rows = list(self.rows)
+        for first, last in reversed(removed_runs):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del current[first:last + 1]
+            self.endRemoveRows()
+        for first, last in inserted_runs:
+            self.beginInsertRows(QModelIndex(), first, last)
+            current[first:first] = rows[first:last + 1]
+            self.endInsertRows()
+        changed = [row for row, (old, new) in enumerate(zip(current, rows)) if old is not new and old != new]
+        self.rows = rows
+        for first, last in _runs(changed):
+            self.dataChanged.emit(self.index(first, 0), self.index(last, self.columnCount() - 1))
+
+    def replace_record(self, old, new):
+        """
+        Remplace l'élément `old` par `new` (ou le retire si `new` est None)
+        sans réinitialiser le modèle ; en mode RemotePageList, la tranche
+        concernée est modifiée (RemotePageList.replace).
+        """
+        if self.remote is None:
+            self.patch_rows([new if record is old else record
+                             for record in self.rows if record is not old or new is not None])
+            return
+        row = self.remote.index_of(old)
+        if row is None:
+            return
+        if new is None and row < self.revealed:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self.remote.replace(old, None)
+            self.revealed -= 1
+            self.endRemoveRows()
+            return
+        self.remote.replace(old, new)
+        if row < self.revealed:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def insert_record(self, row, record):
+        """
+        Rétablit `record` à la ligne `row` (retrait annulé, inverse de
+        replace_record(record, None)) sans réinitialiser le modèle.
+        """
+        if self.remote is None:
+            rows = list(self.rows)
+            rows.insert(min(row, len(rows)), record)
+            self.patch_rows(rows)
+            return
+        if self.remote.index_of_key(default_key(record)) is not None:
+            return  # Tranche rechargée entre-temps : l'élément y figure déjà
+        if row > self.revealed:
+            self.remote.insert(row, record)  # Ligne pas encore présentée à la vue
+            return
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.remote.insert(row, record)
+        self.revealed += 1
+        self.endInsertRows()
+
+    def record(self, row):
+        if self.remote is None:
+            return self.rows[row]
+        return self.remote.get(row)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.revealed if self.remote is not None else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return self.remote is not None and not parent.isValid() and self.revealed < len(self.remote)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        page = self.remote.page_of(self.revealed)
+        if self.remote.is_loaded(page):
+            self.reveal(page)  # Tranche préchargée : aucune attente
+        else:
+            self.waiting = page
+            self.remote.ensure_page(page)
+
+    def reveal(self, page):
+        end = min(page * self.remote.page_size, len(self.remote))
+        if end <= self.revealed:
+            return
+        self.beginInsertRows(QModelIndex(), self.revealed, end - 1)
+        self.revealed = end
+        self.endInsertRows()
+
+    def on_chunk_loaded(self, page):
+        if self.revealed > len(self.remote):
+            # Éléments supprimés depuis le dernier chargement
+            self.beginRemoveRows(QModelIndex(), len(self.remote), self.revealed - 1)
+            self.revealed = len(self.remote)
+            self.endRemoveRows()
+        first = (page - 1) * self.remote.page_size
+        if page == self.waiting and first == self.revealed:
+            self.waiting = None
+            self.reveal(page)
+        elif first < self.revealed:
+            last = min(first + self.remote.page_size, self.revealed) - 1
+            old, new = self.remote.replaced, self.remote.rows_of(page)
+            if old is None:
+                # Tranche libérée puis redemandée : remplacer les lignes « Chargement »
+                changed = [(first, last)]
+            else:
+                # Tranche rechargée après une modification : lignes différentes seulement
+                changed = _runs([first + offset for offset, (before, after) in enumerate(zip(old, new))
+                                 if first + offset <= last and before is not after and before != after])
+            for first_row, last_row in changed:
+                self.dataChanged.emit(self.index(first_row, 0), self.index(last_row, self.columnCount() - 1))
+        self.idle_timer.start()
+
+    def on_idle(self):
+        if self.remote is None:
+            return
+        if self.revealed < len(self.remote):
+            self.remote.ensure_page(self.remote.page_of(self.revealed))  # Préchargement
+        if self.view is not None and self.revealed:
+            top = max(self.view.rowAt(0), 0)
+            bottom = self.view.rowAt(self.view.viewport().height() - 1)
+            if bottom < 0:
+                bottom = self.revealed - 1
+            self.remote.evict(self.remote.page_of(top) - KEEP_CHUNKS,
+                              self.remote.page_of(bottom) + KEEP_CHUNKS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation != Qt.Horizontal:
+            return None
+        if (section, role) in self.headers:
+            return self.headers[(section, role)]
+        if role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def setHeaderData(self, section, orientation, value, role=Qt.EditRole):
+        if orientation != Qt.Horizontal:
+            return False
+        self.headers[(section, Qt.DisplayRole if role == Qt.EditRole else role)] = value
+        self.headerDataChanged.emit(orientation, section, section)
+        return True
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        record = self.record(index.row())
+        if record is None:
+            # Tranche libérée, en cours de rechargement
+            return LOADING_TEXT if role == Qt.DisplayRole and index.column() == 0 else None
+        return self.record_data(record, index, role)
+
+    def record_data(self, record, index, role):
+        raise NotImplementedError
+
+
+def _runs(rows):
+    """Plages contiguës (première, dernière) d'une liste croissante de numéros de ligne."""
+    runs = []
+    for row in rows:
+        if runs and runs[-1][1] == row - 1:
+            runs[-1][1] = row
+        else:
+            runs.append([row, row])
+    return [tuple(run) for run in runs]
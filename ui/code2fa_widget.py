@@ -4,6 +4,7 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdi
 from PyQt5.QtGui import QFont, QPixmap, QIcon
 from PyQt5.QtCore import Qt, QTimer, QEvent, QSize
 from services.auth_service import AuthService
+from services import startup_timeline
 
 
 class OTPDigitInput(QLineEdit):
@@ -293,6 +294,7 @@ class Code2FAWidget(QWidget):
         response = AuthService.verify_code(code)
 
         if response.get("success"):
+            startup_timeline.mark("2fa_verified")
             self.show_success_message("Authentification réussie",
                                       "Votre identité a été vérifiée avec succès !")
 
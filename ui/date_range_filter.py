@@ -0,0 +1,72 @@
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QCheckBox, QDateEdit, QLabel
+from PyQt5.QtCore import QDate, pyqtSignal
+
+
+DATE_EDIT_STYLE = """
+    QDateEdit {
+        padding: 5px;
+        border: 1px solid #bdc3c7;
+        border-radius: 3px;
+        background-color: white;
+    }
+    QDateEdit:disabled {
+        color: #95a5a6;
+        background-color: #f5f7fa;
+    }
+"""
+
+
+class DateRangeFilter(QWidget):
+    """
+    Filtre « Période : du ... au ... » des barres de filtres.
+    La case à cocher active le filtre ; period() renvoie alors
+    (datetime.date début, datetime.date fin), sinon None.
+    `changed` est émis à chaque modification effective.
+    """
+    changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(5)
+
+        self.enabled_check = QCheckBox("Période du")
+        self.enabled_check.setToolTip("Filtrer entre deux dates (bornes incluses)")
+        self.enabled_check.toggled.connect(self.on_toggled)
+        layout.addWidget(self.enabled_check)
+
+        today = QDate.currentDate()
+        self.start_input = self.create_date_edit(QDate(today.year(), today.month(), 1))
+        layout.addWidget(self.start_input)
+        layout.addWidget(QLabel("au"))
+        self.end_input = self.create_date_edit(today)
+        layout.addWidget(self.end_input)
+
+    def create_date_edit(self, date):
+        date_edit = QDateEdit(date)
+        date_edit.setCalendarPopup(True)
+        date_edit.setDisplayFormat("dd/MM/yyyy")
+        date_edit.setStyleSheet(DATE_EDIT_STYLE)
+        date_edit.setEnabled(False)
+        date_edit.dateChanged.connect(self.on_date_changed)
+        return date_edit
+
+    def is_active(self):
+        return self.enabled_check.isChecked()
+
+    def period(self):
+        if not self.is_active():
+            return None
+        start = self.start_input.date().toPyDate()
+        end = self.end_input.date().toPyDate()
+        return (start, end) if start <= end else (end, start)
+
+    def on_toggled(self, checked):
+        self.start_input.setEnabled(checked)
+        self.end_input.setEnabled(checked)
+        self.changed.emit()
+
+    def on_date_changed(self, _date):
+        if self.is_active():
+            self.changed.emit()
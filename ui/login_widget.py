@@ -4,6 +4,7 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdi
 from PyQt5.QtGui import QFont, QPixmap, QIcon
 from PyQt5.QtCore import Qt
 from services.auth_service import AuthService
+from services.backend_readiness import backend
 
 
 class LoginWidget(QWidget):
@@ -16,6 +17,7 @@ class LoginWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent  # Référence à MainApp
+        self.login_queued = False  # Connexion demandée avant que le serveur réponde
         self.setStyleSheet("""
             QWidget {
                 background-color: #f8f9fa;
@@ -24,6 +26,15 @@ class LoginWidget(QWidget):
         """)
         self.init_ui()
 
+        # Serveur en cours de démarrage (wrapper_main.py) : état affiché sous le bouton
+        backend.progress.connect(self.on_backend_progress)
+        backend.ready.connect(self.on_backend_ready)
+        backend.failed.connect(self.on_backend_failed)
+        if backend.is_waiting():
+            self.show_backend_status("⏳ Démarrage du serveur...")
+        elif backend.has_failed():
+            self.on_backend_failed(backend.message)
+
     def init_ui(self):
         # Layout principal avec deux sections côte à côte
         main_layout = QHBoxLayout(self)
@@ -174,7 +185,7 @@ class LoginWidget(QWidget):
         options_layout.addWidget(forgot_password)
 
         # Bouton de connexion
-        login_button = QPushButton("Se connecter")
+        login_button = self.login_button = QPushButton("Se connecter")
         login_button.setMinimumHeight(50)
         login_button.setCursor(Qt.PointingHandCursor)
         login_button.setStyleSheet("""
@@ -191,9 +202,18 @@ class LoginWidget(QWidget):
             QPushButton:pressed {
                 background-color: #004c82;
             }
+            QPushButton:disabled {
+                background-color: #7fb3e0;
+            }
         """)
         login_button.clicked.connect(self.attempt_login)
 
+        # État du serveur pendant son démarrage (masqué une fois prêt)
+        self.backend_status = QLabel()
+        self.backend_status.setAlignment(Qt.AlignCenter)
+        self.backend_status.setStyleSheet("color: #666666; font-size: 12px;")
+        self.backend_status.setVisible(False)
+
         # Ligne de séparation
         separator = QFrame()
         separator.setFrameShape(QFrame.HLine)
@@ -210,6 +230,7 @@ class LoginWidget(QWidget):
         form_layout.addLayout(options_layout)
         form_layout.addItem(QSpacerItem(20, 20, QSizePolicy.Minimum, QSizePolicy.Fixed))
         form_layout.addWidget(login_button)
+        form_layout.addWidget(self.backend_status)
         form_layout.addItem(QSpacerItem(20, 30, QSizePolicy.Minimum, QSizePolicy.Fixed))
         form_layout.addWidget(separator)
         form_layout.addItem(QSpacerItem(20, 20, QSizePolicy.Minimum, QSizePolicy.Fixed))
@@ -243,6 +264,15 @@ class LoginWidget(QWidget):
             self.show_error_message("Champs requis", "Veuillez entrer votre email et mot de passe.")
             return
 
+        if backend.is_waiting():
+            # Envoyée dès que le serveur répond : pas d'erreur « connexion refusée »
+            if not self.login_queued:
+                self.login_queued = True
+                self.login_button.setEnabled(False)
+                self.login_button.setText("⏳ Connexion dès que le serveur est prêt...")
+                backend.when_ready(self.send_queued_login)
+            return
+
         response = AuthService.login(email, password)
 
         if response.get("success"):
@@ -253,6 +283,26 @@ class LoginWidget(QWidget):
             self.show_error_message("Erreur d'authentification",
                                     response.get("message", "Identifiants incorrects. Veuillez réessayer."))
 
+    def send_queued_login(self):
+        self.login_queued = False
+        self.login_button.setEnabled(True)
+        self.login_button.setText("Se connecter")
+        self.attempt_login()
+
+    def show_backend_status(self, text, color="#666666"):
+        self.backend_status.setText(text)
+        self.backend_status.setStyleSheet(f"color: {color}; font-size: 12px;")
+        self.backend_status.setVisible(True)
+
+    def on_backend_progress(self, attempt, elapsed):
+        self.show_backend_status(f"⏳ Démarrage du serveur... ({elapsed:.0f} s)")
+
+    def on_backend_ready(self):
+        self.backend_status.setVisible(False)
+
+    def on_backend_failed(self, message):
+        self.show_backend_status(f"⚠️ {message}", "#d32f2f")
+
     def show_error_message(self, title, message):
         """Affiche une boîte de message d'erreur stylisée"""
         msg_box = QMessageBox(self)
@@ -1,24 +1,41 @@
 from PyQt5.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLabel, QListWidget, QListWidgetItem,
     QStackedWidget, QPushButton, QMessageBox, QGraphicsDropShadowEffect, QSizePolicy,
-    QFrame, QDialog
+    QFrame, QDialog, QShortcut
 )
 from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QSize, pyqtSignal, QTimer
-from PyQt5.QtGui import QColor, QFont, QLinearGradient, QPalette, QIcon, QPixmap
+from PyQt5.QtGui import QColor, QFont, QLinearGradient, QPalette, QIcon, QPixmap, QKeySequence
 from PyQt5.QtCore import QTimer
+import importlib
 
-from modules.NotificationsWidget import NotificationsWidget
-from modules.mon_compte_widget import MonCompteWidget
-from modules.utilisateur_widget import UtilisateursWidget
-from modules.dashboard_global_widget import DashboardGlobalWidget
-from modules.budgets_widget import BudgetsWidget
-from modules.depenses_widget import DepensesWidget
-from modules.recettes_widget import RecettesWidget
-from modules.commandes_widget import CommandesWidget
-from modules.rapports_widget import RapportsWidget
-from modules.journal_audit_widget import JournalAuditWidget
+from services.async_service import run_async
 from services.auth_service import AuthService
 from services.notification_service import get_notifications
+from services import startup_timeline
+
+
+# Écrans de la barre latérale : (module, classe). Chaque module n'est importé
+# qu'au premier affichage de l'écran (change_module) ; le démarrage de
+# l'application ne charge ainsi ni matplotlib ni les écrans jamais ouverts.
+MODULE_WIDGETS = {
+    "Accueil": ("modules.dashboard_global_widget", "DashboardGlobalWidget"),
+    "Budgets": ("modules.budgets_widget", "BudgetsWidget"),
+    "Recettes": ("modules.recettes_widget", "RecettesWidget"),
+    "Dépenses": ("modules.depenses_widget", "DepensesWidget"),
+    "Commandes": ("modules.commandes_widget", "CommandesWidget"),
+    "Rapports": ("modules.rapports_widget", "RapportsWidget"),
+    "Journal d'audit": ("modules.journal_audit_widget", "JournalAuditWidget"),
+    "Utilisateurs": ("modules.utilisateur_widget", "UtilisateursWidget"),
+    "Mon Compte": ("modules.mon_compte_widget", "MonCompteWidget"),
+}
+
+
+def load_widget_class(module_name):
+    """Importe (une seule fois) et renvoie la classe de l'écran `module_name`, None s'il est inconnu."""
+    if module_name not in MODULE_WIDGETS:
+        return None
+    module_path, class_name = MODULE_WIDGETS[module_name]
+    return getattr(importlib.import_module(module_path), class_name)
 
 
 class SidebarItem(QWidget):
@@ -115,6 +132,7 @@ class MainLayout(QWidget):
         self.modules = {}
         self.sidebar_items = []
         self.current_module_index = 0
+        self._notif_task = None
 
         # Configuration de l'interface
         self.setup_ui_style()
@@ -123,6 +141,11 @@ class MainLayout(QWidget):
         self.start_notification_refresh()
         self.previous_non_lues = 0
 
+        # Panneau de diagnostic caché (mesures des appels API et de l'interface)
+        self.diagnostics_shortcut = QShortcut(QKeySequence("Ctrl+Shift+D"), self)
+        self.diagnostics_shortcut.activated.connect(self.open_diagnostics)
+        startup_timeline.mark("main_layout_built")
+
     def setup_ui_style(self):
         # Fond dégradé élégant
         palette = self.palette()
@@ -480,21 +503,8 @@ class MainLayout(QWidget):
             # Récupérer le nom du module
             module_name = self.sidebar_items[index].text_label.text().strip()
 
-            # Création du widget correspondant - Correction de la map pour s'assurer que tous les modules sont correctement définis
-            widget_map = {
-                "Accueil": DashboardGlobalWidget,
-                "Budgets": BudgetsWidget,
-                "Recettes": RecettesWidget,
-                "Dépenses": DepensesWidget,
-                "Commandes": CommandesWidget,  # Correction: il s'appelait "Commandes"
-                "Rapports": RapportsWidget,
-                "Journal d'audit": JournalAuditWidget,
-                "Utilisateurs": UtilisateursWidget,
-                "Mon Compte": MonCompteWidget,
-            }
-
-            # Utiliser module_map pour les alias si nécessaire
-            widget_class = widget_map.get(module_name)
+            # Création du widget correspondant (module importé au premier affichage)
+            widget_class = load_widget_class(module_name)
 
             if widget_class:
                 widget = widget_class()
@@ -624,9 +634,15 @@ class MainLayout(QWidget):
         self.setPalette(palette)
 
     def open_notifications(self):
+        from modules.NotificationsWidget import NotificationsWidget  # Chargé à la première ouverture
         notif_dialog = NotificationsWidget(self)
         notif_dialog.exec_()  # Ouvre en mode modal
 
+    def open_diagnostics(self):
+        from ui.modules.diagnostics_dialog import DiagnosticsDialog  # Chargé à la première ouverture
+        dialog = DiagnosticsDialog(self)
+        dialog.exec_()
+
     def update_notification_badge(self, count):
         if count > 0:
             self.badge_label.setText(str(count))
@@ -711,7 +727,12 @@ class MainLayout(QWidget):
         if not AuthService.get_headers():
             print("Pas encore connecté, refresh notifications ignoré.")
             return
-        result = get_notifications()
+        if self._notif_task is not None:
+            return  # Le rafraîchissement précédent n'a pas encore répondu
+        self._notif_task = run_async(get_notifications, on_result=self.on_notifications_loaded, owner=self)
+
+    def on_notifications_loaded(self, result):
+        self._notif_task = None
         if result["success"]:
             non_lues = [n for n in result["data"] if not n.get("lu", False)]
             count = len(non_lues)
@@ -1,6 +1,7 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QGroupBox
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.pyplot as plt
+from PyQt5.QtGui import QImage, QPixmap
+
+from ui.chart_cache import CachedChart, ChartCache
 
 class BudgetDashboardWidget(QWidget):
     def __init__(self, budget_data, parent=None):
@@ -36,7 +37,6 @@ class BudgetDashboardWidget(QWidget):
         layout.addWidget(resume_group)
 
         # --- Graphique ---
-        fig, ax = plt.subplots(figsize=(4, 4))
         labels = ['Disponible', 'Dépenses validées']
         values = [montant_disponible, montant_total_depenses]
         colors = ['#4caf50', '#f44336']
@@ -46,9 +46,30 @@ class BudgetDashboardWidget(QWidget):
         if sum(safe_values) == 0:
             safe_values = [1, 0]  # Placeholder visuel
 
-        ax.pie(safe_values, labels=labels, autopct='%1.1f%%', startangle=90, colors=colors)
-        ax.axis('equal')
-        ax.set_title("Répartition du budget")
+        # Rendu mis en cache (ui.chart_cache) : matplotlib n'est importé que si
+        # ce graphique n'a jamais été rendu avec ces montants à cette taille
+        chart = CachedChart(ChartCache.fingerprint("budget_pie", safe_values, labels, colors),
+                            lambda width, height, ratio: render_pie(safe_values, labels, colors,
+                                                                    width, height, ratio))
+        chart.setMinimumSize(300, 300)
+        layout.addWidget(chart)
+
+
+def render_pie(values, labels, colors, width, height, device_pixel_ratio):
+    # Figure autonome (sans pyplot) rendue hors écran par Agg, puis convertie en QPixmap
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=(width / 100, height / 100), dpi=100 * device_pixel_ratio)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    ax.pie(values, labels=labels, autopct='%1.1f%%', startangle=90, colors=colors)
+    ax.axis('equal')
+    ax.set_title("Répartition du budget")
+    canvas.draw()
 
-        canvas = FigureCanvas(fig)
-        layout.addWidget(canvas)
+    buffer = canvas.buffer_rgba()
+    image = QImage(buffer, buffer.shape[1], buffer.shape[0], QImage.Format_RGBA8888).copy()
+    pixmap = QPixmap.fromImage(image)
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    return pixmap
@@ -0,0 +1,266 @@
+# ui/modules/dashboard_charts.py
+"""
+Graphiques animés du tableau de bord global, dessinés avec QPainter.
+
+L'animation ne fait que modifier la propriété `progress` (QPropertyAnimation,
+comme AnimatedProgressBar) : chaque image est un simple paintEvent de
+quelques rectangles / secteurs, au lieu d'un rendu matplotlib complet
+(axes.clear(), tight_layout(), draw()) toutes les 50 ms. matplotlib n'est
+plus importé par le tableau de bord global.
+
+L'image finale est conservée dans ui.chart_cache : si les mêmes données ont
+déjà été affichées à cette taille, le graphique apparaît directement, sans
+rejouer l'animation.
+"""
+import math
+
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtGui import QPainter, QColor, QFont, QFontMetrics, QPen, QBrush, QPixmap
+from PyQt5.QtCore import Qt, QRectF, QPointF, QSize, QPropertyAnimation, QEasingCurve, pyqtProperty
+
+from ui.chart_cache import ChartCache, chart_cache
+
+
+ANIMATION_MS = 1000  # Ancienne animation : 20 images x 50 ms
+TEXT_COLOR = QColor("#333333")
+AXIS_COLOR = QColor(0, 0, 0, 77)  # Axes à 30 % d'opacité
+GRID_COLOR = QColor(0, 0, 0, 20)
+
+
+def format_amount(value):
+    return f"{value:,.0f}".replace(",", " ")
+
+
+def nice_ticks(maximum, count=5):
+    """Graduations « rondes » (1, 2, 2.5 ou 5 x 10^n) de 0 à `maximum` inclus."""
+    if maximum <= 0:
+        return [0]
+    raw = maximum / count
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw)
+    return [i * step for i in range(int(maximum / step) + 1)]
+
+
+class AnimatedChart(QWidget):
+    """Base des graphiques : propriété `progress` (0 -> 1) animée par startAnimation()."""
+
+    def __init__(self, title="", parent=None):
+        super().__init__(parent)
+        self.title = title
+        self._progress = 0.0
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumHeight(220)
+
+        self.animation = QPropertyAnimation(self, b"progress", self)
+        self.animation.setDuration(ANIMATION_MS)
+        self.animation.setEasingCurve(QEasingCurve.OutCubic)
+        self.animation.setStartValue(0.0)
+        self.animation.setEndValue(1.0)
+
+    @pyqtProperty(float)
+    def progress(self):
+        return self._progress
+
+    @progress.setter
+    def progress(self, value):
+        self._progress = value
+        self.update()
+
+    def fingerprint(self):
+        return ChartCache.fingerprint(type(self).__name__, self.title, *self.series())
+
+    def series(self):
+        raise NotImplementedError
+
+    def final_key(self):
+        return ChartCache.make_key(self.fingerprint(), self.width(), self.height(), self.devicePixelRatioF())
+
+    def startAnimation(self):
+        self.animation.stop()
+        if chart_cache.get(self.final_key(), self.devicePixelRatioF()) is not None:
+            self.progress = 1.0  # Données déjà affichées : pas d'animation
+            return
+        self.animation.start()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self._progress >= 1:
+            painter.drawPixmap(0, 0, self.final_pixmap())
+        else:
+            painter.setRenderHint(QPainter.Antialiasing)
+            self.render_chart(painter, QRectF(self.rect()), self._progress)
+        painter.end()
+
+    def final_pixmap(self):
+        key = self.final_key()
+        ratio = self.devicePixelRatioF()
+        pixmap = chart_cache.get(key, ratio)
+        if pixmap is None:
+            pixmap = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            self.render_chart(painter, QRectF(self.rect()), 1.0)
+            painter.end()
+            chart_cache.put(key, pixmap)
+        return pixmap
+
+    def render_chart(self, painter, rect, progress):
+        raise NotImplementedError
+
+    @staticmethod
+    def chart_font(point_size, bold=False):
+        font = QFont()
+        font.setPointSizeF(point_size)
+        font.setBold(bold)
+        return font
+
+
+class ResponsiveBarChart(AnimatedChart):
+    def __init__(self, data, labels, colors, title="", parent=None):
+        super().__init__(title, parent)
+        self.data = data
+        self.labels = labels
+        self.colors = colors
+
+    def sizeHint(self):
+        return QSize(500, 300)
+
+    def series(self):
+        return self.data, self.labels, self.colors
+
+    def render_chart(self, painter, rect, progress):
+        title_font = self.chart_font(11, bold=True)
+        tick_font = self.chart_font(9)
+        tick_metrics = QFontMetrics(tick_font)
+
+        # Titre
+        top = rect.top() + 8
+        if self.title:
+            painter.setFont(title_font)
+            painter.setPen(TEXT_COLOR)
+            title_height = QFontMetrics(title_font).height()
+            painter.drawText(QRectF(rect.left(), top, rect.width(), title_height), Qt.AlignCenter, self.title)
+            top += title_height + 10
+
+        # Zone du graphique : graduations à gauche, libellés inclinés à 45° en dessous
+        maximum = max(self.data) * 1.2 if self.data and max(self.data) > 0 else 1
+        ticks = nice_ticks(maximum)
+        left = rect.left() + 8 + max(tick_metrics.horizontalAdvance(format_amount(t)) for t in ticks) + 6
+        longest_label = max((tick_metrics.horizontalAdvance(str(label)) for label in self.labels), default=0)
+        bottom = rect.bottom() - 8 - (longest_label + tick_metrics.height()) * math.sqrt(0.5)
+        plot = QRectF(QPointF(left, top), QPointF(rect.right() - 12, bottom))
+        if plot.width() <= 0 or plot.height() <= 0:
+            return
+
+        def y_of(value):
+            return plot.bottom() - value / maximum * plot.height()
+
+        # Graduations horizontales
+        painter.setFont(tick_font)
+        for tick in ticks:
+            y = y_of(tick)
+            painter.setPen(QPen(GRID_COLOR, 1))
+            if tick:
+                painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+            painter.setPen(TEXT_COLOR)
+            painter.drawText(QRectF(rect.left(), y - 10, plot.left() - rect.left() - 6, 20),
+                             Qt.AlignRight | Qt.AlignVCenter, format_amount(tick))
+
+        # Barres et libellés
+        slot = plot.width() / max(1, len(self.data))
+        for i, (value, label) in enumerate(zip(self.data, self.labels)):
+            x = plot.left() + i * slot
+            height = max(0, value) * progress / maximum * plot.height()
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QBrush(QColor(self.colors[i % len(self.colors)])))
+            painter.drawRect(QRectF(x + slot * 0.1, plot.bottom() - height, slot * 0.8, height))
+
+            painter.save()
+            painter.setPen(TEXT_COLOR)
+            painter.translate(x + slot / 2, plot.bottom() + 6)
+            painter.rotate(-45)
+            painter.drawText(QRectF(-longest_label - 4, -tick_metrics.height() / 2, longest_label + 4,
+                                    tick_metrics.height()), Qt.AlignRight | Qt.AlignVCenter, str(label))
+            painter.restore()
+
+        # Axes gauche et bas
+        painter.setPen(QPen(AXIS_COLOR, 1))
+        painter.drawLine(plot.bottomLeft(), plot.topLeft())
+        painter.drawLine(plot.bottomLeft(), plot.bottomRight())
+
+
+class ResponsiveDonutChart(AnimatedChart):
+    HOLE_RATIO = 0.7
+
+    def __init__(self, values, labels, colors, title="", parent=None):
+        super().__init__(title, parent)
+        self.values = values
+        self.labels = labels
+        self.colors = colors
+
+    def sizeHint(self):
+        return QSize(400, 300)
+
+    def series(self):
+        return self.values, self.labels, self.colors
+
+    def render_chart(self, painter, rect, progress):
+        label_font = self.chart_font(9)
+        label_metrics = QFontMetrics(label_font)
+        total = sum(v for v in self.values if v > 0)
+
+        if total <= 0:
+            painter.setFont(self.chart_font(10))
+            painter.setPen(QColor("gray"))
+            painter.drawText(rect, Qt.AlignCenter, "Aucune donnée\ndisponible")
+            return
+
+        # Place pour les libellés autour de l'anneau
+        margin = max(label_metrics.horizontalAdvance(str(label)) for label in self.labels) + 16
+        radius = min(rect.width() / 2 - margin, rect.height() / 2 - label_metrics.height() - 12)
+        if radius <= 0:
+            return
+        center = rect.center()
+        pie = QRectF(center.x() - radius, center.y() - radius, 2 * radius, 2 * radius)
+
+        # Secteurs dans le sens antihoraire depuis 12 h, déployés avec `progress`
+        angle = 90.0
+        painter.setPen(QPen(Qt.white, 1))
+        for i, value in enumerate(self.values):
+            if value <= 0:
+                continue
+            span = 360.0 * value / total
+            painter.setBrush(QBrush(QColor(self.colors[i % len(self.colors)])))
+            painter.drawPie(pie, int(angle * 16), int(span * progress * 16))
+
+            if progress >= 1:
+                middle = math.radians(angle + span / 2)
+                direction = QPointF(math.cos(middle), -math.sin(middle))
+                self.draw_centered(painter, label_font, TEXT_COLOR, center + direction * radius * 1.15,
+                                   str(self.labels[i]), align_x=direction.x())
+                if span / 3.6 > 5:
+                    self.draw_centered(painter, self.chart_font(8, bold=True), Qt.white,
+                                       center + direction * radius * (1 + self.HOLE_RATIO) / 2,
+                                       f"{span / 3.6:.1f}%")
+            angle += span * progress
+
+        # Trou central et titre
+        hole = radius * self.HOLE_RATIO
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QBrush(Qt.white))
+        painter.drawEllipse(center, hole, hole)
+        if self.title:
+            self.draw_centered(painter, self.chart_font(10, bold=True), TEXT_COLOR, center, self.title)
+
+    @staticmethod
+    def draw_centered(painter, font, color, point, text, align_x=0.0):
+        """Texte centré sur `point` ; align_x < 0 l'ancre à droite, > 0 à gauche (libellés extérieurs)."""
+        metrics = QFontMetrics(font)
+        width = metrics.horizontalAdvance(text)
+        x = point.x() - width / 2 + align_x * width / 2
+        painter.setFont(font)
+        painter.setPen(QPen(color))
+        painter.drawText(QRectF(x, point.y() - metrics.height() / 2, width, metrics.height()),
+                         Qt.AlignCenter, text)
@@ -3,9 +3,13 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushBut
                              QComboBox, QGraphicsDropShadowEffect, QTextEdit, QDialogButtonBox)
 from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve
 from PyQt5.QtGui import QColor, QFont, QBrush, QIcon
+from services.async_service import run_async
 from services.auth_service import AuthService
 from services.demande_depense_service import get_demandes_depense, create_demande_depense, valider_demande_depense, \
-    delete_demande_depense
+    delete_demande_depense, valider_demandes_depense, delete_demandes_depense
+from ui.action_buttons_delegate import ActionButtonsDelegate
+from ui.bulk_actions import BulkActionBar
+from ui.optimistic import OptimisticActions
 from ui.modules.demande_depense_form_dialog import DemandeDepenseFormDialog
 import datetime
 import math
@@ -21,6 +25,8 @@ class DemandesDepenseWidget(QDialog):
         self.filtered_demandes = []
         self.current_page = 1
         self.items_per_page = 10
+        # Validations et suppressions appliquées sans attendre le serveur
+        self.optimistic = OptimisticActions(self, self.reconcile_demandes)
         self.setup_ui()
         self.load_demandes()
         self.setup_animations()
@@ -207,6 +213,7 @@ class DemandesDepenseWidget(QDialog):
         self.table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         self.table.setShowGrid(False)
+        self.table.setItemDelegateForColumn(4, ActionButtonsDelegate(self.get_actions, self.table, 4))
 
         # Ajouter un effet d'ombre
         shadow = QGraphicsDropShadowEffect()
@@ -215,6 +222,20 @@ class DemandesDepenseWidget(QDialog):
         shadow.setOffset(0, 3)
         self.table.setGraphicsEffect(shadow)
 
+        # Actions groupées sur les lignes sélectionnées (selon le rôle)
+        self.bulk_bar = BulkActionBar(self.table, 4, self.reconcile_demandes, self)
+        if self.user_role == "directeur":
+            self.bulk_bar.add_action("✅ Valider la sélection", "#27ae60",
+                                     lambda: self.valider_selection(True),
+                                     "Approuver les demandes sélectionnées en attente")
+            self.bulk_bar.add_action("❌ Refuser la sélection", "#e74c3c",
+                                     lambda: self.valider_selection(False),
+                                     "Refuser les demandes sélectionnées en attente")
+        elif self.user_role == "comptable":
+            self.bulk_bar.add_action("🗑 Supprimer la sélection", "#e74c3c", self.supprimer_selection,
+                                     "Supprimer les demandes sélectionnées en attente")
+        layout.addWidget(self.bulk_bar)
+
         layout.addWidget(self.table)
 
         # Pagination
@@ -392,9 +413,10 @@ class DemandesDepenseWidget(QDialog):
             user_item = QTableWidgetItem(demande["utilisateur_nom"])
             self.table.setItem(i, 3, user_item)
 
-            # Actions
-            action_widget = self.create_action_widget(demande)
-            self.table.setCellWidget(i, 4, action_widget)
+            # Actions (boutons dessinés par le délégué)
+            action_item = QTableWidgetItem()
+            action_item.setData(Qt.UserRole, demande)
+            self.table.setItem(i, 4, action_item)
 
             # Alternance des couleurs de ligne
             if i % 2 == 0:
@@ -476,6 +498,7 @@ class DemandesDepenseWidget(QDialog):
 
     def go_to_page(self, page):
         self.current_page = page
+        self.table.clearSelection()  # Les lignes de la nouvelle page sont d'autres demandes
         self.update_table()
         self.update_pagination()
 
@@ -488,124 +511,32 @@ class DemandesDepenseWidget(QDialog):
         if self.current_page < total_pages:
             self.go_to_page(self.current_page + 1)
 
-    def create_action_widget(self, demande):
-        action_widget = QWidget()
-        action_layout = QHBoxLayout(action_widget)
-        action_layout.setContentsMargins(5, 0, 5, 0)
-        action_layout.setSpacing(8)
-
-        if demande["statut"] == "en_attente":
-            # Directeur : Valider / Refuser
-            if self.user_role == "directeur":
-                btn_valider = QPushButton("✅ Valider")
-                btn_valider.setStyleSheet("""
-                    QPushButton {
-                        background-color: #27ae60;
-                        color: white;
-                        padding: 5px 10px;
-                        border-radius: 3px;
-                        font-size: 12px;
-                        min-width: 80px;
-                        border: none;
-                    }
-                    QPushButton:hover {
-                        background-color: #2ecc71;
-                        box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-                    }
-                    QPushButton:pressed {
-                        background-color: #219653;
-                    }
-                """)
-                btn_valider.setToolTip("Approuver cette demande")
-                btn_valider.setCursor(Qt.PointingHandCursor)
-                btn_valider.clicked.connect(lambda _, d_id=demande["id"]: self.valider_demande(d_id, True))
-                action_layout.addWidget(btn_valider)
-
-                btn_refuser = QPushButton("❌ Refuser")
-                btn_refuser.setStyleSheet("""
-                    QPushButton {
-                        background-color: #e74c3c;
-                        color: white;
-                        padding: 5px 10px;
-                        border-radius: 3px;
-                        font-size: 12px;
-                        min-width: 80px;
-                        border: none;
-                    }
-                    QPushButton:hover {
-                        background-color: #c0392b;
-                        box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-                    }
-                    QPushButton:pressed {
-                        background-color: #922b21;
-                    }
-                """)
-                btn_refuser.setToolTip("Refuser cette demande")
-                btn_refuser.setCursor(Qt.PointingHandCursor)
-                btn_refuser.clicked.connect(lambda _, d_id=demande["id"]: self.valider_demande(d_id, False))
-                action_layout.addWidget(btn_refuser)
-
-            # Comptable : Modifier / Supprimer
-            if self.user_role == "comptable":
-                btn_modifier = QPushButton("✏️ Modifier")
-                btn_modifier.setStyleSheet("""
-                    QPushButton {
-                        background-color: #3498db;
-                        color: white;
-                        padding: 5px 10px;
-                        border-radius: 3px;
-                        font-size: 12px;
-                        min-width: 80px;
-                        border: none;
-                    }
-                    QPushButton:hover {
-                        background-color: #2980b9;
-                        box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-                    }
-                    QPushButton:pressed {
-                        background-color: #1f618d;
-                    }
-                """)
-                btn_modifier.setToolTip("Modifier cette demande")
-                btn_modifier.setCursor(Qt.PointingHandCursor)
-                btn_modifier.clicked.connect(lambda _, d_id=demande["id"]: self.modifier_demande(d_id))
-                action_layout.addWidget(btn_modifier)
-
-                btn_supprimer = QPushButton("🗑 Supprimer")
-                btn_supprimer.setStyleSheet("""
-                    QPushButton {
-                        background-color: #e74c3c;
-                        color: white;
-                        padding: 5px 10px;
-                        border-radius: 3px;
-                        font-size: 12px;
-                        min-width: 80px;
-                        border: none;
-                    }
-                    QPushButton:hover {
-                        background-color: #c0392b;
-                        box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-                    }
-                    QPushButton:pressed {
-                        background-color: #922b21;
-                    }
-                """)
-                btn_supprimer.setToolTip("Supprimer cette demande")
-                btn_supprimer.setCursor(Qt.PointingHandCursor)
-                btn_supprimer.clicked.connect(lambda _, d_id=demande["id"]: self.supprimer_demande(d_id))
-                action_layout.addWidget(btn_supprimer)
-        else:
+    def get_actions(self, demande):
+        """
+        Boutons de la colonne « Actions » (dessinés par ActionButtonsDelegate) :
+        (liste de (libellé, couleur, callback, infobulle), texte, couleur du texte).
+        """
+        if demande["statut"] != "en_attente":
             # Si la demande n'est pas en attente, afficher un statut visuel
-            status_text = "Approuvée" if demande["statut"] == "approuvée" else "Refusée"
-            status_color = "#27ae60" if demande["statut"] == "approuvée" else "#e74c3c"
-            status_icon = "✅" if demande["statut"] == "approuvée" else "❌"
-
-            status_label = QLabel(f"{status_icon} {status_text}")
-            status_label.setStyleSheet(f"color: {status_color}; font-weight: bold;")
-            action_layout.addWidget(status_label)
-
-        action_layout.addStretch()
-        return action_widget
+            if demande["statut"] == "approuvée":
+                return [], "✅ Approuvée", "#27ae60"
+            return [], "❌ Refusée", "#e74c3c"
+
+        actions = []
+        # Directeur : Valider / Refuser
+        if self.user_role == "directeur":
+            actions.append(("✅ Valider", "#27ae60",
+                            lambda: self.valider_demande(demande, True), "Approuver cette demande"))
+            actions.append(("❌ Refuser", "#e74c3c",
+                            lambda: self.valider_demande(demande, False), "Refuser cette demande"))
+
+        # Comptable : Modifier / Supprimer
+        if self.user_role == "comptable":
+            actions.append(("✏️ Modifier", "#3498db",
+                            lambda: self.modifier_demande(demande["id"]), "Modifier cette demande"))
+            actions.append(("🗑 Supprimer", "#e74c3c",
+                            lambda: self.supprimer_demande(demande), "Supprimer cette demande"))
+        return actions, "", None
 
     def open_form_dialog(self):
         dialog = DemandeDepenseFormDialog(self)
@@ -618,7 +549,7 @@ class DemandesDepenseWidget(QDialog):
             self.refresh_data()
             self.show_success_message("Succès", "La demande a été créée avec succès!")
 
-    def valider_demande(self, demande_id, valider):
+    def valider_demande(self, demande, valider):
         # Créer une boîte de dialogue pour le commentaire
         dialog = QDialog(self)
         dialog.setWindowTitle("Commentaire facultatif")
@@ -714,12 +645,26 @@ class DemandesDepenseWidget(QDialog):
         if dialog.exec_():
             commentaire = text_edit.toPlainText().strip()
             statut = "approuvée" if valider else "refusée"
-            result = valider_demande_depense(demande_id, statut, commentaire if commentaire else None)
-            if result["success"]:
-                self.show_success_message("Succès", f"La demande a été {statut} avec succès!")
-                self.refresh_data()
-            else:
-                self.show_error_message("Erreur", result["message"])
+            # Statut changé immédiatement à l'écran, rétabli si le serveur refuse
+            self.run_optimistic(demande, dict(demande, statut=statut),
+                                valider_demande_depense, demande["id"], statut, commentaire if commentaire else None,
+                                done_message=f"Demande {statut}.")
+
+    def valider_selection(self, valider):
+        demandes = [demande for demande in self.bulk_bar.selected_records() if demande["statut"] == "en_attente"]
+        statut = "approuvée" if valider else "refusée"
+        if valider:
+            self.bulk_bar.run("Validation groupée", "Approuver les demandes sélectionnées ?",
+                              valider_demandes_depense, demandes, statut)
+        else:
+            self.bulk_bar.run("Refus groupé", "Refuser les demandes sélectionnées ?",
+                              valider_demandes_depense, demandes, statut)
+
+    def supprimer_selection(self):
+        demandes = [demande for demande in self.bulk_bar.selected_records() if demande["statut"] == "en_attente"]
+        self.bulk_bar.run("Suppression groupée",
+                          "Voulez-vous vraiment supprimer les demandes sélectionnées ?\nCette action est irréversible.",
+                          delete_demandes_depense, demandes)
 
     def modifier_demande(self, demande_id):
         dialog = DemandeDepenseFormDialog(self, demande_id=demande_id)
@@ -733,19 +678,52 @@ class DemandesDepenseWidget(QDialog):
             self.refresh_data()
             self.show_success_message("Succès", "La demande a été modifiée avec succès!")
 
-    def supprimer_demande(self, demande_id):
+    def run_optimistic(self, demande, updated, fn, *args, done_message=None):
+        """
+        Applique `updated` (None : suppression) à l'écran sans attendre le
+        serveur ; l'état est rétabli, avec un toast d'erreur, si fn(*args) échoue.
+        """
+        self.optimistic.run(fn, *args, done_message=done_message,
+                            apply=lambda: self.replace_demande(demande, updated),
+                            rollback=lambda: self.replace_demande(updated, demande))
+
+    def replace_demande(self, old, new):
+        """Remplace (new=None : retire) une demande en conservant la page courante."""
+        if old is None:
+            # Annulation d'une suppression : la demande est rétablie au rechargement
+            self.reconcile_demandes()
+            return
+        self.patch_demandes([new if demande is old else demande for demande in self.demandes
+                             if demande is not old or new is not None])
+
+    def patch_demandes(self, demandes):
+        """Remplace les données affichées en conservant la page courante."""
+        page = self.current_page
+        self.demandes = demandes
+        self.apply_filters()
+        total_pages = math.ceil(len(self.filtered_demandes) / self.items_per_page) or 1
+        if min(page, total_pages) != self.current_page:
+            self.go_to_page(min(page, total_pages))
+
+    def reconcile_demandes(self):
+        # Rechargement en arrière-plan après des actions, sans revenir à la première page
+        run_async(get_demandes_depense, on_result=self.on_demandes_reconciled, owner=self)
+
+    def on_demandes_reconciled(self, result):
+        if result["success"]:
+            if result["data"] != self.demandes:
+                self.patch_demandes(result["data"])
+            self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
+
+    def supprimer_demande(self, demande):
         confirm = self.show_confirmation_dialog(
             "Confirmation de suppression",
             "Voulez-vous vraiment supprimer cette demande ?",
             "Cette action est irréversible."
         )
         if confirm == QMessageBox.Yes:
-            result = delete_demande_depense(demande_id)
-            if result["success"]:
-                self.show_success_message("Succès", "La demande a été supprimée avec succès!")
-                self.refresh_data()
-            else:
-                self.show_error_message("Erreur", result["message"])
+            self.run_optimistic(demande, None, delete_demande_depense, demande["id"],
+                                done_message="Demande supprimée.")
 
     def refresh_data(self):
         self.load_demandes()
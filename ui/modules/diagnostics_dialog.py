@@ -0,0 +1,190 @@
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget,
+                             QTableWidgetItem, QHeaderView, QPushButton)
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QColor
+from services.metrics import metrics, WINDOW
+from services import startup_timeline
+
+
+TABLE_STYLE = """
+    QTableWidget {
+        background-color: white;
+        border-radius: 8px;
+        gridline-color: #ecf0f1;
+        font-size: 12px;
+    }
+    QHeaderView::section {
+        background-color: #34495e;
+        color: white;
+        padding: 6px;
+        border: none;
+        font-weight: bold;
+    }
+"""
+
+
+def format_ms(value):
+    return "-" if value is None else f"{value:.0f}"
+
+
+def format_size(value):
+    if value is None:
+        return "-"
+    if value >= 1024 * 1024:
+        return f"{value / (1024 * 1024):.1f} Mo"
+    if value >= 1024:
+        return f"{value / 1024:.1f} Ko"
+    return f"{value:.0f} o"
+
+
+class DiagnosticsDialog(QDialog):
+    """
+    Panneau de diagnostic (caché) : latences par endpoint et durées de
+    l'interface, pour savoir si un écran lent vient du backend (TTFB), du
+    réseau (téléchargement), du décodage JSON ou de la reconstruction Qt.
+    Si la chronologie du démarrage est activée (services.startup_timeline),
+    ses étapes pour le lancement en cours sont affichées en dernier.
+    Ouvert par Ctrl+Maj+D depuis la fenêtre principale.
+    """
+
+    ENDPOINT_COLUMNS = ["Endpoint", "Appels", "Erreurs", "Statut",
+                        "Total p50", "Total p90", "Total p99",
+                        "TTFB p50", "Téléch. p50", "Décodage p50", "Taille p50"]
+    UI_COLUMNS = ["Opération", "Mesures", "p50", "p90", "p99", "Max"]
+    STARTUP_COLUMNS = ["Étape", "Depuis le lancement", "Écart"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setup_ui()
+        self.refresh()
+
+        # Mise à jour automatique tant que le panneau est ouvert
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(2000)
+
+    def setup_ui(self):
+        self.setWindowTitle("🩺 Diagnostic des performances")
+        self.setMinimumSize(1000, 600)
+        self.setStyleSheet("""
+            QDialog {
+                background-color: #f5f7fa;
+                font-family: 'Segoe UI';
+            }
+        """)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(10)
+
+        header = QLabel("APPELS API (durées en ms)")
+        header.setStyleSheet("font-size: 16px; font-weight: bold; color: #2c3e50;")
+        layout.addWidget(header)
+
+        self.endpoints_table = self.create_table(self.ENDPOINT_COLUMNS)
+        layout.addWidget(self.endpoints_table, 3)
+
+        ui_header = QLabel("INTERFACE (durées en ms)")
+        ui_header.setStyleSheet("font-size: 16px; font-weight: bold; color: #2c3e50;")
+        layout.addWidget(ui_header)
+
+        self.ui_table = self.create_table(self.UI_COLUMNS)
+        layout.addWidget(self.ui_table, 2)
+
+        startup_header = QLabel("DÉMARRAGE (durées en ms)")
+        startup_header.setStyleSheet("font-size: 16px; font-weight: bold; color: #2c3e50;")
+        layout.addWidget(startup_header)
+
+        if startup_timeline.is_enabled():
+            self.startup_table = self.create_table(self.STARTUP_COLUMNS)
+            layout.addWidget(self.startup_table, 2)
+        else:
+            self.startup_table = None
+            hint = QLabel(f"Chronologie désactivée : lancer l'application avec {startup_timeline.ENV_VAR}=1.")
+            hint.setStyleSheet("color: #7f8c8d; font-style: italic;")
+            layout.addWidget(hint)
+
+        footer = QHBoxLayout()
+        info = QLabel(f"Percentiles sur les {WINDOW} derniers appels de chaque série. "
+                      "TTFB = backend + latence, Téléch. = réseau.")
+        info.setStyleSheet("color: #7f8c8d; font-style: italic;")
+        footer.addWidget(info)
+        footer.addStretch()
+
+        reset_btn = QPushButton("Réinitialiser")
+        reset_btn.setCursor(Qt.PointingHandCursor)
+        reset_btn.clicked.connect(self.reset)
+        footer.addWidget(reset_btn)
+
+        close_btn = QPushButton("Fermer")
+        close_btn.setCursor(Qt.PointingHandCursor)
+        close_btn.clicked.connect(self.accept)
+        footer.addWidget(close_btn)
+
+        layout.addLayout(footer)
+
+    def create_table(self, columns):
+        table = QTableWidget()
+        table.setColumnCount(len(columns))
+        table.setHorizontalHeaderLabels(columns)
+        table.setStyleSheet(TABLE_STYLE)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setSortingEnabled(False)
+        return table
+
+    def fill_row(self, table, row, values):
+        for col, value in enumerate(values):
+            item = QTableWidgetItem(str(value))
+            if col > 0:
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            table.setItem(row, col, item)
+
+    def refresh(self):
+        snapshot = metrics.snapshot()
+
+        # Endpoints les plus lents (p90) en premier
+        endpoints = sorted(snapshot["endpoints"].items(),
+                           key=lambda item: item[1]["total"]["p90"] or 0, reverse=True)
+        self.endpoints_table.setRowCount(len(endpoints))
+        for row, (name, stats) in enumerate(endpoints):
+            self.fill_row(self.endpoints_table, row, [
+                name,
+                stats["calls"],
+                stats["errors"],
+                stats["last_status"],
+                format_ms(stats["total"]["p50"]),
+                format_ms(stats["total"]["p90"]),
+                format_ms(stats["total"]["p99"]),
+                format_ms(stats["ttfb"]["p50"]),
+                format_ms(stats["download"]["p50"]),
+                format_ms(stats["decode"]["p50"]),
+                format_size(stats["size"]["p50"]),
+            ])
+            if stats["errors"]:
+                self.endpoints_table.item(row, 2).setForeground(QColor("#e74c3c"))
+
+        operations = sorted(snapshot["ui"].items(),
+                            key=lambda item: item[1]["p90"] or 0, reverse=True)
+        self.ui_table.setRowCount(len(operations))
+        for row, (name, stats) in enumerate(operations):
+            self.fill_row(self.ui_table, row, [
+                name,
+                stats["calls"],
+                format_ms(stats["p50"]),
+                format_ms(stats["p90"]),
+                format_ms(stats["p99"]),
+                format_ms(stats["max"]),
+            ])
+
+        if self.startup_table is not None:
+            rows = startup_timeline.summary_rows(startup_timeline.current_marks())
+            self.startup_table.setRowCount(len(rows))
+            for row, (label, t_ms, delta) in enumerate(rows):
+                self.fill_row(self.startup_table, row, [label, format_ms(t_ms), format_ms(delta)])
+
+    def reset(self):
+        metrics.reset()
+        self.refresh()
@@ -6,10 +6,18 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve
 from PyQt5.QtGui import QColor, QBrush
+from services.async_service import run_async
 from services.fournisseur_service import (
     get_fournisseurs, create_fournisseur,
     delete_fournisseur, update_fournisseur
 )
+from services.local_store import local_store
+from services.metrics import timed
+from services.sorting import Sorter, TEXT
+from ui.remote_page_list import RemotePageList
+from ui.action_buttons_delegate import ActionButtonsDelegate
+from ui.optimistic import OptimisticActions
+from ui.sort_header import SortHeader
 from ui.modules.fournisseur_form_dialog import FournisseurFormDialog
 import datetime
 import math
@@ -22,7 +30,24 @@ class FournisseursWidget(QDialog):
         self.resize(1000, 600)  # Fenêtre redimensionnable
         self.current_page = 1
         self.items_per_page = 10
+        self.all_fournisseurs = []
+        self.sorter = Sorter({
+            "nom": (lambda f: f["nom"], TEXT),
+            "type": (lambda f: f["type"], TEXT),
+            "telephone": (lambda f: f.get("telephone"), TEXT),
+            "ninea": (lambda f: f.get("ninea"), TEXT),
+            "email": (lambda f: f.get("email"), TEXT),
+        })
+        self.filtered_fournisseurs = []
+        self._load_task = None
+        self._full_loaded = False
+        self.remote_fournisseurs = RemotePageList(get_fournisseurs, self.items_per_page, parent=self)
+        self.remote_fournisseurs.page_loaded.connect(self.on_fournisseurs_page_loaded)
+        self.remote_fournisseurs.load_failed.connect(self.on_fournisseurs_page_failed)
+        # Suppressions appliquées sans attendre le serveur
+        self.optimistic = OptimisticActions(self, self.load_fournisseurs)
         self.setup_ui()
+        self.show_cached_fournisseurs()
         self.load_fournisseurs()
 
     def setup_ui(self):
@@ -181,6 +206,13 @@ class FournisseursWidget(QDialog):
         self.table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         self.table.setShowGrid(False)
+        self.table.setItemDelegateForColumn(
+            5, ActionButtonsDelegate(self.get_actions, self.table, 5, spacing=5))
+
+        # Tri sur toute la collection filtrée (clic sur l'en-tête)
+        self.sort_header = SortHeader(
+            self.table, {0: "nom", 1: "type", 2: "telephone", 3: "ninea", 4: "email"}, self)
+        self.sort_header.changed.connect(self.apply_filters)
 
         # Ombre
         shadow = QGraphicsDropShadowEffect()
@@ -266,8 +298,8 @@ class FournisseursWidget(QDialog):
         status_bar.addStretch()
 
         # Bouton de rafraîchissement
-        refresh_btn = QPushButton("🔄 Rafraîchir")
-        refresh_btn.setStyleSheet("""
+        self.refresh_btn = QPushButton("🔄 Rafraîchir")
+        self.refresh_btn.setStyleSheet("""
             QPushButton {
                 background-color: #ecf0f1;
                 color: #2c3e50;
@@ -279,24 +311,99 @@ class FournisseursWidget(QDialog):
                 background-color: #d5dbdb;
             }
         """)
-        refresh_btn.setCursor(Qt.PointingHandCursor)
-        refresh_btn.clicked.connect(self.refresh_data)
-        status_bar.addWidget(refresh_btn)
+        self.refresh_btn.setCursor(Qt.PointingHandCursor)
+        self.refresh_btn.clicked.connect(self.refresh_data)
+        status_bar.addWidget(self.refresh_btn)
 
         layout.addLayout(status_bar)
 
         self.setLayout(layout)
 
+    def show_cached_fournisseurs(self):
+        # Affichage immédiat de la dernière version connue, revalidée ensuite par load_fournisseurs
+        cached = local_store.load("fournisseurs")
+        if cached:
+            self.all_fournisseurs = cached
+            self.apply_filters()
+            self.update_label.setText("Données en cache - actualisation en cours...")
+
     def load_fournisseurs(self):
-        result = get_fournisseurs()
+        # Sans filtre actif, seule la page affichée (et la suivante) est demandée au
+        # serveur ; la collection complète n'est chargée que pour filtrer localement.
+        if self._load_task is not None:
+            self._load_task.cancel()
+            self._load_task = None
+        self.set_loading(True)
+        if self.filters_active():
+            self.load_all_fournisseurs()
+        else:
+            self._full_loaded = False
+            self.remote_fournisseurs.reset()
+            self.remote_fournisseurs.ensure_page(self.current_page)
+
+    def load_all_fournisseurs(self):
+        self._load_task = run_async(get_fournisseurs, on_result=self.on_fournisseurs_loaded, owner=self)
+
+    def on_fournisseurs_page_loaded(self, page):
+        # Une page du serveur est arrivée : redessiner si c'est celle affichée
+        if self.filters_active() or page != self.current_page:
+            return
+        self.filtered_fournisseurs = self.remote_fournisseurs
+        self.set_loading(False)
+        self.update_table()
+        self.update_pagination()
+        self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
+
+    def on_fournisseurs_page_failed(self, message):
+        self.set_loading(False)
+        self.show_error("Erreur", message)
+
+    def on_fournisseurs_loaded(self, result):
+        self._load_task = None
+        self.set_loading(False)
         if result["success"]:
-            self.all_fournisseurs = result["data"]
-            self.filtered_fournisseurs = self.all_fournisseurs
-            self.apply_filters()
+            self._full_loaded = True
+            if result["data"] != self.all_fournisseurs:
+                self.patch_fournisseurs(result["data"])
+            self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
         else:
             self.show_error("Erreur", result["message"])
 
+    def patch_fournisseurs(self, fournisseurs):
+        """Remplace les données affichées en conservant la page courante."""
+        page = self.current_page
+        self.all_fournisseurs = fournisseurs
+        self.apply_filters()
+        total_pages = math.ceil(len(self.filtered_fournisseurs) / self.items_per_page) or 1
+        if min(page, total_pages) != self.current_page:
+            self.go_to_page(min(page, total_pages))
+
+    def set_loading(self, loading):
+        self.refresh_btn.setEnabled(not loading)
+        if loading:
+            self.results_label.setText("⏳ Chargement des fournisseurs...")
+        else:
+            self.results_label.setText(f"{len(self.filtered_fournisseurs)} fournisseur(s) trouvé(s)")
+
+    def filters_active(self):
+        # Filtre ou tri : traitement local sur toute la collection
+        return (self.type_filter.currentData() != "tous" or bool(self.search_input.text())
+                or self.sort_header.is_active())
+
     def apply_filters(self):
+        if not self.filters_active() and self.remote_fournisseurs.is_ready():
+            # Aucun filtre : pagination côté serveur
+            self.filtered_fournisseurs = self.remote_fournisseurs
+            self.current_page = 1
+            self.update_table()
+            self.update_pagination()
+            self.results_label.setText(f"{len(self.filtered_fournisseurs)} fournisseur(s) trouvé(s)")
+            return
+        if self.filters_active() and not self._full_loaded and self._load_task is None:
+            # Le filtrage local porte sur toute la collection
+            self.set_loading(True)
+            self.load_all_fournisseurs()
+
         type_filter = self.type_filter.currentData()
         search_text = self.search_input.text().lower()
 
@@ -320,6 +427,8 @@ class FournisseursWidget(QDialog):
 
             self.filtered_fournisseurs.append(fournisseur)
 
+        self.filtered_fournisseurs = self.sorter.sort(self.filtered_fournisseurs, self.sort_header.order)
+
         self.current_page = 1  # Reset to first page when filters change
         self.update_table()
         self.update_pagination()
@@ -327,10 +436,12 @@ class FournisseursWidget(QDialog):
 
     def change_items_per_page(self, text):
         self.items_per_page = int(text)
+        self.remote_fournisseurs.reset(self.items_per_page)
         self.current_page = 1  # Reset to first page when items per page changes
         self.update_table()
         self.update_pagination()
 
+    @timed("fournisseurs.update_table")
     def update_table(self):
         start_index = (self.current_page - 1) * self.items_per_page
         end_index = start_index + self.items_per_page
@@ -363,9 +474,10 @@ class FournisseursWidget(QDialog):
             email_item = QTableWidgetItem(f.get("email", "N/A"))
             self.table.setItem(i, 4, email_item)
 
-            # Actions
-            action_widget = self.create_action_buttons(f)
-            self.table.setCellWidget(i, 5, action_widget)
+            # Actions (boutons dessinés par le délégué)
+            action_item = QTableWidgetItem()
+            action_item.setData(Qt.UserRole, f)
+            self.table.setItem(i, 5, action_item)
 
             # Alternance des couleurs de ligne
             if i % 2 == 0:
@@ -459,55 +571,15 @@ class FournisseursWidget(QDialog):
         if self.current_page < total_pages:
             self.go_to_page(self.current_page + 1)
 
-    def create_action_buttons(self, fournisseur):
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(5)
-
-        # Modifier
-        edit_btn = QPushButton("✏️ Modifier")
-        edit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                padding: 5px 10px;
-                border-radius: 3px;
-                font-size: 12px;
-                min-width: 80px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
-        edit_btn.setCursor(Qt.PointingHandCursor)
-        edit_btn.setToolTip("Modifier ce fournisseur")
-        edit_btn.clicked.connect(lambda: self.open_edit_form(fournisseur))
-        layout.addWidget(edit_btn)
-
-        # Supprimer
-        delete_btn = QPushButton("🗑 Supprimer")
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                padding: 5px 10px;
-                border-radius: 3px;
-                font-size: 12px;
-                min-width: 80px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-        """)
-        delete_btn.setCursor(Qt.PointingHandCursor)
-        delete_btn.setToolTip("Supprimer ce fournisseur")
-        delete_btn.clicked.connect(lambda: self.delete_fournisseur(fournisseur))
-        layout.addWidget(delete_btn)
-
-        return widget
+    def get_actions(self, fournisseur):
+        """
+        Boutons de la colonne « Actions » (dessinés par ActionButtonsDelegate) :
+        (liste de (libellé, couleur, callback, infobulle), texte si aucune action).
+        """
+        return [
+            ("✏️ Modifier", "#3498db", lambda: self.open_edit_form(fournisseur), "Modifier ce fournisseur"),
+            ("🗑 Supprimer", "#e74c3c", lambda: self.delete_fournisseur(fournisseur), "Supprimer ce fournisseur"),
+        ], ""
 
     def open_add_form(self):
         dialog = FournisseurFormDialog(self)
@@ -539,16 +611,24 @@ class FournisseursWidget(QDialog):
             QMessageBox.Yes | QMessageBox.No
         )
         if confirm == QMessageBox.Yes:
-            result = delete_fournisseur(fournisseur["id"])
-            if result["success"]:
-                self.load_fournisseurs()
-                self.show_success("Succès", "Le fournisseur a été supprimé avec succès!")
-            else:
-                self.show_error("Erreur", result["message"])
+            # Retiré immédiatement, rétabli par rechargement si le serveur refuse
+            self.optimistic.run(delete_fournisseur, fournisseur["id"], done_message="Fournisseur supprimé.",
+                                apply=lambda: self.remove_fournisseur(fournisseur), rollback=self.load_fournisseurs)
+
+    def remove_fournisseur(self, fournisseur):
+        """Retire un fournisseur de toutes les données affichées."""
+        self.remote_fournisseurs.replace(fournisseur, None)
+        fournisseurs = [f for f in self.all_fournisseurs if f is not fournisseur]
+        if self.filtered_fournisseurs is not self.remote_fournisseurs:
+            self.patch_fournisseurs(fournisseurs)
+            return
+        self.all_fournisseurs = fournisseurs
+        self.update_table()
+        self.update_pagination()
+        self.results_label.setText(f"{len(self.filtered_fournisseurs)} fournisseur(s) trouvé(s)")
 
     def refresh_data(self):
         self.load_fournisseurs()
-        self.update_label.setText(f"Dernière mise à jour: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
 
         # Animation de rafraîchissement
         anim = QPropertyAnimation(self.table, b"windowOpacity")
@@ -0,0 +1,53 @@
+from PyQt5.QtCore import QObject, QTimer
+
+from services.async_service import run_async
+from ui.toast import show_toast
+
+
+RECONCILE_MS = 1500  # Pause après la dernière réponse avant de recharger depuis le serveur
+
+
+class OptimisticActions(QObject):
+    """
+    Actions appliquées à l'écran avant la réponse du serveur (validation,
+    suppression...) :
+    - apply() modifie immédiatement les données affichées ;
+    - fn(*args) est exécuté en arrière-plan (services.async_service.run_async) ;
+    - si le serveur refuse, rollback() rétablit l'état précédent et un toast
+      d'erreur s'affiche ;
+    - reconcile() recharge les données (diff minimal) RECONCILE_MS après la
+      dernière réponse : une série d'actions rapprochées ne provoque qu'un
+      seul rechargement.
+    """
+
+    def __init__(self, widget, reconcile):
+        super().__init__(widget)
+        self.widget = widget
+        self.reconcile = reconcile
+        self.pending = 0
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(RECONCILE_MS)
+        self.timer.timeout.connect(self.on_timeout)
+
+    def run(self, fn, *args, apply, rollback, done_message=None):
+        self.timer.stop()
+        apply()
+        self.pending += 1
+        return run_async(fn, *args, owner=self.widget,
+                         on_result=lambda result: self.on_result(result, rollback, done_message))
+
+    def on_result(self, result, rollback, done_message):
+        self.pending -= 1
+        if result["success"]:
+            if done_message:
+                show_toast(self.widget, done_message, "success", duration=2000)
+        else:
+            rollback()
+            show_toast(self.widget, f"❌ {result.get('message') or 'Action refusée par le serveur.'}", "error")
+        self.timer.start()
+
+    def on_timeout(self):
+        if self.pending:
+            return  # La dernière réponse relancera le minuteur
+        self.reconcile()
@@ -0,0 +1,277 @@
+# ui/remote_page_list.py
+"""
+Séquence paresseuse d'une collection paginée côté serveur, affichée par les
+écrans de liste : seules la page affichée et la suivante (préchargement) sont
+téléchargées (services.pagination.fetch_page), en arrière-plan.
+"""
+import math
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from services.async_service import run_async
+from services.search_index import default_key
+
+
+class RemotePageList(QObject):
+    """
+    Vue paresseuse d'une collection paginée côté serveur.
+
+    Elle se comporte comme une liste (len(), découpage) : len() renvoie le
+    nombre total d'éléments annoncé par l'API, et un découpage ne renvoie que
+    les éléments déjà reçus. Les pages manquantes (et la suivante, en
+    préchargement) sont demandées en arrière-plan ; `page_loaded` est émis à
+    leur arrivée pour que l'écran se redessine.
+
+    fetch_page(page, page_size) doit renvoyer le dict de services.pagination.fetch_page ;
+    forget_page(page, page_size), facultatif, libère le cache HTTP d'une page
+    retirée par evict().
+
+    Si l'API n'est pas paginée, la collection complète reçue avec la première
+    page est conservée : les pages suivantes en sont découpées localement,
+    sans nouvel appel réseau, jusqu'au prochain refresh() ou reset().
+    """
+    page_loaded = pyqtSignal(int)
+    load_failed = pyqtSignal(str)
+
+    def __init__(self, fetch_page, page_size=10, parent=None, forget_page=None):
+        super().__init__(parent)
+        self.fetch_page = fetch_page
+        self.forget_page = forget_page
+        self.page_size = page_size
+        self.count = None
+        self.replaced = None  # Lignes remplacées par la dernière page reçue (refresh), sinon None
+        self._pages = {}
+        self._pending = {}
+        self._all = None      # Collection complète d'une API non paginée
+
+    def __len__(self):
+        return self.count or 0
+
+    def __bool__(self):
+        return bool(self.count)
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            if index < 0:
+                index += len(self)
+            row = self._pages.get(index // self.page_size + 1, [])
+            offset = index % self.page_size
+            if offset >= len(row):
+                raise IndexError(index)
+            return row[offset]
+
+        if self.count is None:
+            # Total encore inconnu : demander la page visée
+            self.ensure_page((index.start or 0) // self.page_size + 1)
+            return []
+        start, stop, _ = index.indices(len(self))
+        if stop <= start:
+            return []
+        first_page = start // self.page_size + 1
+        last_page = (stop - 1) // self.page_size + 1
+        rows = []
+        for page in range(first_page, last_page + 1):
+            self.ensure_page(page)
+            page_start = (page - 1) * self.page_size
+            for offset, row in enumerate(self._pages.get(page, [])):
+                if start <= page_start + offset < stop:
+                    rows.append(row)
+        self.ensure_page(last_page + 1)  # Préchargement de la page suivante
+        return rows
+
+    def __iter__(self):
+        # Seuls les éléments déjà reçus sont parcourus
+        for page in sorted(self._pages):
+            yield from self._pages[page]
+
+    def get(self, index):
+        """
+        Élément `index` s'il est déjà reçu, sinon None ; sa page est alors
+        demandée (page jamais reçue ou retirée par evict()).
+        """
+        page = self.page_of(index)
+        rows = self._pages.get(page)
+        if rows is None:
+            self.ensure_page(page)
+            return None
+        offset = index % self.page_size
+        return rows[offset] if offset < len(rows) else None
+
+    def rows_of(self, page):
+        """Lignes reçues de la page `page`, ou None."""
+        return self._pages.get(page)
+
+    def page_of(self, index):
+        return index // self.page_size + 1
+
+    def is_ready(self):
+        return self.count is not None
+
+    def is_loaded(self, page):
+        return page in self._pages
+
+    def total_pages(self):
+        return math.ceil(len(self) / self.page_size) or 1
+
+    def ensure_page(self, page):
+        """Demande la page si elle n'est ni reçue ni déjà en cours de chargement."""
+        if page < 1 or page in self._pages or page in self._pending:
+            return
+        if self.count is not None and page > self.total_pages():
+            return
+        self._request(page)
+
+    def _request(self, page):
+        if self._all is not None:
+            # Découpage local ; page_loaded reste émis après coup, comme pour une page reçue
+            self._pages[page] = self._slice(page)
+            QTimer.singleShot(0, lambda: self.page_loaded.emit(page))
+            return
+        self._pending[page] = run_async(
+            self.fetch_page, page, self.page_size,
+            on_result=lambda result, p=page: self._on_page(p, result), owner=self)
+
+    def _on_page(self, page, result):
+        self._pending.pop(page, None)
+        if result["success"]:
+            self.replaced = self._pages.get(page)
+            self._pages[page] = result["data"]
+            self._all = result.get("all")
+            self.count = result["count"]
+            self.page_loaded.emit(page)
+            self.replaced = None
+        else:
+            self.load_failed.emit(result["message"])
+
+    def _slice(self, page):
+        start = (page - 1) * self.page_size
+        return self._all[start:start + self.page_size]
+
+    def index_of(self, element):
+        """Position de `element` (identité) parmi les éléments reçus, sinon None."""
+        for page, rows in self._pages.items():
+            for offset, row in enumerate(rows):
+                if row is element:
+                    return (page - 1) * self.page_size + offset
+        return None
+
+    def index_of_key(self, key):
+        """Position de l'élément d'identifiant `key` parmi les éléments reçus, sinon None."""
+        for page, rows in self._pages.items():
+            for offset, row in enumerate(rows):
+                if default_key(row) == key:
+                    return (page - 1) * self.page_size + offset
+        return None
+
+    def replace(self, old, new):
+        """
+        Modification locale (action en attente de réponse du serveur) : remplace
+        `old` par `new` dans les pages reçues, ou le retire si `new` est None.
+        Après un retrait, les pages reçues suivantes se décalent d'un élément ;
+        la dernière reste incomplète jusqu'au prochain rechargement (refresh).
+        Renvoie l'ancienne position de `old`, ou None s'il n'a pas été reçu.
+        """
+        if self._all is not None:
+            index = next((i for i, row in enumerate(self._all) if row is old), None)
+            if index is not None:
+                rows = list(self._all)  # Liste partagée avec le cache HTTP
+                if new is not None:
+                    rows[index] = new
+                else:
+                    del rows[index]
+                    self.count -= 1
+                self._set_all(rows)
+            return index
+        index = self.index_of(old)
+        if index is None:
+            return None
+        page, offset = self.page_of(index), index % self.page_size
+        rows = list(self._pages[page])  # Les listes reçues sont partagées avec le cache HTTP
+        if new is not None:
+            rows[offset] = new
+            self._pages[page] = rows
+            return index
+        del rows[offset]
+        while page + 1 in self._pages:
+            following = self._pages[page + 1]
+            self._pages[page] = rows + following[:1]
+            page, rows = page + 1, following[1:]
+        self._pages[page] = rows
+        self.count -= 1
+        return index
+
+    def insert(self, index, element):
+        """
+        Inverse de replace(element, None) (retrait annulé) : rétablit `element`
+        à la position `index`. Les pages reçues suivantes se décalent d'un
+        élément ; celui qui déborde vers une page non reçue est oublié (il
+        reviendra avec elle). Renvoie False si l'élément est déjà présent
+        (pages rechargées entre-temps).
+        """
+        if self.count is None or self.index_of_key(default_key(element)) is not None:
+            return False
+        if self._all is not None:
+            if any(default_key(row) == default_key(element) for row in self._all):
+                return False
+            rows = list(self._all)
+            rows.insert(index, element)
+            self._set_all(rows)
+            self.count += 1
+            return True
+        page, offset = self.page_of(index), index % self.page_size
+        rows = self._pages.get(page)
+        if rows is not None:
+            rows = rows[:offset] + [element] + rows[offset:]  # Listes partagées avec le cache HTTP
+            while len(rows) > self.page_size:
+                self._pages[page] = rows[:self.page_size]
+                overflow = rows[self.page_size:]
+                page += 1
+                if page not in self._pages:
+                    rows = None
+                    break
+                rows = overflow + self._pages[page]
+            if rows is not None:
+                self._pages[page] = rows
+        self.count += 1
+        return True
+
+    def _set_all(self, rows):
+        # Collection d'une API non paginée modifiée localement : pages reçues redécoupées
+        self._all = rows
+        self._pages = {page: self._slice(page) for page in self._pages}
+
+    def refresh(self, pages=None):
+        """
+        Redemande les pages `pages` (par défaut toutes celles reçues) après une
+        modification : leurs lignes actuelles restent affichées jusqu'à
+        l'arrivée des nouvelles (`page_loaded`), les autres pages sont oubliées.
+        """
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
+        self._all = None
+        pages = set(self._pages if pages is None else pages)
+        self._pages = {page: rows for page, rows in self._pages.items() if page in pages}
+        for page in sorted(pages):
+            self._request(page)
+
+    def evict(self, first_page, last_page):
+        """Libère les pages reçues hors de [first_page, last_page] (mémoire bornée)."""
+        for page in [p for p in self._pages if p < first_page or p > last_page]:
+            del self._pages[page]
+            if self.forget_page is not None:
+                self.forget_page(page, self.page_size)
+
+    def reset(self, page_size=None):
+        """
+        Oublie les pages reçues (rechargement, changement de taille de page).
+        Le total précédent est conservé jusqu'à la prochaine réponse pour
+        que la pagination affichée reste stable.
+        """
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
+        self._pages.clear()
+        self._all = None
+        if page_size is not None:
+            self.page_size = page_size
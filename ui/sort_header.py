@@ -0,0 +1,62 @@
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt, QObject, pyqtSignal
+
+
+class SortHeader(QObject):
+    """
+    Tri par clic sur l'en-tête d'un tableau (services.sorting).
+
+    - clic : trie sur la colonne (croissant, puis décroissant, puis sans tri) ;
+    - Maj+clic : ajoute la colonne comme critère secondaire (ou inverse son sens).
+
+    L'ordre courant est dans `order` (suite de (nom, décroissant)) ; les
+    colonnes triées sont repérées par ▲/▼ dans l'en-tête, numérotées s'il y
+    a plusieurs critères. `changed` est émis à chaque modification.
+    """
+    changed = pyqtSignal()
+
+    def __init__(self, table, columns, parent=None):
+        super().__init__(parent)
+        self.table = table
+        self.columns = columns  # numéro de colonne -> nom de la colonne du Sorter
+        self.labels = {column: table.model().headerData(column, Qt.Horizontal) for column in columns}
+        self.order = []
+        header = table.horizontalHeader()
+        header.setSectionsClickable(True)
+        header.sectionClicked.connect(self.on_section_clicked)
+        for column in columns:
+            table.model().setHeaderData(column, Qt.Horizontal, "Cliquer pour trier, Maj+clic pour un tri secondaire",
+                                        Qt.ToolTipRole)
+
+    def is_active(self):
+        return bool(self.order)
+
+    def on_section_clicked(self, column):
+        name = self.columns.get(column)
+        if name is None:
+            return
+        names = [n for n, _ in self.order]
+        if QApplication.keyboardModifiers() & Qt.ShiftModifier:
+            if name in names:
+                rank = names.index(name)
+                self.order[rank] = (name, not self.order[rank][1])
+            else:
+                self.order.append((name, False))
+        elif names == [name]:
+            # Croissant -> décroissant -> sans tri
+            self.order = [(name, True)] if not self.order[0][1] else []
+        else:
+            self.order = [(name, False)]
+        self.update_labels()
+        self.changed.emit()
+
+    def update_labels(self):
+        ranks = {name: (rank, descending) for rank, (name, descending) in enumerate(self.order, 1)}
+        for column, name in self.columns.items():
+            label = self.labels[column]
+            if name in ranks:
+                rank, descending = ranks[name]
+                label += " ▼" if descending else " ▲"
+                if len(self.order) > 1:
+                    label += str(rank)
+            self.table.model().setHeaderData(column, Qt.Horizontal, label, Qt.DisplayRole)
@@ -0,0 +1,55 @@
+from PyQt5.QtWidgets import QLabel
+from PyQt5.QtCore import Qt, QTimer
+
+
+DURATION_MS = 4000
+MAX_LENGTH = 200  # Les messages d'erreur du serveur peuvent être longs
+MARGIN = 20
+
+COLORS = {
+    "info": "#34495e",
+    "success": "#27ae60",
+    "error": "#e74c3c",
+}
+
+
+class Toast(QLabel):
+    """
+    Message bref affiché en bas de la fenêtre, sans bloquer la saisie
+    (contrairement à une QMessageBox), puis fermé après `duration` ms.
+    Les toasts simultanés s'empilent vers le haut.
+    """
+
+    def __init__(self, parent, message, kind="info", duration=DURATION_MS):
+        super().__init__(parent.window())
+        if len(message) > MAX_LENGTH:
+            message = message[:MAX_LENGTH - 1] + "…"
+        self.setText(message)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.setWordWrap(True)
+        self.setMaximumWidth(480)
+        self.setStyleSheet("""
+            QLabel {
+                background-color: %s;
+                color: white;
+                padding: 10px 16px;
+                border-radius: 6px;
+                font-size: 13px;
+            }
+        """ % COLORS.get(kind, COLORS["info"]))
+        self.adjustSize()
+        QTimer.singleShot(duration, self.close)
+
+    def place(self):
+        window = self.parentWidget()
+        others = [toast for toast in window.findChildren(Toast) if toast is not self and toast.isVisible()]
+        bottom = min([toast.y() for toast in others] + [window.height()]) - MARGIN // 2
+        self.move((window.width() - self.width()) // 2, max(0, bottom - self.height() - MARGIN // 2))
+
+
+def show_toast(parent, message, kind="info", duration=DURATION_MS):
+    toast = Toast(parent, message, kind, duration)
+    toast.place()
+    toast.show()
+    toast.raise_()
+    return toast
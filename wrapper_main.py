@@ -1,13 +1,17 @@
+from services import startup_timeline  # En premier : origine des temps du démarrage (si activé)
 import os
 import sys
 import subprocess
 from PyQt5.QtWidgets import QApplication
 from main import MainApp
+from services.backend_readiness import backend
+from ui.boot_splash import BootSplash
 
 
 def start_backend():
     """
     Démarre le serveur Django avec l'environnement virtuel correct.
+    Retourne le processus lancé (None en cas d'échec).
     """
     try:
         base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -22,16 +26,30 @@ def start_backend():
         if not os.path.isfile(venv_python):
             raise FileNotFoundError(f"Le Python de l'environnement virtuel est introuvable à : {venv_python}")
 
-        subprocess.Popen([venv_python, manage_py, 'runserver'], cwd=backend_path)
+        process = subprocess.Popen([venv_python, manage_py, 'runserver'], cwd=backend_path)
         print("[OK] Serveur Django lancé.")
+        return process
     except Exception as e:
         print(f"[ERREUR] Impossible de démarrer le serveur Django : {e}")
+        return None
 
 
 if __name__ == '__main__':
-    start_backend()
+    backend_process = start_backend()
 
     app = QApplication(sys.argv)
+    startup_timeline.mark("qapplication_created")
+    splash = BootSplash()
+    splash.show()
+
+    if backend_process is not None:
+        # Le serveur démarre pendant la construction de l'interface ; la fenêtre
+        # s'affiche dès qu'il répond (au plus tard après quelques secondes)
+        splash.show_status("Démarrage du serveur...")
+        backend.start(backend_process)
+    else:
+        backend.launch_failed("Le serveur Django n'a pas pu être lancé.")
+    splash.show_status("Chargement de l'interface...")
     window = MainApp()
-    window.show()
+    splash.finish_when_ready(window)
     sys.exit(app.exec_())